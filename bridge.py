@@ -15,7 +15,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 # ruff: noqa: E402
-from simple_agent.application.llm import LLM, LLMResponse, TokenUsage
+from simple_agent.application.llm import LLM, LLMResponse, TokenUsage, ToolSchema
 from simple_agent.infrastructure.textual.textual_app import TextualApp
 from simple_agent.infrastructure.textual.widgets.agent_tabs import AgentTabs
 from simple_agent.infrastructure.textual.widgets.agent_workspace import AgentWorkspace
@@ -42,7 +42,9 @@ class FileControlledLLM(LLM):
     def model(self) -> str:
         return self._model_name
 
-    async def call_async(self, messages: list[dict]) -> LLMResponse:
+    async def call_async(
+        self, messages: list[dict], tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
         # Write the prompt/context to a file for the controller
         prompt_content = "# LLM Prompt\n\n"
         for msg in messages:
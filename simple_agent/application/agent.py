@@ -1,12 +1,15 @@
 import asyncio
+import time
 from dataclasses import replace
 from typing import Protocol
 
 from simple_agent.logging_config import get_logger
 
 from .agent_id import AgentId
+from .agent_task_manager import AgentTaskManager
 from .agent_type import AgentType
 from .brain import Brain
+from .context_optimizer import ContextOptimizer
 from .event_bus import EventBus
 from .events import (
     AgentChangedEvent,
@@ -19,6 +22,7 @@ from .events import (
     SessionClearedEvent,
     SessionEndedEvent,
     SessionInterruptedEvent,
+    StatsRequestedEvent,
     UserPromptedEvent,
     UserPromptRequestedEvent,
 )
@@ -30,10 +34,12 @@ from .slash_commands import (
     ClearCommand,
     ModelCommand,
     SlashCommandVisitor,
+    StatsCommand,
 )
 from .tool_library import MessageAndParsedTools
 from .tool_results import SingleToolResult, ToolResult, ToolResultStatus
 from .tools_executor import ToolsExecutor
+from .tracing import tracer
 
 logger = get_logger(__name__)
 
@@ -54,6 +60,8 @@ class Agent(SlashCommandVisitor):
         agent_type: AgentType | None = None,
         available_agents: list[str] | None = None,
         brain_factory: BrainFactory | None = None,
+        context_optimizer: ContextOptimizer | None = None,
+        agent_task_manager: AgentTaskManager | None = None,
     ):
         self.agent_id = agent_id
         self.brain = brain
@@ -64,6 +72,8 @@ class Agent(SlashCommandVisitor):
         self.tools_executor = ToolsExecutor(brain.tools, event_bus, agent_id)
         self.context: Messages = context
         self.brain_factory = brain_factory
+        self.context_optimizer = context_optimizer or ContextOptimizer()
+        self.agent_task_manager = agent_task_manager
         self.slash_command_registry = SlashCommandRegistry(
             available_models=llm_provider.get_available_models(),
             available_agents=available_agents,
@@ -113,21 +123,67 @@ class Agent(SlashCommandVisitor):
             self.event_bus.publish(AgentFinishedEvent(self.agent_id))
             self.event_bus.publish(SessionEndedEvent(self.agent_id))
 
+    async def run_task(self) -> ToolResult:
+        """Work on the stacked task until the tool loop ends, without asking for more input."""
+        self.event_bus.publish(
+            AgentStartedEvent(
+                self.agent_id,
+                self.brain.name,
+                self.brain.llm.model,
+                self.agent_type,
+            )
+        )
+        try:
+            prompt = await self.user_prompts()
+            if not prompt:
+                return SingleToolResult()
+            result = await self.run_tool_loop()
+            if result.do_continue():
+                return self._unfinished_task_result()
+            return result
+        finally:
+            self.event_bus.publish(AgentFinishedEvent(self.agent_id))
+            self.event_bus.publish(SessionEndedEvent(self.agent_id))
+
+    def _unfinished_task_result(self) -> ToolResult:
+        """The agent stopped calling tools before it called complete-task."""
+        last_message = next(
+            (
+                message["content"]
+                for message in reversed(self.context.to_list())
+                if message.get("role") == "assistant"
+            ),
+            "",
+        )
+        return SingleToolResult(
+            f"ended without completing the task, last message:\n{last_message}"
+            if last_message
+            else "ended without completing the task",
+            status=ToolResultStatus.FAILURE,
+            completes=True,
+        )
+
     async def user_prompts(self):
         if not self.user_input.has_stacked_messages():
             self.event_bus.publish(UserPromptRequestedEvent(self.agent_id))
-        prompt = await self.user_input.read_async()
+        prompt = await self._read_prompt()
 
         while prompt and self._is_slash_command(prompt):
             await self._handle_slash_command(prompt)
             self.event_bus.publish(UserPromptRequestedEvent(self.agent_id))
-            prompt = await self.user_input.read_async()
+            prompt = await self._read_prompt()
 
         if prompt:
             self.context.user_says(prompt)
             self.event_bus.publish(UserPromptedEvent(self.agent_id, prompt))
         return prompt
 
+    async def _read_prompt(self):
+        if self.agent_task_manager is None or self.user_input.has_stacked_messages():
+            return await self.user_input.read_async()
+        async with self.agent_task_manager.waiting(self.agent_id):
+            return await self.user_input.read_async()
+
     def _is_slash_command(self, prompt: str) -> bool:
         """Check if the prompt is a registered slash command."""
         if not prompt.startswith("/"):
@@ -159,6 +215,9 @@ class Agent(SlashCommandVisitor):
         except Exception as e:
             self.event_bus.publish(ErrorEvent(self.agent_id, str(e)))
 
+    async def show_stats(self, command: StatsCommand) -> None:
+        self.event_bus.publish(StatsRequestedEvent(self.agent_id))
+
     async def visit_agent_command(self, command: AgentCommand) -> None:
         if self.brain_factory is None:
             self.event_bus.publish(
@@ -204,7 +263,17 @@ class Agent(SlashCommandVisitor):
             )
 
     async def llm_responds(self) -> MessageAndParsedTools:
-        response, parsed = await self.brain.respond(self.context.to_list())
+        with tracer.span("Agent.llm_responds", agent_id=self.agent_id):
+            return await self._llm_responds()
+
+    async def _llm_responds(self) -> MessageAndParsedTools:
+        started = time.monotonic()
+        response, parsed = await self.brain.respond(
+            self.context_optimizer.optimize(self.context.to_list())
+        )
+        latency = time.monotonic() - started
+        if self.agent_task_manager:
+            self.agent_task_manager.record_llm_time(self.agent_id, latency)
         answer = response.content
         self.context.assistant_says(answer)
         self.event_bus.publish(
@@ -213,6 +282,8 @@ class Agent(SlashCommandVisitor):
                 answer,
                 model=response.model,
                 token_usage_display=response.token_usage_display(),
+                usage=response.usage,
+                latency_seconds=latency,
             )
         )
         return parsed
@@ -1,3 +1,5 @@
+import asyncio
+
 from simple_agent.application.agent import Agent
 from simple_agent.application.agent_definition import AgentDefinition
 from simple_agent.application.agent_id import AgentId, AgentIdSuffixer
@@ -13,7 +15,7 @@ from simple_agent.application.input import Input
 from simple_agent.application.llm import LLMProvider, Messages
 from simple_agent.application.project_tree import ProjectTree
 from simple_agent.application.subagent_spawner import SubagentSpawner
-from simple_agent.application.tool_documentation import generate_tools_documentation
+from simple_agent.application.tool_documentation import ToolsDocumentationCache
 from simple_agent.application.tool_library_factory import (
     ToolContext,
     ToolLibraryFactory,
@@ -43,6 +45,7 @@ class AgentFactory:
         self._project_tree = project_tree
         self._event_store = event_store
         self._agent_task_manager = agent_task_manager
+        self._tools_documentation = ToolsDocumentationCache()
 
     @property
     def event_bus(self) -> EventBus:
@@ -55,7 +58,13 @@ class AgentFactory:
         return inp
 
     def create_spawner(self, parent_agent_id: AgentId) -> SubagentSpawner:
-        async def spawn(agent_type, task_description, is_async=False):
+        async def spawn(
+            agent_type,
+            task_description,
+            is_async=False,
+            until_complete=False,
+            timeout=None,
+        ):
             definition = self._agent_library.read_agent_definition(agent_type)
             agent_id = parent_agent_id.create_subagent_id(
                 definition.agent_name(), self._agent_suffixer
@@ -69,8 +78,14 @@ class AgentFactory:
             if is_async:
                 self._agent_task_manager.start_task(agent_id, subagent.start())
                 return SingleToolResult("Subagent started")
-            else:
-                return await subagent.start()
+
+            run = subagent.run_task() if until_complete else subagent.start()
+            if timeout is not None:
+                # Awaited only once the task manager granted a slot.
+                run = asyncio.wait_for(run, timeout)
+            task = self._agent_task_manager.start_task(agent_id, run)
+            async with self._agent_task_manager.waiting(parent_agent_id):
+                return await task
 
         return spawn
 
@@ -104,6 +119,7 @@ class AgentFactory:
             agent_type=agent_type,
             available_agents=self._agent_library.list_agent_types(),
             brain_factory=self,
+            agent_task_manager=self._agent_task_manager,
         )
 
     def build_brain(self, agent_id: AgentId, agent_type: AgentType) -> Brain:
@@ -116,7 +132,7 @@ class AgentFactory:
         tools = self._tool_library_factory.create(
             tool_context, spawner, AgentTypes(self._agent_library.list_agent_types())
         )
-        tools_documentation = generate_tools_documentation(
+        tools_documentation = self._tools_documentation.render(
             tools.tools, tools.tool_syntax
         )
         system_prompt = definition.prompt().render(
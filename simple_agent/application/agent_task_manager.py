@@ -1,22 +1,190 @@
 import asyncio
+import itertools
 import logging
-from collections.abc import Coroutine
+import time
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
 
 from simple_agent.application.agent_id import AgentId
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_RUNNING = 8
+DEFAULT_MAX_RUNNING_PER_PARENT = 4
+
+
+class AgentTaskState(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    WAITING = "waiting"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+@dataclass
+class AgentTaskInfo:
+    agent_id: AgentId
+    state: AgentTaskState
+    queued_seconds: float
+    running_seconds: float
+    llm_seconds: float
+
+
+class _ScheduledTask:
+    def __init__(self, agent_id: AgentId, sequence: int):
+        self.agent_id = agent_id
+        self.parent = agent_id.parent()
+        self.priority = (agent_id.depth(), sequence)
+        self.state = AgentTaskState.QUEUED
+        self.ready = asyncio.Event()
+        self.created_at = time.monotonic()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.llm_seconds = 0.0
+        self.waiters = 0
+
+    def info(self, now: float) -> AgentTaskInfo:
+        started_at = self.started_at or self.finished_at or now
+        running_until = self.finished_at or now
+        return AgentTaskInfo(
+            agent_id=self.agent_id,
+            state=self.state,
+            queued_seconds=started_at - self.created_at,
+            running_seconds=running_until - started_at if self.started_at else 0.0,
+            llm_seconds=self.llm_seconds,
+        )
+
 
 class AgentTaskManager:
-    def __init__(self):
+    """Runs agent coroutines under a global and a per-parent concurrency limit.
+
+    Tasks over the limit wait in a queue ordered by agent depth, so the root
+    agent and shallow subagents are started before deeper ones. A task gives
+    its slot back while it waits for user input or for its subagents, and
+    queues for it again when it resumes. Finished tasks stay in the snapshot so
+    their timings remain visible.
+    """
+
+    def __init__(
+        self,
+        max_running: int = DEFAULT_MAX_RUNNING,
+        max_running_per_parent: int = DEFAULT_MAX_RUNNING_PER_PARENT,
+    ):
+        self._max_running = max_running
+        self._max_running_per_parent = max_running_per_parent
         self._tasks: dict[AgentId, asyncio.Task] = {}
+        self._scheduled: dict[AgentId, _ScheduledTask] = {}
+        self._sequence = itertools.count()
 
     def start_task(self, agent_id: AgentId, coroutine: Coroutine) -> asyncio.Task:
-        task = asyncio.create_task(coroutine)
+        scheduled = _ScheduledTask(agent_id, next(self._sequence))
+        self._scheduled[agent_id] = scheduled
+        task = asyncio.create_task(self._run(scheduled, coroutine))
         self._tasks[agent_id] = task
-        task.add_done_callback(lambda _: self._tasks.pop(agent_id, None))
+        task.add_done_callback(lambda _: self._on_done(scheduled, coroutine))
+        self._grant_slots()
         return task
 
+    async def _run(self, scheduled: _ScheduledTask, coroutine: Coroutine):
+        await scheduled.ready.wait()
+        try:
+            result = await coroutine
+        except asyncio.CancelledError:
+            self._finish(scheduled, AgentTaskState.CANCELLED)
+            raise
+        except BaseException:
+            self._finish(scheduled, AgentTaskState.FAILED)
+            raise
+        self._finish(scheduled, AgentTaskState.FINISHED)
+        return result
+
+    def _on_done(self, scheduled: _ScheduledTask, coroutine: Coroutine) -> None:
+        self._tasks.pop(scheduled.agent_id, None)
+        if scheduled.state in (
+            AgentTaskState.QUEUED,
+            AgentTaskState.RUNNING,
+            AgentTaskState.WAITING,
+        ):
+            coroutine.close()
+            self._finish(scheduled, AgentTaskState.CANCELLED)
+
+    def _finish(self, scheduled: _ScheduledTask, state: AgentTaskState) -> None:
+        scheduled.state = state
+        scheduled.finished_at = time.monotonic()
+        self._grant_slots()
+
+    def _grant_slots(self) -> None:
+        running = [
+            s for s in self._scheduled.values() if s.state == AgentTaskState.RUNNING
+        ]
+        queued = sorted(
+            (s for s in self._scheduled.values() if s.state == AgentTaskState.QUEUED),
+            key=lambda s: s.priority,
+        )
+        for scheduled in queued:
+            if len(running) >= self._max_running:
+                break
+            siblings = sum(1 for s in running if s.parent == scheduled.parent)
+            if siblings >= self._max_running_per_parent:
+                continue
+            scheduled.state = AgentTaskState.RUNNING
+            scheduled.started_at = scheduled.started_at or time.monotonic()
+            scheduled.ready.set()
+            running.append(scheduled)
+
+    @asynccontextmanager
+    async def waiting(self, agent_id: AgentId) -> AsyncIterator[None]:
+        """Frees the slot of the agent's task for as long as the agent is blocked."""
+        scheduled = self._scheduled.get(agent_id)
+        if scheduled is None or scheduled.state not in (
+            AgentTaskState.RUNNING,
+            AgentTaskState.WAITING,
+        ):
+            yield
+            return
+
+        scheduled.waiters += 1
+        if scheduled.waiters == 1:
+            scheduled.state = AgentTaskState.WAITING
+            scheduled.ready.clear()
+            self._grant_slots()
+        try:
+            yield
+        finally:
+            scheduled.waiters -= 1
+            if scheduled.waiters == 0:
+                await self._resume(scheduled)
+
+    async def _resume(self, scheduled: _ScheduledTask) -> None:
+        scheduled.state = AgentTaskState.QUEUED
+        self._grant_slots()
+        try:
+            await scheduled.ready.wait()
+        except asyncio.CancelledError:
+            # An interrupted agent carries on, so it takes its slot right away.
+            scheduled.state = AgentTaskState.RUNNING
+            raise
+
+    def record_llm_time(self, agent_id: AgentId, seconds: float) -> None:
+        """Attribute LLM time to the agent's task, or to the task it runs inside of."""
+        current: AgentId | None = agent_id
+        while current is not None:
+            scheduled = self._scheduled.get(current)
+            if scheduled is not None:
+                scheduled.llm_seconds += seconds
+                return
+            current = current.parent()
+
+    def snapshot(self) -> list[AgentTaskInfo]:
+        now = time.monotonic()
+        return [
+            scheduled.info(now)
+            for scheduled in sorted(self._scheduled.values(), key=lambda s: s.priority)
+        ]
+
     def cancel_task(self, agent_id: AgentId) -> bool:
         task = self._tasks.get(agent_id)
         if task:
@@ -28,3 +196,17 @@ class AgentTaskManager:
     def cancel_all_tasks(self):
         for task in list(self._tasks.values()):
             task.cancel()
+
+
+def format_task_report(infos: list[AgentTaskInfo]) -> str:
+    if not infos:
+        return "No agent tasks"
+    lines = []
+    for info in infos:
+        lines.append(
+            f"{info.agent_id}: {info.state.value}"
+            f" (queued {info.queued_seconds:.1f}s,"
+            f" running {info.running_seconds:.1f}s,"
+            f" llm {info.llm_seconds:.1f}s)"
+        )
+    return "\n".join(lines)
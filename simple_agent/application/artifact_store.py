@@ -0,0 +1,22 @@
+from typing import Protocol
+
+
+class ArtifactStore(Protocol):
+    def save(self, content: str) -> str:
+        """Store content and return the id it can be loaded with."""
+        ...
+
+    def load(self, artifact_id: str) -> str | None: ...
+
+
+class InMemoryArtifactStore:
+    def __init__(self):
+        self._artifacts: dict[str, str] = {}
+
+    def save(self, content: str) -> str:
+        artifact_id = f"artifact-{len(self._artifacts) + 1}"
+        self._artifacts[artifact_id] = content
+        return artifact_id
+
+    def load(self, artifact_id: str) -> str | None:
+        return self._artifacts.get(artifact_id)
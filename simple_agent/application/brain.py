@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from simple_agent.application.llm import LLM, ChatMessages, LLMResponse
 from simple_agent.application.tool_library import MessageAndParsedTools, ToolLibrary
+from simple_agent.application.tracing import tracer
 
 
 @dataclass
@@ -14,5 +15,24 @@ class Brain:
     async def respond(
         self, messages: ChatMessages
     ) -> tuple[LLMResponse, MessageAndParsedTools]:
-        response = await self.llm.call_async(messages)
-        return response, self.tools.parse_message_and_tools(response.content)
+        with tracer.span("Brain.respond", brain=self.name, messages=len(messages)):
+            return await self._respond(messages)
+
+    async def _respond(
+        self, messages: ChatMessages
+    ) -> tuple[LLMResponse, MessageAndParsedTools]:
+        schemas = self.tools.tool_syntax.tool_schemas(self.tools.tools)
+        if not schemas:
+            response = await self.llm.call_async(messages)
+            return response, self.tools.parse_message_and_tools(response.content)
+
+        response = await self.llm.call_async(messages, tools=schemas)
+        if not response.tool_uses:
+            return response, self.tools.parse_message_and_tools(response.content)
+        parsed = self.tools.resolve_tool_uses(response.content, response.tool_uses)
+        # The conversation records the calls in text form, like any other syntax.
+        calls = [
+            self.tools.tool_syntax.format_call(tool.raw_call) for tool in parsed.tools
+        ]
+        content = "\n".join(part for part in [response.content, *calls] if part)
+        return replace(response, content=content), parsed
@@ -0,0 +1,71 @@
+import re
+
+from .llm import ChatMessages
+
+RESULT_PREFIX = "Result of 🛠️ "
+DEDUPLICATED_TOOLS = frozenset({"cat", "ls", "read-many"})
+SUPERSEDED_STUB = "[Unchanged output omitted; see the later result of the same call.]"
+
+_SECTION_SEPARATOR = re.compile(r"\n\n(?=" + re.escape(RESULT_PREFIX) + ")")
+
+
+class ContextOptimizer:
+    """Rewrites the messages sent to the LLM without touching the stored context.
+
+    A tool result is replaced by a stub when the same read-only call produced
+    identical output later in the conversation. The rewrite only depends on the
+    messages themselves, so a context rebuilt from events is optimized exactly
+    like the live one.
+    """
+
+    def optimize(self, messages: ChatMessages) -> ChatMessages:
+        parsed = [self._sections(message) for message in messages]
+        seen: set[tuple[str, str]] = set()
+        changed: set[int] = set()
+
+        for index in reversed(range(len(parsed))):
+            sections = parsed[index]
+            if sections is None:
+                continue
+            for position in reversed(range(len(sections))):
+                header, output = sections[position]
+                if not self._is_deduplicated(header) or len(output) <= len(
+                    SUPERSEDED_STUB
+                ):
+                    continue
+                if (header, output) in seen:
+                    sections[position] = (header, SUPERSEDED_STUB)
+                    changed.add(index)
+                else:
+                    seen.add((header, output))
+
+        if not changed:
+            return messages
+
+        result = []
+        for index, message in enumerate(messages):
+            sections = parsed[index]
+            if index in changed and sections is not None:
+                content = "\n\n".join(
+                    f"{RESULT_PREFIX}{header}\n{output}" for header, output in sections
+                )
+                message = {**message, "content": content}
+            result.append(message)
+        return result
+
+    @staticmethod
+    def _sections(message) -> list[tuple[str, str]] | None:
+        content = message.get("content", "")
+        if message.get("role") != "user" or not content.startswith(RESULT_PREFIX):
+            return None
+
+        sections = []
+        for section in _SECTION_SEPARATOR.split(content):
+            header, _, output = section[len(RESULT_PREFIX) :].partition("\n")
+            sections.append((header, output))
+        return sections
+
+    @staticmethod
+    def _is_deduplicated(header: str) -> bool:
+        name = header.split(" ", 1)[0]
+        return name in DEDUPLICATED_TOOLS
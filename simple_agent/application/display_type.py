@@ -3,3 +3,5 @@ from enum import Enum
 
 class DisplayType(str, Enum):
     TEXTUAL = "textual"
+    TEXT = "text"
+    JSON = "json"
@@ -1,6 +1,14 @@
+import re
+from dataclasses import dataclass
 from typing import Any
 
-from simple_agent.application.tool_library import RawToolCall, Tool, ToolArgument
+from simple_agent.application.llm import ToolSchema, ToolUse
+from simple_agent.application.tool_library import (
+    RawToolCall,
+    Tool,
+    ToolArgument,
+    argument_text,
+)
 from simple_agent.application.tool_syntax import ParsedMessage, ToolSyntax
 
 
@@ -37,6 +45,27 @@ class EmojiBracketToolSyntax(ToolSyntax):
 
         return "\n".join(lines)
 
+    def tool_schemas(self, tools: list[Tool]) -> list[ToolSchema]:
+        return []
+
+    def to_raw_call(self, tool_use: ToolUse, tool: Tool) -> RawToolCall:
+        """Maps the inputs of a structured call to header arguments and body."""
+        body = tool.arguments.body
+        return RawToolCall(
+            name=tool_use.name,
+            arguments=tool.format_arguments(tool_use.input),
+            body=argument_text(tool_use.input.get(body.name)) if body else "",
+        )
+
+    def format_call(self, raw_call: RawToolCall) -> str:
+        """The emoji-bracket form of a call, as kept in the conversation."""
+        header = raw_call.name
+        if raw_call.arguments:
+            header += " " + raw_call.arguments
+        if raw_call.body:
+            return f"🛠️[{header}]\n{raw_call.body}\n🛠️[/end]"
+        return f"🛠️[{header} /]"
+
     def build_syntax(self, tool):
         syntax_parts = []
         if tool.arguments:
@@ -135,77 +164,60 @@ class EmojiBracketToolSyntax(ToolSyntax):
         return "\n".join(output_lines)
 
     def parse(self, text: str) -> ParsedMessage:
-        # Markers can appear with or without variation selector (U+FE0F)
-        # 🛠️ is U+1F6E0 U+FE0F
-        # 🛠 is U+1F6E0
-        START_MARKERS = ["🛠️[", "🛠["]
-        END_MARKERS = ["🛠️[/end]", "🛠[/end]"]
-        SELF_CLOSING_SUFFIX = " /]"
-
-        def find_any(markers, start_pos) -> tuple[int, str]:
-            earliest = -1
-            found_marker = ""
-            for marker in markers:
-                idx = text.find(marker, start_pos)
-                if idx != -1 and (earliest == -1 or idx < earliest):
-                    earliest = idx
-                    found_marker = marker
-            return earliest, found_marker
+        """Splits a response into its message and tool calls in one pass.
+
+        All markers are located by a single regex scan up front, and the walk
+        over them only moves forward, so long responses with many calls or
+        large bodies are parsed in linear time.
+        """
+        markers = [_Marker.from_match(match) for match in _MARKER.finditer(text)]
+        last_end = max(
+            (index for index, marker in enumerate(markers) if marker.is_end),
+            default=-1,
+        )
 
         tool_calls = []
         message = ""
         first_tool_found = False
+        # Header starts only increase, so the first "]" after the previous one
+        # is still the answer until the search start passes it.
+        close_idx: int | None = None
 
+        index = 0
         pos = 0
         while pos < len(text):
-            # Look for start marker
-            start_idx, current_start_marker = find_any(START_MARKERS, pos)
-
-            if start_idx == -1:
+            while index < len(markers) and markers[index].start < pos:
+                index += 1
+            if index == len(markers):
                 # No more tool calls found
                 if not first_tool_found:
                     message = text
                 break
 
+            marker = markers[index]
             # Capture message before first tool call
             if not first_tool_found:
-                message = text[:start_idx].rstrip()
+                message = text[: marker.start].rstrip()
                 first_tool_found = True
 
-            # Find closing bracket for header - check for self-closing first
-            header_start = start_idx + len(current_start_marker)
-            self_closing_idx = text.find(SELF_CLOSING_SUFFIX, header_start)
-            regular_close_idx = text.find("]", header_start)
-
-            # Determine if this is self-closing
-            is_self_closing = False
-            header_end = -1
-
-            if self_closing_idx != -1:
-                # Check if this self-closing comes before a regular close
-                if (
-                    regular_close_idx == -1
-                    or self_closing_idx + len(SELF_CLOSING_SUFFIX) - 1
-                    == regular_close_idx
-                ):
-                    is_self_closing = True
-                    header_end = self_closing_idx
-
-            if not is_self_closing:
-                if regular_close_idx == -1:
-                    # Missing closing bracket - treat as plain text and continue
-                    if not tool_calls:
-                        message = text
-                        break
-                    pos = start_idx + len(current_start_marker)
-                    continue
-                header_end = regular_close_idx
-
-            # Extract header
-            header = text[header_start:header_end]
+            header_start = marker.header_start
+            if close_idx is None or (close_idx != -1 and close_idx < header_start):
+                close_idx = text.find("]", header_start)
+            if close_idx == -1:
+                # Missing closing bracket - treat as plain text and continue
+                if not tool_calls:
+                    message = text
+                    break
+                pos = header_start
+                continue
+
+            is_self_closing = close_idx - 2 >= header_start and text.startswith(
+                " /", close_idx - 2
+            )
+            header_end = close_idx - 2 if is_self_closing else close_idx
 
             # Parse header: first token is tool name, rest is arguments
-            header_parts = header.split(None, 1)
+            header_parts = text[header_start:header_end].split(None, 1)
             if not header_parts:
                 # Empty header - treat as plain text
                 pos = header_end + 1
@@ -215,76 +227,70 @@ class EmojiBracketToolSyntax(ToolSyntax):
             arguments = header_parts[1] if len(header_parts) > 1 else ""
 
             if is_self_closing:
-                # Self-closing tool call - no body
                 tool_calls.append(
                     RawToolCall(name=tool_name, arguments=arguments, body="")
                 )
-                pos = header_end + len(SELF_CLOSING_SUFFIX)
-            else:
-                # Tool call with body - must find matching end marker
-                after_header = header_end + 1
-                search_pos = after_header
-                depth = 1
-                end_idx = -1
-                current_end_marker = ""
-                last_end_idx = -1
-                last_end_marker = ""
-
-                while True:
-                    next_start_idx, next_start_marker = find_any(
-                        START_MARKERS, search_pos
-                    )
-                    next_end_idx, next_end_marker = find_any(END_MARKERS, search_pos)
-
-                    if next_end_idx == -1:
-                        if last_end_idx != -1:
-                            end_idx = last_end_idx
-                            current_end_marker = last_end_marker
-                        else:
-                            # Missing end marker - best effort: treat rest as body
-                            body = text[after_header:].rstrip()
-                            if body.startswith("\n"):
-                                body = body[1:]
-                            elif body.startswith("\r\n"):
-                                body = body[2:]
-                            tool_calls.append(
-                                RawToolCall(
-                                    name=tool_name, arguments=arguments, body=body
-                                )
-                            )
-                            pos = len(text)
-                        break
-
-                    if next_start_idx != -1 and next_start_idx < next_end_idx:
-                        # Nested start marker - track depth but allow fallback if unclosed
-                        depth += 1
-                        search_pos = next_start_idx + len(next_start_marker)
-                        continue
-
-                    depth -= 1
-                    last_end_idx = next_end_idx
-                    last_end_marker = next_end_marker
-                    if depth == 0:
-                        end_idx = next_end_idx
-                        current_end_marker = next_end_marker
-                        break
-
-                    search_pos = next_end_idx + len(next_end_marker)
-
-                if end_idx != -1:
-                    # Extract body (skip leading newline if present)
-                    body_text = text[after_header:end_idx]
-                    if body_text.startswith("\n"):
-                        body_text = body_text[1:]
-                    elif body_text.startswith("\r\n"):
-                        body_text = body_text[2:]
-                    body = body_text.rstrip("\n\r")
-
-                    tool_calls.append(
-                        RawToolCall(name=tool_name, arguments=arguments, body=body)
-                    )
-
-                    # Continue after end marker
-                    pos = end_idx + len(current_end_marker)
+                pos = close_idx + 1
+                continue
+
+            after_header = header_end + 1
+            while index < len(markers) and markers[index].start < after_header:
+                index += 1
+
+            if index > last_end:
+                # Missing end marker - best effort: treat rest as body
+                body = _strip_leading_newline(text[after_header:].rstrip())
+                tool_calls.append(
+                    RawToolCall(name=tool_name, arguments=arguments, body=body)
+                )
+                break
+
+            # Nested start markers must be closed first. When end markers run
+            # out before that, the last one closes the call.
+            end_marker = markers[last_end]
+            depth = 1
+            while index <= last_end:
+                candidate = markers[index]
+                index += 1
+                depth += -1 if candidate.is_end else 1
+                if depth == 0:
+                    end_marker = candidate
+                    break
+
+            body_text = _strip_leading_newline(text[after_header : end_marker.start])
+            tool_calls.append(
+                RawToolCall(
+                    name=tool_name, arguments=arguments, body=body_text.rstrip("\n\r")
+                )
+            )
+            pos = end_marker.end
 
         return ParsedMessage(message=message, tool_calls=tool_calls)
+
+
+# Markers can appear with or without variation selector (U+FE0F): 🛠️ is
+# U+1F6E0 U+FE0F, 🛠 is U+1F6E0. An end marker is a start marker followed by
+# "/end]".
+_MARKER = re.compile("\U0001f6e0\ufe0f?\\[(/end\\])?")
+
+
+@dataclass(frozen=True)
+class _Marker:
+    start: int
+    header_start: int
+    end: int
+    is_end: bool
+
+    @classmethod
+    def from_match(cls, match: re.Match) -> "_Marker":
+        is_end = match.group(1) is not None
+        header_start = match.start(1) if is_end else match.end()
+        return cls(match.start(), header_start, match.end(), is_end)
+
+
+def _strip_leading_newline(text: str) -> str:
+    if text.startswith("\n"):
+        return text[1:]
+    if text.startswith("\r\n"):
+        return text[2:]
+    return text
@@ -2,6 +2,7 @@ from collections.abc import Callable
 from typing import Any, Protocol, TypeVar
 
 from .events import AgentEvent
+from .tracing import tracer
 
 T = TypeVar("T", bound=AgentEvent)
 
@@ -25,4 +26,14 @@ class SimpleEventBus(EventBus):
         event_type = type(event)
         if event_type in self._handlers:
             for handler in self._handlers[event_type]:
-                handler(event)
+                if tracer.enabled:
+                    with tracer.span(
+                        _handler_name(handler), "event", event=event_type.__name__
+                    ):
+                        handler(event)
+                else:
+                    handler(event)
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", type(handler).__name__)
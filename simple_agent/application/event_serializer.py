@@ -87,6 +87,7 @@ class EventSerializer:
                 if event.result
                 else "",
                 "status": status,
+                "completes": not event.result.do_continue() if event.result else False,
             }
         elif isinstance(event, ToolCancelledEvent):
             return {
@@ -191,6 +192,7 @@ class EventSerializer:
                     display_body=data.get("display_body", ""),
                     display_language=data.get("display_language", ""),
                     status=status,
+                    completes=bool(data.get("completes", False)),
                 ),
             )
         elif event_type == "ToolCancelledEvent":
@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from simple_agent.application.agent_id import AgentId
 from simple_agent.application.agent_type import AgentType
+from simple_agent.application.llm import TokenUsage
 from simple_agent.application.tool_results import ToolResult
 
 
@@ -76,6 +77,9 @@ class AssistantRespondedEvent(AgentEvent):
     response: str = ""
     model: str = ""
     token_usage_display: str = ""
+    # Measurements of the call, not part of what was said.
+    usage: TokenUsage | None = field(default=None, compare=False)
+    latency_seconds: float = field(default=0.0, compare=False)
 
 
 @dataclass
@@ -109,3 +113,24 @@ class AgentChangedEvent(AgentEvent):
     event_name: ClassVar[str] = "agent_changed"
     old_name: str = ""
     new_name: str = ""
+
+
+@dataclass
+class StatsRequestedEvent(AgentEvent):
+    event_name: ClassVar[str] = "stats_requested"
+
+
+@dataclass
+class StatsShownEvent(AgentEvent):
+    event_name: ClassVar[str] = "stats_shown"
+    report: str = ""
+
+
+@dataclass
+class HistoryReplayStartedEvent(AgentEvent):
+    event_name: ClassVar[str] = "history_replay_started"
+
+
+@dataclass
+class HistoryReplayFinishedEvent(AgentEvent):
+    event_name: ClassVar[str] = "history_replay_finished"
@@ -5,27 +5,53 @@ from simple_agent.application.events import (
     AgentEvent,
     AssistantRespondedEvent,
     SessionClearedEvent,
+    ToolCalledEvent,
+    ToolCancelledEvent,
     ToolResultEvent,
     UserPromptedEvent,
 )
 from simple_agent.application.llm import Messages
+from simple_agent.application.tool_library import ParsedTool
 
 
 def events_to_messages(events: Sequence[AgentEvent], agent_id: AgentId) -> Messages:
     messages = Messages()
+    tool_calls: dict[str, ParsedTool] = {}
+    tool_results: list[str] = []
+
+    def flush_tool_results():
+        if tool_results:
+            messages.user_says("\n\n".join(tool_results))
+            tool_results.clear()
 
     for event in events:
         if event.agent_id != agent_id:
             continue
 
+        if isinstance(event, ToolCalledEvent):
+            tool_calls[event.call_id] = event.tool
+            continue
+        if isinstance(event, ToolResultEvent):
+            tool = tool_calls.pop(event.call_id, None)
+            if event.result is None:
+                continue
+            if tool is None:
+                flush_tool_results()
+                messages.user_says(event.result.message)
+            elif event.result.do_continue():
+                tool_results.append(f"Result of {tool}\n{event.result.message}")
+            continue
+        if isinstance(event, ToolCancelledEvent):
+            tool_results.clear()
+            continue
+
+        flush_tool_results()
         if isinstance(event, UserPromptedEvent):
             messages.user_says(event.input_text)
         elif isinstance(event, AssistantRespondedEvent):
             messages.assistant_says(event.response)
-        elif isinstance(event, ToolResultEvent):
-            if event.result is not None:
-                messages.user_says(event.result.message)
         elif isinstance(event, SessionClearedEvent):
             messages.clear()
 
+    flush_tool_results()
     return messages
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from collections import deque
 
@@ -11,6 +10,8 @@ from simple_agent.application.events import (
     AgentStartedEvent,
     AssistantRespondedEvent,
     AssistantSaidEvent,
+    HistoryReplayFinishedEvent,
+    HistoryReplayStartedEvent,
     ToolCalledEvent,
     ToolResultEvent,
 )
@@ -32,9 +33,14 @@ class HistoryReplayer:
         if not events:
             return []
 
-        # Wait for UI to mount
-        await asyncio.sleep(0.1)
+        # Displays collect everything between the markers and render it at once.
+        self._event_bus.publish(HistoryReplayStartedEvent(starting_agent_id))
+        try:
+            return self._replay(events, starting_agent_id)
+        finally:
+            self._event_bus.publish(HistoryReplayFinishedEvent(starting_agent_id))
 
+    def _replay(self, events, starting_agent_id: AgentId) -> list[AgentStartedEvent]:
         finished_agents = set()
         start_events = {}
 
@@ -48,7 +54,7 @@ class HistoryReplayer:
                 if isinstance(e, ToolResultEvent):
                     results_by_agent.setdefault(e.agent_id, deque()).append(e)
 
-        for i, event in enumerate(events):
+        for event in events:
             if isinstance(event, AgentFinishedEvent):
                 finished_agents.add(event.agent_id)
             elif isinstance(event, AgentStartedEvent):
@@ -65,10 +71,6 @@ class HistoryReplayer:
                     event, results_by_agent.get(event.agent_id, [])
                 )
 
-            # Cooperative multitasking
-            if i % 10 == 0:
-                await asyncio.sleep(0.01)
-
         return [
             e
             for aid, e in start_events.items()
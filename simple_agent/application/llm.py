@@ -1,6 +1,6 @@
 from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import dataclass, field
+from typing import Any, Protocol
 
 from .model_info import ModelInfo
 
@@ -14,6 +14,25 @@ class TokenUsage:
     output_tokens: int = 0
     total_tokens: int = 0
     input_token_limit: int | None = None
+    # The part of input_tokens read from the provider's prompt cache.
+    cached_input_tokens: int = 0
+    # The part of input_tokens written to the provider's prompt cache.
+    cache_write_input_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class ToolSchema:
+    """A tool as declared to providers with native tool calling."""
+
+    name: str
+    description: str
+    parameters: dict[str, Any]
+
+
+@dataclass
+class ToolUse:
+    name: str
+    input: dict[str, Any]
 
 
 @dataclass
@@ -21,6 +40,7 @@ class LLMResponse:
     content: str
     model: str = ""
     usage: TokenUsage | None = None
+    tool_uses: list[ToolUse] = field(default_factory=list)
 
     def __post_init__(self):
         if self.usage is None:
@@ -41,7 +61,9 @@ class LLM(Protocol):
     @property
     def model(self) -> str: ...
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse: ...
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse: ...
 
 
 class LLMProvider(Protocol):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from .llm import LLM, ChatMessages, LLMResponse, TokenUsage
+from .llm import LLM, ChatMessages, LLMResponse, TokenUsage, ToolSchema
 
 
 class StubLLM:
@@ -19,7 +19,9 @@ class StubLLM:
     def model(self) -> str:
         return self._model_name
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
         content = self._fallback
         if self._index < len(self._responses):
             content = self._responses[self._index]
@@ -59,7 +61,7 @@ class StubLLMProvider:
             def model(self) -> str:
                 return "dummy"
 
-            async def call_async(self, messages):
+            async def call_async(self, messages, tools=None):
                 return LLMResponse(content="", model="dummy", usage=TokenUsage())
 
         return cls.for_testing(DummyLLM())
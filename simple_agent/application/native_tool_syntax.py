@@ -0,0 +1,65 @@
+from typing import Any
+
+from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
+from simple_agent.application.llm import ToolSchema
+from simple_agent.application.tool_library import Tool, ToolArgument
+
+JSON_TYPES = {
+    "integer": "integer",
+    "number": "number",
+    "boolean": "boolean",
+    "bool": "boolean",
+}
+
+
+class NativeToolSyntax(EmojiBracketToolSyntax):
+    """Declares tools to the provider as schemas instead of prose in the prompt.
+
+    Tool calls arrive as structured tool uses and need no parsing. The
+    conversation keeps them in emoji-bracket form, which parse() still
+    understands, so sessions and history replay stay unchanged.
+    """
+
+    def __init__(self):
+        self._schemas: dict[tuple, ToolSchema] = {}
+
+    def tool_schemas(self, tools: list[Tool]) -> list[ToolSchema]:
+        return [self._schema(tool) for tool in tools]
+
+    def _schema(self, tool: Tool) -> ToolSchema:
+        template_vars = tool.get_template_variables()
+        key = (type(tool), tool.name, tuple(sorted(template_vars.items())))
+        schema = self._schemas.get(key)
+        if schema is None:
+            schema = ToolSchema(
+                name=tool.name,
+                description=_substitute(tool.description, template_vars),
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        arg.name: _property(arg, template_vars)
+                        for arg in tool.arguments.all
+                    },
+                    "required": [
+                        arg.name for arg in tool.arguments.all if arg.required
+                    ],
+                },
+            )
+            self._schemas[key] = schema
+        return schema
+
+    def render_documentation(self, tool: Tool) -> str:
+        return f"Tool: {tool.name}\nDescription: {tool.description}"
+
+
+def _property(arg: ToolArgument, template_vars: dict[str, str]) -> dict[str, Any]:
+    return {
+        "type": JSON_TYPES.get(arg.type, "string"),
+        "description": _substitute(arg.description, template_vars),
+    }
+
+
+def _substitute(text: str, template_vars: dict[str, str]) -> str:
+    for key, value in template_vars.items():
+        text = text.replace(f"{{{{{key}}}}}", value)
+    return text
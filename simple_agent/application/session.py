@@ -28,6 +28,8 @@ class SessionArgs:
     stub_llm: bool = False
     non_interactive: bool = False
     agent: str | None = None
+    profile_startup: bool = False
+    trace: bool = False
 
 
 class Session:
@@ -105,4 +107,4 @@ class Session:
             )
             asyncio.create_task(subagent.start())
 
-        await agent.start()
+        return await agent.start()
@@ -0,0 +1,259 @@
+import bisect
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .event_bus import EventBus
+from .events import (
+    AssistantRespondedEvent,
+    StatsRequestedEvent,
+    StatsShownEvent,
+    ToolCalledEvent,
+    ToolCancelledEvent,
+    ToolResultEvent,
+)
+from .llm import TokenUsage
+
+TOKENS_PER_PRICE_UNIT = 1_000_000
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens.
+
+    Cache reads and cache writes default to the input price, providers that
+    bill cache writes at a premium need cache_write configured to be exact.
+    """
+
+    input: float
+    output: float
+    cached_input: float | None = None
+    cache_write: float | None = None
+
+    def cost(self, usage: TokenUsage) -> float:
+        cached = min(usage.cached_input_tokens, usage.input_tokens)
+        written = min(usage.cache_write_input_tokens, usage.input_tokens - cached)
+        cached_price = self.input if self.cached_input is None else self.cached_input
+        write_price = self.input if self.cache_write is None else self.cache_write
+        return (
+            (usage.input_tokens - cached - written) * self.input
+            + cached * cached_price
+            + written * write_price
+            + usage.output_tokens * self.output
+        ) / TOKENS_PER_PRICE_UNIT
+
+
+class Histogram:
+    def __init__(self):
+        self._values: list[float] = []
+
+    def observe(self, value: float) -> None:
+        bisect.insort(self._values, value)
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    def percentile(self, percent: float) -> float:
+        if not self._values:
+            return 0.0
+        index = round(percent / 100 * (len(self._values) - 1))
+        return self._values[index]
+
+    def snapshot(self) -> dict[str, float]:
+        if not self._values:
+            return {"count": 0}
+        return {
+            "count": len(self._values),
+            "mean": sum(self._values) / len(self._values),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self._values[-1],
+        }
+
+
+@dataclass
+class ModelMetrics:
+    calls: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float | None = 0.0
+    latency: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "llm_calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "cache_write_input_tokens": self.cache_write_input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": self.cost,
+            "latency_seconds": self.latency.snapshot(),
+        }
+
+
+@dataclass
+class ToolMetrics:
+    failures: int = 0
+    duration: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.duration.count,
+            "failures": self.failures,
+            "duration_seconds": self.duration.snapshot(),
+        }
+
+
+@dataclass
+class AgentMetrics:
+    models: dict[str, ModelMetrics] = field(default_factory=dict)
+    tools: dict[str, ToolMetrics] = field(default_factory=dict)
+
+
+class SessionMetrics:
+    """Counts tokens, cost, LLM latency and tool durations per agent from session events.
+
+    Costs are only known for models with a configured price, the total cost
+    is None as soon as one model without a price was used.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        prices: dict[str, ModelPrice] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._event_bus = event_bus
+        self._prices = prices or {}
+        self._clock = clock
+        self._agents: dict[str, AgentMetrics] = {}
+        self._running_tools: dict[str, tuple[str, float]] = {}
+
+    def subscribe(self) -> None:
+        self._event_bus.subscribe(AssistantRespondedEvent, self._on_response)
+        self._event_bus.subscribe(ToolCalledEvent, self._on_tool_called)
+        self._event_bus.subscribe(ToolResultEvent, self._on_tool_result)
+        self._event_bus.subscribe(ToolCancelledEvent, self._on_tool_cancelled)
+        self._event_bus.subscribe(StatsRequestedEvent, self._on_stats_requested)
+
+    def _agent(self, event) -> AgentMetrics:
+        return self._agents.setdefault(str(event.agent_id), AgentMetrics())
+
+    def _on_response(self, event: AssistantRespondedEvent) -> None:
+        model = self._agent(event).models.setdefault(
+            event.model or "unknown", ModelMetrics()
+        )
+        model.calls += 1
+        model.latency.observe(event.latency_seconds)
+        usage = event.usage or TokenUsage()
+        model.input_tokens += usage.input_tokens
+        model.cached_input_tokens += usage.cached_input_tokens
+        model.cache_write_input_tokens += usage.cache_write_input_tokens
+        model.output_tokens += usage.output_tokens
+        price = self._prices.get(event.model)
+        if price is None or model.cost is None:
+            model.cost = None
+        else:
+            model.cost += price.cost(usage)
+
+    def _on_tool_called(self, event: ToolCalledEvent) -> None:
+        name = getattr(event.tool, "name", None) or "unknown"
+        self._running_tools[event.call_id] = (name, self._clock())
+
+    def _on_tool_result(self, event: ToolResultEvent) -> None:
+        running = self._running_tools.pop(event.call_id, None)
+        if running is None:
+            return
+        name, started = running
+        tool = self._agent(event).tools.setdefault(name, ToolMetrics())
+        tool.duration.observe(self._clock() - started)
+        if event.result is not None and not event.result.success:
+            tool.failures += 1
+
+    def _on_tool_cancelled(self, event: ToolCancelledEvent) -> None:
+        self._running_tools.pop(event.call_id, None)
+
+    def _on_stats_requested(self, event: StatsRequestedEvent) -> None:
+        self._event_bus.publish(StatsShownEvent(event.agent_id, self.render()))
+
+    def snapshot(self) -> dict[str, Any]:
+        models = [m for agent in self._agents.values() for m in agent.models.values()]
+        costs = [model.cost for model in models]
+        cost = None if None in costs else sum(c for c in costs if c is not None)
+        return {
+            "totals": {
+                "llm_calls": sum(model.calls for model in models),
+                "input_tokens": sum(model.input_tokens for model in models),
+                "cached_input_tokens": sum(
+                    model.cached_input_tokens for model in models
+                ),
+                "cache_write_input_tokens": sum(
+                    model.cache_write_input_tokens for model in models
+                ),
+                "output_tokens": sum(model.output_tokens for model in models),
+                "cost_usd": cost,
+                "tool_calls": sum(
+                    tool.duration.count
+                    for agent in self._agents.values()
+                    for tool in agent.tools.values()
+                ),
+            },
+            "agents": {
+                agent_id: {
+                    "models": {
+                        name: model.snapshot() for name, model in agent.models.items()
+                    },
+                    "tools": {
+                        name: tool.snapshot() for name, tool in agent.tools.items()
+                    },
+                }
+                for agent_id, agent in self._agents.items()
+            },
+        }
+
+    def render(self) -> str:
+        if not self._agents:
+            return "No LLM calls or tool calls yet."
+        lines = []
+        for agent_id, agent in self._agents.items():
+            lines.append(agent_id)
+            for name, model in agent.models.items():
+                lines.append(
+                    f"  {name}: {model.calls} calls, "
+                    f"{model.input_tokens:,} tokens in "
+                    f"({model.cached_input_tokens:,} cached), "
+                    f"{model.output_tokens:,} out, {_format_cost(model.cost)}"
+                )
+                lines.append(f"    latency {_format_durations(model.latency)}")
+            for name, tool in sorted(
+                agent.tools.items(), key=lambda item: -item[1].duration.count
+            ):
+                failed = f", {tool.failures} failed" if tool.failures else ""
+                lines.append(
+                    f"  {name}: {tool.duration.count} calls{failed}, "
+                    f"{_format_durations(tool.duration)}"
+                )
+        totals = self.snapshot()["totals"]
+        lines.append(
+            f"Total: {totals['input_tokens']:,} tokens in "
+            f"({totals['cached_input_tokens']:,} cached), "
+            f"{totals['output_tokens']:,} out, {_format_cost(totals['cost_usd'])}"
+        )
+        return "\n".join(lines)
+
+
+def _format_cost(cost: float | None) -> str:
+    return "cost unknown" if cost is None else f"${cost:.4f}"
+
+
+def _format_durations(histogram: Histogram) -> str:
+    return (
+        f"p50 {histogram.percentile(50):.2f}s, "
+        f"p90 {histogram.percentile(90):.2f}s, "
+        f"max {histogram.percentile(100):.2f}s"
+    )
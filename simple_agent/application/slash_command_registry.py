@@ -6,6 +6,7 @@ from simple_agent.application.slash_commands import (
     ClearCommand,
     ModelCommand,
     SlashCommand,
+    StatsCommand,
 )
 
 
@@ -27,6 +28,7 @@ class SlashCommandRegistry:
         self._commands: dict[str, type[SlashCommand]] = {
             "/clear": ClearCommand,
             "/model": ModelCommand,
+            "/stats": StatsCommand,
         }
         self._arg_completers: dict[str, Callable[[], list[str]]] = {
             "/model": lambda: available_models,
@@ -76,6 +78,10 @@ class SlashCommandRegistry:
             if args:
                 raise CommandParseError("/clear does not take arguments")
             return ClearCommand()
+        elif command_name == "/stats":
+            if args:
+                raise CommandParseError("/stats does not take arguments")
+            return StatsCommand()
         elif command_name == "/model":
             if len(args) != 1:
                 raise CommandParseError("Usage: /model <model-name>")
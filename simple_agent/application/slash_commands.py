@@ -62,6 +62,19 @@ class AgentCommand(SlashCommand):
         await visitor.visit_agent_command(self)
 
 
+class StatsCommand(SlashCommand):
+    @property
+    def name(self) -> str:
+        return "/stats"
+
+    @property
+    def description(self) -> str:
+        return "Show token, latency, tool and cost metrics"
+
+    async def accept(self, visitor: "SlashCommandVisitor") -> None:
+        await visitor.show_stats(self)
+
+
 class SlashCommandVisitor(ABC):
     @abstractmethod
     async def clear_conversation(self, command: ClearCommand) -> None:
@@ -74,3 +87,7 @@ class SlashCommandVisitor(ABC):
     @abstractmethod
     async def visit_agent_command(self, command: AgentCommand) -> None:
         pass
+
+    @abstractmethod
+    async def show_stats(self, command: StatsCommand) -> None:
+        pass
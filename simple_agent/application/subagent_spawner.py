@@ -7,5 +7,16 @@ from simple_agent.application.tool_results import ToolResult
 
 class SubagentSpawner(Protocol):
     def __call__(
-        self, agent_type: AgentType, task_description: str, is_async: bool = False
-    ) -> Awaitable[ToolResult]: ...
+        self,
+        agent_type: AgentType,
+        task_description: str,
+        is_async: bool = False,
+        until_complete: bool = False,
+        timeout: float | None = None,
+    ) -> Awaitable[ToolResult]:
+        """Runs a subagent for the task.
+
+        The timeout only counts from the moment the subagent gets a slot to
+        run, time spent queued behind the concurrency limits is not included.
+        """
+        ...
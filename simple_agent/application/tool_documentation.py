@@ -20,8 +20,16 @@ class _MockTool:
     async def execute(self, raw_call):
         return SingleToolResult("", status=ToolResultStatus.SUCCESS)
 
+    def format_arguments(self, values: dict[str, Any]) -> str:
+        return " ".join(
+            str(values[arg.name]) for arg in self.arguments.header if arg.name in values
+        )
+
 
 def generate_tools_documentation(tools, tool_syntax: ToolSyntax) -> str:
+    if tool_syntax.tool_schemas(tools):
+        return _generate_native_tools_documentation(tools)
+
     # Generate syntax examples
     syntax_examples = _generate_syntax_examples(tool_syntax)
 
@@ -51,6 +59,20 @@ CRITICAL RULES:
     return tools_header + "\n\n".join(tools_lines) + "\n"
 
 
+def _generate_native_tools_documentation(tools) -> str:
+    tool_names = ", ".join(tool.name for tool in tools)
+    return f"""
+In this environment you have access to a set of tools you can use to solve the provided problem.
+The tools, their descriptions and their arguments are provided through the tool calling interface.
+Call them through that interface only, never by writing tool calls as text.
+When you call a tool, you'll receive back the result.
+
+# Your Tools
+
+{tool_names}
+"""
+
+
 def _generate_syntax_examples(tool_syntax: ToolSyntax) -> str:
     """Generate 2-3 examples showing the tool call syntax."""
     examples = []
@@ -120,3 +142,32 @@ def _generate_tool_documentation(tool, syntax):
         doc_lines.extend(remaining_lines)
 
     return "\n".join(doc_lines)
+
+
+class ToolsDocumentationCache:
+    """Remembers rendered tool documentation per tool set and syntax.
+
+    Tool classes describe themselves through class attributes, so their type
+    together with the template variables fully determines the rendered text.
+    """
+
+    def __init__(self):
+        self._documentation: dict[tuple, str] = {}
+
+    def render(self, tools, tool_syntax: ToolSyntax) -> str:
+        key = (
+            type(tool_syntax),
+            tuple(
+                (type(tool), tool.name, _template_key(tool.get_template_variables()))
+                for tool in tools
+            ),
+        )
+        documentation = self._documentation.get(key)
+        if documentation is None:
+            documentation = generate_tools_documentation(tools, tool_syntax)
+            self._documentation[key] = documentation
+        return documentation
+
+
+def _template_key(template_vars: dict[str, str]) -> tuple:
+    return tuple(sorted(template_vars.items()))
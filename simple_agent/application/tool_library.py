@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 from .tool_results import ToolResult
 
 if TYPE_CHECKING:
+    from .llm import ToolUse
     from .tool_syntax import ToolSyntax
 
 
@@ -119,6 +120,19 @@ class Tool(Protocol):
 
     def get_template_variables(self) -> dict[str, str]: ...
 
+    def format_arguments(self, values: dict[str, Any]) -> str:
+        """Renders the header values of a structured call as argument text."""
+        ...
+
+
+def argument_text(value: Any) -> str:
+    """The text of a structured argument value, as written in a tool call."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
 
 class ToolLibrary(Protocol):
     tools: list[Tool]
@@ -126,4 +140,8 @@ class ToolLibrary(Protocol):
 
     def parse_message_and_tools(self, text: str) -> MessageAndParsedTools: ...
 
+    def resolve_tool_uses(
+        self, message: str, tool_uses: list["ToolUse"]
+    ) -> MessageAndParsedTools: ...
+
     async def execute_parsed_tool(self, parsed_tool: ParsedTool) -> ToolResult: ...
@@ -0,0 +1,91 @@
+from .artifact_store import ArtifactStore
+from .tool_results import ToolResult
+
+DEFAULT_MAX_OUTPUT_CHARS = 20_000
+EXCERPT_LINES = 20
+
+
+class SpilledToolResult(ToolResult):
+    def __init__(self, original: ToolResult, summary: str, max_chars: int):
+        self._original = original
+        self._summary = summary
+        self._max_chars = max_chars
+
+    @property
+    def message(self) -> str:
+        return self._summary
+
+    @property
+    def success(self) -> bool:
+        return self._original.success
+
+    @property
+    def cancelled(self) -> bool:
+        return self._original.cancelled
+
+    @property
+    def display_title(self) -> str:
+        return self._original.display_title
+
+    @property
+    def display_body(self) -> str:
+        display_body = self._original.display_body
+        if len(display_body) > self._max_chars:
+            return self._summary
+        return display_body
+
+    @property
+    def display_language(self) -> str:
+        if len(self._original.display_body) > self._max_chars:
+            return ""
+        return self._original.display_language
+
+    def __str__(self) -> str:
+        return self.message
+
+    def do_continue(self) -> bool:
+        return self._original.do_continue()
+
+
+class ToolOutputBudget:
+    """Moves tool output above the budget into an artifact, leaving a summary in its place."""
+
+    def __init__(
+        self, artifact_store: ArtifactStore, max_chars: int = DEFAULT_MAX_OUTPUT_CHARS
+    ):
+        self.artifact_store = artifact_store
+        self.max_chars = max_chars
+
+    def apply(self, result: ToolResult) -> ToolResult:
+        message = result.message
+        if len(message) <= self.max_chars or not result.do_continue():
+            return result
+
+        artifact_id = self.artifact_store.save(message)
+        return SpilledToolResult(
+            result, self._summarize(message, artifact_id), self.max_chars
+        )
+
+    def _summarize(self, message: str, artifact_id: str) -> str:
+        lines = message.splitlines()
+        excerpt_chars = self.max_chars // 4
+        head = _clip("\n".join(lines[:EXCERPT_LINES]), excerpt_chars)
+        summary = [
+            f"Output too large ({len(lines)} lines, {len(message)} characters). "
+            f"Stored as artifact {artifact_id}; use read-artifact to page, grep or slice it.",
+            f"--- first {min(EXCERPT_LINES, len(lines))} lines ---",
+            head,
+        ]
+        if len(lines) > EXCERPT_LINES:
+            tail_lines = lines[max(EXCERPT_LINES, len(lines) - EXCERPT_LINES) :]
+            summary.append(f"--- last {len(tail_lines)} lines ---")
+            summary.append(_clip("\n".join(tail_lines), excerpt_chars, keep_end=True))
+        return "\n".join(summary)
+
+
+def _clip(text: str, max_chars: int, keep_end: bool = False) -> str:
+    if len(text) <= max_chars:
+        return text
+    if keep_end:
+        return "..." + text[-max_chars:]
+    return text[:max_chars] + "..."
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Protocol
 
+from simple_agent.application.llm import ToolSchema, ToolUse
 from simple_agent.application.tool_library import RawToolCall, Tool
 
 
@@ -16,3 +17,11 @@ class ToolSyntax(Protocol):
     def _format_example(self, example: object, tool: Tool) -> str: ...
 
     def parse(self, text: str) -> ParsedMessage: ...
+
+    def tool_schemas(self, tools: list[Tool]) -> list[ToolSchema]:
+        """Schemas to send to the provider, empty when tools are called in text."""
+        ...
+
+    def to_raw_call(self, tool_use: ToolUse, tool: Tool) -> RawToolCall: ...
+
+    def format_call(self, raw_call: RawToolCall) -> str: ...
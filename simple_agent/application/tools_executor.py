@@ -5,6 +5,7 @@ from .event_bus import EventBus
 from .events import ToolCalledEvent, ToolCancelledEvent, ToolResultEvent
 from .tool_library import ParsedTool, ToolLibrary
 from .tool_results import ManyToolsResult, ToolResult
+from .tracing import tracer
 
 
 class ToolsExecutor:
@@ -31,13 +32,19 @@ class ToolsExecutor:
     async def _execute(self, tool: ParsedTool) -> ToolResult:
         self._tool_call_counter += 1
         call_id = f"{self._agent_id}::tool_call::{self._tool_call_counter}"
-        self._event_bus.publish(ToolCalledEvent(self._agent_id, call_id, tool))
-        try:
-            tool_result = await self._library.execute_parsed_tool(tool)
-            self._event_bus.publish(
-                ToolResultEvent(self._agent_id, call_id, tool_result)
-            )
-            return tool_result
-        except asyncio.CancelledError:
-            self._event_bus.publish(ToolCancelledEvent(self._agent_id, call_id))
-            raise
+        with tracer.span(
+            f"tool {tool.raw_call.name}",
+            "tool",
+            agent_id=self._agent_id,
+            call_id=call_id,
+        ):
+            self._event_bus.publish(ToolCalledEvent(self._agent_id, call_id, tool))
+            try:
+                tool_result = await self._library.execute_parsed_tool(tool)
+                self._event_bus.publish(
+                    ToolResultEvent(self._agent_id, call_id, tool_result)
+                )
+                return tool_result
+            except asyncio.CancelledError:
+                self._event_bus.publish(ToolCancelledEvent(self._agent_id, call_id))
+                raise
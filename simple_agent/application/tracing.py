@@ -0,0 +1,139 @@
+import os
+import time
+from contextvars import ContextVar
+from typing import Any
+
+# Attributes that nested spans inherit, so an HTTP call or event handler
+# shows which agent and tool call it belongs to.
+INHERITED_ARGS = ("agent_id", "call_id")
+MAIN_LANE = "main"
+
+_inherited: ContextVar[dict[str, str] | None] = ContextVar(
+    "trace_inherited", default=None
+)
+
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Span:
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._token = None
+        self._started_us = 0.0
+
+    def __enter__(self):
+        parent = _inherited.get() or {}
+        args = {key: str(value) for key, value in self._args.items()}
+        self._args = {**parent, **args}
+        inherited = {
+            key: self._args[key] for key in INHERITED_ARGS if key in self._args
+        }
+        if inherited != parent:
+            self._token = _inherited.set(inherited)
+        self._started_us = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        ended_us = _now_us()
+        if self._token is not None:
+            _inherited.reset(self._token)
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.record(
+            self._name, self._category, self._started_us, ended_us, self._args
+        )
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        self._args[key] = str(value)
+
+
+class Tracer:
+    """Records timed spans as Chrome trace events.
+
+    The document returned by stop() opens in Perfetto or chrome://tracing,
+    with one track per agent. Until start() is called span() returns a shared
+    no-op context manager.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._events: list[dict[str, Any]] = []
+        self._lanes: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def start(self) -> None:
+        self._enabled = True
+        self._events = []
+        self._lanes = {}
+
+    def span(self, name: str, category: str = "agent", **args):
+        if not self._enabled:
+            return _NO_SPAN
+        return Span(self, name, category, args)
+
+    def record(
+        self, name: str, category: str, started_us: float, ended_us: float, args: dict
+    ) -> None:
+        self._events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started_us,
+                "dur": ended_us - started_us,
+                "pid": os.getpid(),
+                "tid": self._lane(args.get("agent_id", MAIN_LANE)),
+                "args": args,
+            }
+        )
+
+    def stop(self) -> dict[str, Any] | None:
+        """Disables tracing and returns the recorded spans as a trace document."""
+        if not self._enabled:
+            return None
+        self._enabled = False
+        lanes = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": lane},
+            }
+            for lane, tid in self._lanes.items()
+        ]
+        document = {"traceEvents": lanes + self._events, "displayTimeUnit": "ms"}
+        self._events = []
+        return document
+
+    def _lane(self, name: str) -> int:
+        lane = self._lanes.get(name)
+        if lane is None:
+            lane = self._lanes[name] = len(self._lanes) + 1
+        return lane
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+tracer = Tracer()
@@ -20,34 +20,58 @@ from simple_agent.infrastructure.user_configuration import UserConfiguration
 
 
 class FileSystemAgentLibrary(AgentLibrary):
+    """Agent definitions read from a directory of *.agent.md files.
+
+    The directory listing is kept until the directory mtime changes and parsed
+    definitions until their file mtime changes, so spawning agents does not
+    scan the directory again.
+    """
+
     def __init__(self, directory: str, starting_agent_type: AgentType | None = None):
         self.directory = directory
         self.ground_rules: GroundRules = AgentsMdGroundRules()
         self._starting_agent_type = starting_agent_type
+        self._agent_types: tuple[int, list[str]] | None = None
+        self._definitions: dict[str, tuple[int, str, AgentDefinition]] = {}
 
     def list_agent_types(self) -> list[str]:
-        if not os.path.isdir(self.directory):
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except OSError:
             return []
+        if self._agent_types is not None and self._agent_types[0] == mtime_ns:
+            return list(self._agent_types[1])
 
         pattern = os.path.join(self.directory, "*.agent.md")
-        agent_types = [
+        agent_types = sorted(
             agent_type_from_filename(os.path.basename(path))
             for path in glob.glob(pattern)
-        ]
-        return sorted(agent_types)
+        )
+        self._agent_types = (mtime_ns, agent_types)
+        return list(agent_types)
 
     def read_agent_definition(self, agent_type: AgentType) -> AgentDefinition:
         filename = filename_from_agent_type(agent_type)
         path = os.path.join(self.directory, filename)
         try:
-            with open(path, encoding="utf-8") as handle:
-                content = handle.read()
-                return AgentDefinition(agent_type, content, self.ground_rules)
+            mtime_ns = os.stat(path).st_mtime_ns
         except FileNotFoundError as error:
             raise FileNotFoundError(
                 f"Agent definition '{agent_type.raw}' not found in {self.directory}"
             ) from error
 
+        # A definition keeps its rendered prompt, which embeds the ground rules.
+        ground_rules = self.ground_rules.read()
+        cached = self._definitions.get(path)
+        if cached is not None and cached[:2] == (mtime_ns, ground_rules):
+            return cached[2]
+
+        with open(path, encoding="utf-8") as handle:
+            content = handle.read()
+        definition = AgentDefinition(agent_type, content, self.ground_rules)
+        self._definitions[path] = (mtime_ns, ground_rules, definition)
+        return definition
+
     def has_any(self) -> bool:
         return bool(self.list_agent_types())
 
@@ -72,11 +96,26 @@ class BuiltinAgentLibrary:
         else:
             self.ground_rules = AgentsMdGroundRules()
         self._starting_agent_type = starting_agent_type
+        self._agent_types: list[str] | None = None
+        self._definitions: dict[AgentType, tuple[str, AgentDefinition]] = {}
 
     def list_agent_types(self) -> list[str]:
-        return self._discover_agent_types()
+        if self._agent_types is None:
+            self._agent_types = self._discover_agent_types()
+        return list(self._agent_types)
 
     def read_agent_definition(self, agent_type: AgentType) -> AgentDefinition:
+        # Packaged definitions never change, only the ground rules can.
+        ground_rules = self.ground_rules.read()
+        cached = self._definitions.get(agent_type)
+        if cached is not None and cached[0] == ground_rules:
+            return cached[1]
+
+        definition = self._read_agent_definition(agent_type)
+        self._definitions[agent_type] = (ground_rules, definition)
+        return definition
+
+    def _read_agent_definition(self, agent_type: AgentType) -> AgentDefinition:
         filename = filename_from_agent_type(agent_type)
         try:
             content = (
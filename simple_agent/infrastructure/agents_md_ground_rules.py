@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 
 from simple_agent.application.ground_rules import GroundRules
+from simple_agent.infrastructure.file_cache import file_cache
 
 
 class AgentsMdGroundRules(GroundRules):
@@ -13,7 +14,6 @@ class AgentsMdGroundRules(GroundRules):
     def read(self) -> str:
         path = os.path.join(self.base_dir, self.filename)
         try:
-            with open(path, encoding="utf-8") as handle:
-                return handle.read()
+            return file_cache.read_text(path)
         except FileNotFoundError:
             return ""
@@ -8,7 +8,15 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
-from simple_agent.application.llm import LLM, ChatMessages, LLMResponse, TokenUsage
+from simple_agent.application.llm import (
+    LLM,
+    ChatMessages,
+    LLMResponse,
+    TokenUsage,
+    ToolSchema,
+    ToolUse,
+)
+from simple_agent.application.tracing import tracer
 from simple_agent.infrastructure.logging_http_client import (
     format_request_args,
     format_response_args,
@@ -36,10 +44,14 @@ class BedrockClaudeLLM(LLM):
     def model(self) -> str:
         return self._config.model
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
-        return await self._call_async(messages)
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
+        return await self._call_async(messages, tools)
 
-    async def _call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def _call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None
+    ) -> LLMResponse:
         payload_messages = list(messages)
         system_prompt = (
             payload_messages.pop(0).get("content", "")
@@ -52,14 +64,18 @@ class BedrockClaudeLLM(LLM):
             "max_tokens": 4000,
             "messages": payload_messages,
             **({"system": system_prompt} if system_prompt else {}),
+            **({"tools": [_tool_definition(tool) for tool in tools]} if tools else {}),
         }
 
-        try:
-            response = await asyncio.to_thread(self._invoke_model, data)
-        except (BotoCoreError, ClientError) as error:
-            raise BedrockClaudeClientError(f"API request failed: {error}") from error
+        with tracer.span("Bedrock invoke_model", "http", model=self.model):
+            try:
+                response = await asyncio.to_thread(self._invoke_model, data)
+            except (BotoCoreError, ClientError) as error:
+                raise BedrockClaudeClientError(
+                    f"API request failed: {error}"
+                ) from error
 
-        response_bytes = await asyncio.to_thread(self._read_response_body, response)
+            response_bytes = await asyncio.to_thread(self._read_response_body, response)
 
         status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 200)
         headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
@@ -78,26 +94,43 @@ class BedrockClaudeLLM(LLM):
         if "content" not in response_data:
             raise BedrockClaudeClientError("API response missing 'content' field")
 
-        content_list = response_data["content"]
-        content = ""
-        if content_list:
-            first_content = content_list[0]
-            if "text" not in first_content:
+        text_parts = []
+        tool_uses = []
+        for block in response_data["content"]:
+            if block.get("type") == "tool_use":
+                tool_uses.append(ToolUse(block["name"], block.get("input") or {}))
+            elif "text" in block:
+                text_parts.append(block["text"])
+            else:
                 raise BedrockClaudeClientError(
                     "API response content missing 'text' field"
                 )
-            content = first_content["text"]
+        content = "".join(text_parts)
 
         usage_data = response_data.get("usage", {})
-        input_tokens = usage_data.get("input_tokens", 0)
+        cached_input_tokens = usage_data.get("cache_read_input_tokens", 0)
+        cache_write_input_tokens = usage_data.get("cache_creation_input_tokens", 0)
+        # Anthropic counts cached prompt tokens separately from input_tokens.
+        input_tokens = (
+            usage_data.get("input_tokens", 0)
+            + cached_input_tokens
+            + cache_write_input_tokens
+        )
         output_tokens = usage_data.get("output_tokens", 0)
         usage = TokenUsage(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_input_tokens=cache_write_input_tokens,
         )
 
-        return LLMResponse(content=content, model=self._config.model, usage=usage)
+        return LLMResponse(
+            content=content,
+            model=self._config.model,
+            usage=usage,
+            tool_uses=tool_uses,
+        )
 
     def _invoke_model(self, data: dict[str, Any]):
         body = json.dumps(data)
@@ -159,3 +192,11 @@ class BedrockClaudeLLM(LLM):
             raise BedrockClaudeClientError(
                 "Configured adapter is not 'bedrock'; cannot use Bedrock client"
             )
+
+
+def _tool_definition(tool: ToolSchema) -> dict:
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.parameters,
+    }
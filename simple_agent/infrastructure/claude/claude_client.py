@@ -2,7 +2,14 @@ import logging
 
 import httpx
 
-from simple_agent.application.llm import LLM, ChatMessages, LLMResponse, TokenUsage
+from simple_agent.application.llm import (
+    LLM,
+    ChatMessages,
+    LLMResponse,
+    TokenUsage,
+    ToolSchema,
+    ToolUse,
+)
 from simple_agent.infrastructure.logging_http_client import LoggingAsyncClient
 from simple_agent.infrastructure.model_config import ModelConfig
 
@@ -25,10 +32,14 @@ class ClaudeLLM(LLM):
     def model(self) -> str:
         return self._config.model
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
-        return await self._call_async(messages)
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
+        return await self._call_async(messages, tools)
 
-    async def _call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def _call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None
+    ) -> LLMResponse:
         base_url = self._config.base_url or "https://api.anthropic.com/v1"
         url = f"{base_url}/messages"
         api_key = self._config.api_key
@@ -49,6 +60,7 @@ class ClaudeLLM(LLM):
             "max_tokens": 4000,
             "messages": payload_messages,
             **({"system": system_prompt} if system_prompt else {}),
+            **({"tools": [_tool_definition(tool) for tool in tools]} if tools else {}),
         }
 
         timeout = self._config.request_timeout
@@ -72,27 +84,49 @@ class ClaudeLLM(LLM):
         if "content" not in response_data:
             raise ClaudeClientError("API response missing 'content' field")
 
-        content_list = response_data["content"]
-        content = ""
-        if content_list:
-            first_content = content_list[0]
-            if "text" not in first_content:
+        text_parts = []
+        tool_uses = []
+        for block in response_data["content"]:
+            if block.get("type") == "tool_use":
+                tool_uses.append(ToolUse(block["name"], block.get("input") or {}))
+            elif "text" in block:
+                text_parts.append(block["text"])
+            else:
                 raise ClaudeClientError("API response content missing 'text' field")
-            content = first_content["text"]
+        content = "".join(text_parts)
 
         usage_data = response_data.get("usage", {})
-        input_tokens = usage_data.get("input_tokens", 0)
+        cached_input_tokens = usage_data.get("cache_read_input_tokens", 0)
+        cache_write_input_tokens = usage_data.get("cache_creation_input_tokens", 0)
+        # Anthropic counts cached prompt tokens separately from input_tokens.
+        input_tokens = (
+            usage_data.get("input_tokens", 0)
+            + cached_input_tokens
+            + cache_write_input_tokens
+        )
         output_tokens = usage_data.get("output_tokens", 0)
         usage = TokenUsage(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_input_tokens=cache_write_input_tokens,
         )
 
-        return LLMResponse(content=content, model=model, usage=usage)
+        return LLMResponse(
+            content=content, model=model, usage=usage, tool_uses=tool_uses
+        )
 
     def _ensure_claude_adapter(self) -> None:
         if self._config.adapter != "claude":
             raise ClaudeClientError(
                 "Configured adapter is not 'claude'; cannot use Claude client"
             )
+
+
+def _tool_definition(tool: ToolSchema) -> dict:
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.parameters,
+    }
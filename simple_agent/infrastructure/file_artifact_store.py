@@ -0,0 +1,29 @@
+import re
+from pathlib import Path
+from uuid import uuid4
+
+from simple_agent.application.artifact_store import ArtifactStore
+
+_ARTIFACT_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class FileArtifactStore(ArtifactStore):
+    def __init__(self, session_root: Path):
+        self._artifacts_dir = session_root / "artifacts"
+
+    def save(self, content: str) -> str:
+        self._artifacts_dir.mkdir(parents=True, exist_ok=True)
+        artifact_id = uuid4().hex
+        self._path(artifact_id).write_text(content, encoding="utf-8")
+        return artifact_id
+
+    def load(self, artifact_id: str) -> str | None:
+        if not _ARTIFACT_ID.match(artifact_id):
+            return None
+        path = self._path(artifact_id)
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _path(self, artifact_id: str) -> Path:
+        return self._artifacts_dir / f"{artifact_id}.txt"
@@ -0,0 +1,100 @@
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    mtime_ns: int
+    size: int
+    content: str
+
+
+class FileCache:
+    """Process-wide LRU of decoded file contents.
+
+    An entry is only served while the file's mtime and size still match the
+    stat taken when it was read, so external edits are picked up without
+    explicit invalidation. Writers inside the process call invalidate() anyway
+    to cover edits that land within the filesystem's timestamp resolution.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def read_text(self, path: str | os.PathLike) -> str:
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.content
+            self._misses += 1
+
+        with open(key, encoding="utf-8") as f:
+            content = f.read()
+
+        with self._lock:
+            self._remove(key)
+            if len(content) <= self._max_bytes:
+                self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, content)
+                self._size += len(content)
+                self._evict()
+        return content
+
+    def invalidate(self, path: str | os.PathLike) -> None:
+        with self._lock:
+            self._remove(os.path.abspath(path))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> FileCacheStats:
+        with self._lock:
+            return FileCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= len(entry.content)
+            self._evictions += 1
+
+
+file_cache = FileCache()
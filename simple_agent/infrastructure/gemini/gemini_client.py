@@ -1,8 +1,16 @@
 import asyncio
+from typing import Any
 
 import httpx
 
-from simple_agent.application.llm import LLM, ChatMessages, LLMResponse, TokenUsage
+from simple_agent.application.llm import (
+    LLM,
+    ChatMessages,
+    LLMResponse,
+    TokenUsage,
+    ToolSchema,
+    ToolUse,
+)
 from simple_agent.infrastructure.logging_http_client import LoggingAsyncClient
 from simple_agent.infrastructure.model_config import ModelConfig
 
@@ -48,10 +56,14 @@ class GeminiLLM(LLM):
     def model(self) -> str:
         return self._config.model
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
-        return await self._call_async(messages)
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
+        return await self._call_async(messages, tools)
 
-    async def _call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def _call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None
+    ) -> LLMResponse:
         api_key = self._config.api_key
         model = self._config.model
 
@@ -65,6 +77,7 @@ class GeminiLLM(LLM):
 
         data = {
             "contents": gemini_contents,
+            **({"tools": [_tool_declarations(tools)]} if tools else {}),
         }
 
         headers = {
@@ -127,6 +140,13 @@ class GeminiLLM(LLM):
 
         # Concatenate all text parts
         text_parts = [part.get("text", "") for part in parts if "text" in part]
+        tool_uses = [
+            ToolUse(
+                part["functionCall"]["name"], part["functionCall"].get("args") or {}
+            )
+            for part in parts
+            if "functionCall" in part
+        ]
         text_content = "".join(text_parts)
 
         # Gemini usage data extraction (if available, otherwise 0)
@@ -140,9 +160,12 @@ class GeminiLLM(LLM):
             input_token_limit=input_token_limit
             if input_token_limit and input_token_limit > 0
             else None,
+            cached_input_tokens=usage_metadata.get("cachedContentTokenCount", 0),
         )
 
-        return LLMResponse(content=text_content, model=model, usage=usage)
+        return LLMResponse(
+            content=text_content, model=model, usage=usage, tool_uses=tool_uses
+        )
 
     def _convert_messages_to_gemini_format(self, messages: ChatMessages) -> list[dict]:
         """
@@ -180,3 +203,17 @@ class GeminiLLM(LLM):
             raise GeminiClientError(
                 "Configured adapter is not 'gemini'; cannot use Gemini client"
             )
+
+
+def _tool_declarations(tools: list[ToolSchema]) -> dict:
+    declarations = []
+    for tool in tools:
+        declaration: dict[str, Any] = {
+            "name": tool.name,
+            "description": tool.description,
+        }
+        # Gemini rejects object schemas without properties.
+        if tool.parameters.get("properties"):
+            declaration["parameters"] = tool.parameters
+        declarations.append(declaration)
+    return {"functionDeclarations": declarations}
@@ -0,0 +1,217 @@
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+GITIGNORE = ".gitignore"
+INFO_EXCLUDE = Path(".git") / "info" / "exclude"
+
+
+@dataclass(frozen=True)
+class _Layer:
+    """The rules of one ignore file, compiled for the paths below its directory.
+
+    Rules are joined into one alternation in reverse order, so the group that
+    matches is the last rule of the file that applies, as git requires.
+    """
+
+    base: str
+    files: re.Pattern | None
+    directories: re.Pattern | None
+    negated: tuple[bool, ...]
+
+    def match(self, relative: str, is_dir: bool) -> bool | None:
+        pattern = self.directories if is_dir else self.files
+        if pattern is None:
+            return None
+        match = pattern.fullmatch(relative)
+        if match is None or match.lastgroup is None:
+            return None
+        return not self.negated[int(match.lastgroup[1:])]
+
+
+class GitignoreMatcher:
+    """Decides which paths below a root are ignored, following gitignore rules.
+
+    Rules are read from .git/info/exclude, the root .gitignore and the
+    .gitignore of every nested directory, with deeper files taking precedence.
+    Negation, anchoring, directory-only patterns and ** are supported. Paths
+    inside an ignored directory are ignored as well, and hidden entries are
+    skipped unless ignore_hidden is False.
+
+    Verdicts for directories are cached, so checking the entries of a walk
+    costs one regex match per ignore file that applies to them.
+    """
+
+    def __init__(self, root: Path, ignore_hidden: bool = True):
+        self._root = root
+        self._ignore_hidden = ignore_hidden
+        self._layers: dict[str, tuple[_Layer, ...]] = {}
+        self._ignored_directories: dict[str, bool] = {}
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Whether a path, given relative to the root with / separators, is ignored."""
+        parent, _, _ = relative_path.rpartition("/")
+        if parent and self._is_directory_ignored(parent):
+            return True
+        return self._is_entry_ignored(relative_path, is_dir)
+
+    def layers(self, directory: str) -> tuple[_Layer, ...]:
+        """The compiled ignore files that apply to the entries of a directory.
+
+        The result is identical as long as none of those files changed, which
+        lets callers caching listings notice edited ignore files.
+        """
+        layers = self._layers.get(directory)
+        if layers is None:
+            if directory:
+                parent, _, _ = directory.rpartition("/")
+                layers = self.layers(parent)
+            else:
+                layers = _optional(_load_layer(self._root / INFO_EXCLUDE, ""))
+            own = _load_layer(self._root / directory / GITIGNORE, directory)
+            layers = layers + _optional(own)
+            self._layers[directory] = layers
+        return layers
+
+    def _is_directory_ignored(self, directory: str) -> bool:
+        ignored = self._ignored_directories.get(directory)
+        if ignored is None:
+            parent, _, _ = directory.rpartition("/")
+            ignored = bool(parent) and self._is_directory_ignored(parent)
+            ignored = ignored or self._is_entry_ignored(directory, True)
+            self._ignored_directories[directory] = ignored
+        return ignored
+
+    def _is_entry_ignored(self, relative_path: str, is_dir: bool) -> bool:
+        parent, _, name = relative_path.rpartition("/")
+        if name == ".git":
+            return True
+        if self._ignore_hidden and name.startswith(".") and name != GITIGNORE:
+            return True
+
+        for layer in reversed(self.layers(parent)):
+            relative = (
+                relative_path[len(layer.base) + 1 :] if layer.base else relative_path
+            )
+            verdict = layer.match(relative, is_dir)
+            if verdict is not None:
+                return verdict
+        return False
+
+
+_compiled: dict[Path, tuple[int, int, _Layer | None]] = {}
+_compiled_lock = threading.Lock()
+
+
+def _load_layer(path: Path, base: str) -> _Layer | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with _compiled_lock:
+        cached = _compiled.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            layer = compile_layer(f.read().splitlines(), base)
+    except OSError:
+        return None
+
+    with _compiled_lock:
+        _compiled[path] = (stat.st_mtime_ns, stat.st_size, layer)
+    return layer
+
+
+def _optional(layer: _Layer | None) -> tuple[_Layer, ...]:
+    return (layer,) if layer is not None else ()
+
+
+def compile_layer(lines: list[str], base: str = "") -> _Layer | None:
+    rules = [rule for rule in map(_parse_rule, lines) if rule is not None]
+    if not rules:
+        return None
+
+    negated = tuple(rule[0] for rule in rules)
+    indexed = list(enumerate(rules))[::-1]
+    files = [
+        f"(?P<r{i}>{regex})" for i, (_, dir_only, regex) in indexed if not dir_only
+    ]
+    directories = [f"(?P<r{i}>{regex})" for i, (_, _, regex) in indexed]
+    return _Layer(
+        base=base,
+        files=re.compile("|".join(files)) if files else None,
+        directories=re.compile("|".join(directories)),
+        negated=negated,
+    )
+
+
+def _parse_rule(line: str) -> tuple[bool, bool, str] | None:
+    if not line.endswith("\\ "):
+        line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    anchored = "/" in line
+    line = line.lstrip("/")
+    if not line:
+        return None
+
+    regex = _translate(line)
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return negated, dir_only, regex
+
+
+def _translate(pattern: str) -> str:
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                end = i + 2
+                if end == n:
+                    parts.append(".*")
+                    i = end
+                    continue
+                if pattern[end] == "/":
+                    parts.append("(?:.*/)?")
+                    i = end + 1
+                    continue
+            while i + 1 < n and pattern[i + 1] == "*":
+                i += 1
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 2 if pattern.startswith("[!", i) else i + 1)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
@@ -0,0 +1,86 @@
+import json
+import sys
+from typing import TextIO
+
+from simple_agent.application.display_type import DisplayType
+from simple_agent.application.event_bus import EventBus
+from simple_agent.application.event_serializer import EventSerializer
+from simple_agent.application.events import (
+    AgentEvent,
+    AgentFinishedEvent,
+    AgentStartedEvent,
+    AssistantSaidEvent,
+    ErrorEvent,
+    SessionInterruptedEvent,
+    ToolCalledEvent,
+    ToolCancelledEvent,
+    ToolResultEvent,
+    UserPromptedEvent,
+)
+from simple_agent.application.tool_results import ToolResult
+
+STREAMED_EVENTS = (
+    AgentStartedEvent,
+    UserPromptedEvent,
+    AssistantSaidEvent,
+    ToolCalledEvent,
+    ToolResultEvent,
+    ToolCancelledEvent,
+    SessionInterruptedEvent,
+    ErrorEvent,
+    AgentFinishedEvent,
+)
+
+
+class HeadlessDisplay:
+    """Streams session events to a text stream instead of a terminal UI.
+
+    JSON output writes one serialized event per line; text output writes a
+    short human readable line per event.
+    """
+
+    def __init__(self, display_type: DisplayType, stream: TextIO | None = None):
+        self._display_type = display_type
+        self._stream = stream or sys.stdout
+        self.errors = 0
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        for event_type in STREAMED_EVENTS:
+            event_bus.subscribe(event_type, self.show)
+
+    def show(self, event: AgentEvent) -> None:
+        if isinstance(event, ErrorEvent):
+            self.errors += 1
+        if self._display_type == DisplayType.JSON:
+            line = json.dumps(EventSerializer.to_dict(event), ensure_ascii=False)
+        else:
+            line = self._format_text(event)
+        print(line, file=self._stream, flush=True)
+
+    def exit_code(self, result: ToolResult | None) -> int:
+        if self.errors or result is None or not result.success:
+            return 1
+        return 0
+
+    @staticmethod
+    def _format_text(event: AgentEvent) -> str:
+        prefix = f"[{event.agent_id}]"
+        if isinstance(event, AgentStartedEvent):
+            return f"{prefix} started {event.agent_name} ({event.model})"
+        if isinstance(event, UserPromptedEvent):
+            return f"{prefix} user: {event.input_text}"
+        if isinstance(event, AssistantSaidEvent):
+            return f"{prefix} {event.message}"
+        if isinstance(event, ToolCalledEvent):
+            return f"{prefix} {event.tool}"
+        if isinstance(event, ToolResultEvent):
+            result = event.result
+            marker = "✅" if result is None or result.success else "❌"
+            return f"{prefix} {marker} {result.message.rstrip() if result else ''}"
+        if isinstance(event, ToolCancelledEvent):
+            return f"{prefix} tool call cancelled"
+        if isinstance(event, SessionInterruptedEvent):
+            return f"{prefix} interrupted"
+        if isinstance(event, ErrorEvent):
+            return f"{prefix} error: {event.message}"
+        return f"{prefix} finished"
@@ -1,10 +1,25 @@
+from importlib import import_module
+
 from simple_agent.application.llm import LLM
-from simple_agent.infrastructure.bedrock.bedrock_client import BedrockClaudeLLM
-from simple_agent.infrastructure.claude.claude_client import ClaudeLLM
-from simple_agent.infrastructure.gemini import GeminiLLM, GeminiV1LLM
-from simple_agent.infrastructure.openai import OpenAILLM
 from simple_agent.infrastructure.user_configuration import UserConfiguration
 
+# Adapters pull in their own client libraries (boto3 for Bedrock), so each one
+# is only imported once a model actually uses it.
+ADAPTERS = {
+    "openai": ("simple_agent.infrastructure.openai", "OpenAILLM"),
+    "gemini": ("simple_agent.infrastructure.gemini", "GeminiLLM"),
+    "gemini_v1": ("simple_agent.infrastructure.gemini", "GeminiV1LLM"),
+    "bedrock": (
+        "simple_agent.infrastructure.bedrock.bedrock_client",
+        "BedrockClaudeLLM",
+    ),
+}
+DEFAULT_ADAPTER = ("simple_agent.infrastructure.claude.claude_client", "ClaudeLLM")
+
+
+def adapter_module(adapter: str) -> str:
+    return ADAPTERS.get(adapter, DEFAULT_ADAPTER)[0]
+
 
 class RemoteLLMProvider:
     def __init__(self, user_config: UserConfiguration):
@@ -15,16 +30,6 @@ class RemoteLLMProvider:
 
     def get(self, model_name: str | None = None) -> LLM:
         model_config = self._registry.get(model_name)
-        if model_config.adapter == "openai":
-            return OpenAILLM(model_config)
-
-        if model_config.adapter == "gemini":
-            return GeminiLLM(model_config)
-
-        if model_config.adapter == "gemini_v1":
-            return GeminiV1LLM(model_config)
-
-        if model_config.adapter == "bedrock":
-            return BedrockClaudeLLM(model_config)
-
-        return ClaudeLLM(model_config)
+        module_name, class_name = ADAPTERS.get(model_config.adapter, DEFAULT_ADAPTER)
+        llm_class = getattr(import_module(module_name), class_name)
+        return llm_class(model_config)
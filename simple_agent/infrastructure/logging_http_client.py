@@ -5,6 +5,8 @@ from typing import Any
 
 import httpx
 
+from simple_agent.application.tracing import tracer
+
 logger = logging.getLogger(__name__)
 
 SENSITIVE_HEADERS = {"authorization", "x-api-key"}
@@ -44,11 +46,18 @@ class LoggingAsyncClient(httpx.AsyncClient):
 
         logger.debug(_format_request(request))
 
-        response = await self.send(
-            request,
-            auth=auth,
-            follow_redirects=follow_redirects,
-        )
+        with tracer.span(
+            f"HTTP {request.method}",
+            "http",
+            host=request.url.host,
+            path=request.url.path,
+        ) as span:
+            response = await self.send(
+                request,
+                auth=auth,
+                follow_redirects=follow_redirects,
+            )
+            span.set("status", response.status_code)
 
         logger.debug(_format_response(response))
 
@@ -2,6 +2,15 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
+from simple_agent.application.session_metrics import ModelPrice
+
+PRICE_KEYS = (
+    "input_price",
+    "output_price",
+    "cached_input_price",
+    "cache_write_price",
+)
+
 
 @dataclass
 class ModelConfig:
@@ -11,6 +20,7 @@ class ModelConfig:
     api_key: str
     base_url: str | None = None
     request_timeout: int = 60
+    price: ModelPrice | None = None
 
     @staticmethod
     def from_dict(name: str, config: Mapping[str, Any]) -> "ModelConfig":
@@ -48,9 +58,35 @@ class ModelConfig:
             api_key=api_key,
             base_url=base_url,
             request_timeout=request_timeout,
+            price=_price(name, config),
         )
 
 
+def _price(name: str, config: Mapping[str, Any]) -> ModelPrice | None:
+    """Reads the optional USD prices per million tokens."""
+    values = {}
+    for key in PRICE_KEYS:
+        value = config.get(key)
+        if value is None:
+            continue
+        try:
+            values[key] = float(value)
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                f"model '{name}' has non-numeric '{key}': {value!r}"
+            ) from err
+    if not values:
+        return None
+    if "input_price" not in values or "output_price" not in values:
+        raise ValueError(f"model '{name}' needs both 'input_price' and 'output_price'")
+    return ModelPrice(
+        values["input_price"],
+        values["output_price"],
+        values.get("cached_input_price"),
+        values.get("cache_write_price"),
+    )
+
+
 class ModelsRegistry:
     def __init__(self, models: dict[str, ModelConfig], default: str):
         self.models = models
@@ -91,3 +127,10 @@ class ModelsRegistry:
             )
 
         return ModelsRegistry(models=models_dict, default=default_name)
+
+    def prices(self) -> dict[str, ModelPrice]:
+        return {
+            config.model: config.price
+            for config in self.models.values()
+            if config.price is not None
+        }
@@ -1,93 +1,213 @@
+import asyncio
 import os
+import re
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 from simple_agent.application.file_search import FileSearcher
+from simple_agent.infrastructure.gitignore import GitignoreMatcher
+from simple_agent.infrastructure.workspace_watcher import FileChange, WorkspaceWatcher
 
+MAX_RESULTS = 50
+REFRESH_INTERVAL_SECONDS = 2.0
+SCORING_CHUNK = 5000
 
-class NativeFileSearcher(FileSearcher):
-    def __init__(self, root_path: Path = Path(".")):
-        self._root_path = root_path
-        self._gitignore_patterns = self._read_gitignore(root_path)
-
-    async def search(self, query: str) -> list[str]:
-        # Simple implementation: walk and filter
-        # In a real "fzf-like" scenario, we might want fuzzy matching.
-        # For now, we'll do simple substring matching or prefix matching.
-
-        results = []
-        query = query.lower()
-
-        # We can optimize this by caching the file list if needed,
-        # but for now we'll walk fresh to pick up new files.
-        for root, dirs, files in os.walk(self._root_path):
-            # Modify dirs in-place to skip ignored directories
-            dirs[:] = [d for d in dirs if not self._should_ignore(Path(root) / d)]
+CONSECUTIVE_BONUS = 8
+BOUNDARY_BONUS = 10
+BASENAME_BONUS = 4
+_BOUNDARY_CHARS = "/_-. "
 
-            for file in files:
-                file_path = Path(root) / file
-                if self._should_ignore(file_path):
-                    continue
 
-                # Get relative path for display/matching
-                try:
-                    rel_path = str(file_path.relative_to(self._root_path)).replace(
-                        "\\", "/"
-                    )
-                except ValueError:
-                    continue
+@dataclass
+class _Directory:
+    mtime_ns: int
+    ignore_layers: tuple
+    files: list[str]
+    subdirectories: list[str]
 
-                if query in rel_path.lower():
-                    results.append(rel_path)
-                    if len(results) >= 50:  # sensible limit for autocomplete
-                        return results
 
-        return sorted(results)
-
-    def _read_gitignore(self, root_path: Path) -> set[str]:
-        gitignore_path = root_path / ".gitignore"
-        patterns = set()
+class NativeFileSearcher(FileSearcher):
+    """Fuzzy search over an in-memory index of the workspace paths.
+
+    The index is built in a worker thread on first use and refreshed in the
+    background: a refresh only stats the known directories and lists the ones
+    whose mtime or applicable ignore files changed. A query matches paths containing its characters in
+    order, ranked fzf-style by consecutive runs, word boundaries and basename
+    hits. Scoring yields to the event loop between chunks so a search for a
+    stale keystroke can be cancelled.
+
+    With a workspace watcher the index is only refreshed after the watcher
+    reported entries being added, removed or ignore rules being edited.
+    """
+
+    def __init__(
+        self,
+        root_path: Path = Path("."),
+        max_results: int = MAX_RESULTS,
+        watcher: WorkspaceWatcher | None = None,
+    ):
+        self._root_path = root_path
+        self._max_results = max_results
+        self._directories: dict[str, _Directory] = {}
+        self._paths: list[str] | None = None
+        self._refreshed_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+        self._last_query = ""
+        self._last_matches: list[str] | None = None
+        self._watched = watcher is not None
+        self._listing_changes = 0
+        self._indexed_changes = -1
+        if watcher is not None:
+            watcher.subscribe(self._on_changes)
+
+    def _on_changes(self, changes: set[FileChange]) -> None:
+        if any(change.affects_listing for change in changes):
+            self._listing_changes += 1
+
+    def start_indexing(self) -> None:
+        self._start_refresh()
 
-        if not gitignore_path.exists():
-            return patterns
+    async def search(self, query: str) -> list[str]:
+        if self._paths is None:
+            # Shielded: a cancelled keystroke must not cancel the shared build.
+            await asyncio.shield(self._start_refresh())
+        elif self._needs_refresh():
+            self._start_refresh()
 
+        paths = self._paths or []
+        query = query.lower()
+        if not query:
+            return paths[: self._max_results]
+
+        candidates = paths
+        if self._last_matches is not None and query.startswith(self._last_query):
+            # Extending a query can only remove matches.
+            candidates = self._last_matches
+
+        pattern = re.compile(".*?".join(map(re.escape, query)), re.IGNORECASE)
+        scored = []
+        for start in range(0, len(candidates), SCORING_CHUNK):
+            for path in candidates[start : start + SCORING_CHUNK]:
+                if pattern.search(path):
+                    scored.append((-fuzzy_score(query, path), len(path), path))
+            await asyncio.sleep(0)
+
+        self._last_query = query
+        self._last_matches = [path for _, _, path in scored]
+        scored.sort()
+        return [path for _, _, path in scored[: self._max_results]]
+
+    async def wait_for_refresh(self) -> None:
+        """Waits until a background refresh started by a search has finished."""
+        if self._refresh_task is not None:
+            await asyncio.shield(self._refresh_task)
+
+    def _needs_refresh(self) -> bool:
+        if self._watched:
+            return self._indexed_changes != self._listing_changes
+        return time.monotonic() - self._refreshed_at > REFRESH_INTERVAL_SECONDS
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        listing_changes = self._listing_changes
+        paths = await asyncio.to_thread(self._scan)
+        self._indexed_changes = listing_changes
+        if paths != self._paths:
+            self._paths = paths
+            self._last_matches = None
+        self._refreshed_at = time.monotonic()
+
+    def _scan(self) -> list[str]:
+        matcher = GitignoreMatcher(self._root_path)
+        seen = set()
+        pending = [""]
+        while pending:
+            relative = pending.pop()
+            directory = self._scan_directory(relative, matcher)
+            if directory is None:
+                continue
+            seen.add(relative)
+            pending.extend(directory.subdirectories)
+
+        for relative in set(self._directories) - seen:
+            del self._directories[relative]
+
+        return sorted(
+            path for directory in self._directories.values() for path in directory.files
+        )
+
+    def _scan_directory(
+        self, relative: str, matcher: GitignoreMatcher
+    ) -> _Directory | None:
+        absolute = self._root_path / relative
+        try:
+            mtime_ns = os.stat(absolute).st_mtime_ns
+        except OSError:
+            return None
+        ignore_layers = matcher.layers(relative)
+        cached = self._directories.get(relative)
+        if (
+            cached is not None
+            and cached.mtime_ns == mtime_ns
+            and cached.ignore_layers == ignore_layers
+        ):
+            return cached
+
+        files = []
+        subdirectories = []
         try:
-            with open(gitignore_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # Basic pattern normalization
-                        pattern = line.rstrip("/")
-                        patterns.add(pattern)
-        except Exception:
-            pass  # Fail safe
-
-        return patterns
-
-    def _should_ignore(self, path: Path) -> bool:
-        name = path.name
-        path_parts = set(path.parts)
-
-        if name == ".git" or ".git" in path_parts:
-            return True
-
-        # Ignore hidden files/dirs (except .gitignore)
-        if name.startswith(".") and name != ".gitignore":
-            return True
-
-        # Very basic gitignore matching (fnmatch style is better, but this mimics current project logic)
-        if self._gitignore_patterns:
-            for pattern in self._gitignore_patterns:
-                # Handle simple glob cases that were in the original tree implementation
-                if pattern.startswith("*"):
-                    if name.endswith(pattern[1:]):
-                        return True
-                elif pattern.endswith("*"):
-                    if name.startswith(pattern[:-1]):
-                        return True
-                elif pattern == name:
-                    return True
-                # Handle path segments
-                elif "/" not in pattern and pattern in path_parts:
-                    return True
-
-        return False
+            with os.scandir(absolute) as entries:
+                for entry in entries:
+                    child = f"{relative}/{entry.name}" if relative else entry.name
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if matcher.is_ignored(child, is_dir):
+                        continue
+                    if is_dir:
+                        subdirectories.append(child)
+                    else:
+                        files.append(child)
+        except OSError:
+            return None
+
+        directory = _Directory(mtime_ns, ignore_layers, files, subdirectories)
+        self._directories[relative] = directory
+        return directory
+
+
+def fuzzy_score(query: str, path: str) -> int:
+    """Score of a path containing the lower-cased query characters in order.
+
+    Matches are placed greedily, once from the start of the path and once from
+    the start of its basename, and the better placement counts.
+    """
+    lowered = path.lower()
+    basename_start = lowered.rfind("/") + 1
+    best = _score_from(query, lowered, 0, basename_start)
+    if basename_start:
+        best = max(best, _score_from(query, lowered, basename_start, basename_start))
+    return best
+
+
+def _score_from(query: str, lowered: str, start: int, basename_start: int) -> int:
+    score = 0
+    position = start
+    previous = -2
+    for char in query:
+        index = lowered.find(char, position)
+        if index < 0:
+            return -len(lowered)
+        if index == previous + 1:
+            score += CONSECUTIVE_BONUS
+        if index == 0 or lowered[index - 1] in _BOUNDARY_CHARS:
+            score += BOUNDARY_BONUS
+        if index >= basename_start:
+            score += BASENAME_BONUS
+        score -= index - position
+        previous = index
+        position = index + 1
+    return score
@@ -1,8 +1,16 @@
+import json
 import logging
 
 import httpx
 
-from simple_agent.application.llm import LLM, ChatMessages, LLMResponse, TokenUsage
+from simple_agent.application.llm import (
+    LLM,
+    ChatMessages,
+    LLMResponse,
+    TokenUsage,
+    ToolSchema,
+    ToolUse,
+)
 from simple_agent.infrastructure.logging_http_client import LoggingAsyncClient
 from simple_agent.infrastructure.model_config import ModelConfig
 
@@ -25,10 +33,14 @@ class OpenAILLM(LLM):
     def model(self) -> str:
         return self._config.model
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
-        return await self._call_async(messages)
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
+        return await self._call_async(messages, tools)
 
-    async def _call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def _call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None
+    ) -> LLMResponse:
         base_url = self._config.base_url or "https://api.openai.com/v1"
         url = f"{base_url.rstrip('/')}/chat/completions"
         api_key = self._config.api_key
@@ -39,6 +51,7 @@ class OpenAILLM(LLM):
         data = {
             "model": model,
             "messages": payload_messages,
+            **({"tools": [_tool_definition(tool) for tool in tools]} if tools else {}),
         }
 
         headers = {
@@ -68,18 +81,46 @@ class OpenAILLM(LLM):
             raise OpenAIClientError("API response missing 'message.content' field")
 
         content = message["content"] or ""
+        tool_uses = [_tool_use(call) for call in message.get("tool_calls") or []]
 
         usage_data = response_data.get("usage", {})
         usage = TokenUsage(
             input_tokens=usage_data.get("prompt_tokens", 0),
             output_tokens=usage_data.get("completion_tokens", 0),
             total_tokens=usage_data.get("total_tokens", 0),
+            cached_input_tokens=(usage_data.get("prompt_tokens_details") or {}).get(
+                "cached_tokens", 0
+            ),
         )
 
-        return LLMResponse(content=content, model=model, usage=usage)
+        return LLMResponse(
+            content=content, model=model, usage=usage, tool_uses=tool_uses
+        )
 
     def _ensure_openai_adapter(self) -> None:
         if self._config.adapter != "openai":
             raise OpenAIClientError(
                 "Configured adapter is not 'openai'; cannot use OpenAI client"
             )
+
+
+def _tool_definition(tool: ToolSchema) -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters,
+        },
+    }
+
+
+def _tool_use(tool_call: dict) -> ToolUse:
+    function = tool_call.get("function") or {}
+    try:
+        arguments = json.loads(function.get("arguments") or "{}")
+    except json.JSONDecodeError as error:
+        raise OpenAIClientError(
+            f"API response has invalid tool call arguments: {error}"
+        ) from error
+    return ToolUse(function.get("name", ""), arguments)
@@ -1,103 +1,144 @@
+from collections import deque
 from pathlib import Path
 
 from treelib.tree import Tree
 
 from simple_agent.application.project_tree import ProjectTree
+from simple_agent.infrastructure.gitignore import (
+    GITIGNORE,
+    INFO_EXCLUDE,
+    GitignoreMatcher,
+)
+from simple_agent.infrastructure.workspace_watcher import FileChange, WorkspaceWatcher
+
+MAX_ENTRIES_PER_DIRECTORY = 40
+# Roughly 4k tokens, the tree is part of every system prompt.
+MAX_RENDERED_CHARS = 16_000
 
 
 class FileSystemProjectTree(ProjectTree):
-    def __init__(self, root_path: Path):
+    """Renders the project layout, reusing the last rendering while it is current.
+
+    Adding or removing an entry changes the mtime of its directory, so the
+    mtimes of every listed directory plus the ignore files that apply form a
+    signature that is much cheaper to check than walking the tree again.
+
+    Entries are sorted so the prompt stays byte-identical between runs. Large
+    directories are cut off after max_entries with a "… N more" line, and the
+    whole rendering stops growing once it reaches max_chars.
+
+    With a workspace watcher the signature is only checked after the watcher
+    reported entries being added, removed or ignore rules being edited.
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        max_entries: int = MAX_ENTRIES_PER_DIRECTORY,
+        max_chars: int = MAX_RENDERED_CHARS,
+        watcher: WorkspaceWatcher | None = None,
+    ):
         self._root_path = root_path
+        self._max_entries = max_entries
+        self._max_chars = max_chars
+        self._renderings: dict[int, tuple[dict[Path, int | None], str, int]] = {}
+        self._watched = watcher is not None
+        self._listing_changes = 0
+        if watcher is not None:
+            watcher.subscribe(self._on_changes)
+
+    def _on_changes(self, changes: set[FileChange]) -> None:
+        if any(change.affects_listing for change in changes):
+            self._listing_changes += 1
 
     def render(self, max_depth: int = 2) -> str:
+        listing_changes = self._listing_changes
+        cached = self._renderings.get(max_depth)
+        if cached is not None:
+            signature, output, seen_changes = cached
+            if self._watched and seen_changes == listing_changes:
+                return output
+            if all(_mtime(path) == mtime for path, mtime in signature.items()):
+                self._renderings[max_depth] = (signature, output, listing_changes)
+                return output
+
         root_path = self._root_path
-        gitignore_patterns = _read_gitignore(root_path)
+        exclude_path = root_path / INFO_EXCLUDE
+        signature = {exclude_path: _mtime(exclude_path)}
         tree = Tree()
         tree.create_node("./", str(root_path))
         _build_tree(
             root_path,
             tree,
-            parent=str(root_path),
+            matcher=GitignoreMatcher(root_path),
+            listed_directories=signature,
             max_depth=max_depth,
-            gitignore_patterns=gitignore_patterns,
+            max_entries=self._max_entries,
+            max_chars=self._max_chars,
         )
-        return tree.show(stdout=False) or ""
-
-
-def _read_gitignore(root_path: Path) -> set:
-    gitignore_path = root_path / ".gitignore"
-    patterns = set()
-
-    if not gitignore_path.exists():
-        return patterns
-
-    with open(gitignore_path) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                pattern = line.rstrip("/")
-                patterns.add(pattern)
-
-    return patterns
+        output = tree.show(stdout=False, sorting=False) or ""
+        self._renderings[max_depth] = (signature, output, listing_changes)
+        return output
 
 
-def _should_ignore(path: Path, gitignore_patterns) -> bool:
-    name = path.name
-
-    if name == ".git":
-        return True
-
-    if name.startswith(".") and name != ".gitignore":
-        return True
-
-    if gitignore_patterns:
-        for pattern in gitignore_patterns:
-            if pattern.startswith("*"):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif pattern.endswith("*"):
-                if name.startswith(pattern[:-1]):
-                    return True
-            elif pattern == name:
-                return True
-            elif "/" not in pattern and pattern in str(path):
-                return True
-
-    return False
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def _build_tree(
     root_path: Path,
     tree: Tree,
     *,
-    parent,
-    gitignore_patterns,
-    max_depth=2,
-    current_depth=0,
+    matcher: GitignoreMatcher,
+    listed_directories: dict[Path, int | None],
+    max_depth: int,
+    max_entries: int,
+    max_chars: int,
 ):
-    if current_depth >= max_depth:
-        return
-
+    """Adds the entries breadth first, so the budget runs out in the deepest level."""
+    budget = max_chars
+    pending = deque([(root_path, 0)])
+    while pending:
+        directory, depth = pending.popleft()
+        entries = _list_directory(directory, matcher, listed_directories)
+        shown = 0
+        for entry, label, is_dir in entries[:max_entries]:
+            # Each line is indented by four characters per level.
+            cost = len(label) + 4 * (depth + 1) + 1
+            if cost > budget:
+                break
+            budget -= cost
+            tree.create_node(label, str(entry), parent=str(directory))
+            shown += 1
+            if is_dir and depth + 1 < max_depth:
+                pending.append((entry, depth + 1))
+
+        if shown < len(entries):
+            marker = f"… {len(entries) - shown} more"
+            tree.create_node(marker, f"{directory}/…", parent=str(directory))
+            budget -= len(marker) + 4 * (depth + 1) + 1
+
+
+def _list_directory(
+    directory: Path,
+    matcher: GitignoreMatcher,
+    listed_directories: dict[Path, int | None],
+) -> list[tuple[Path, str, bool]]:
+    listed_directories[directory] = _mtime(directory)
+    listed_directories[directory / GITIGNORE] = _mtime(directory / GITIGNORE)
     try:
-        items = root_path.iterdir()
+        items = list(directory.iterdir())
     except PermissionError:
-        return
+        return []
 
+    entries = []
     for item in items:
-        if _should_ignore(item, gitignore_patterns):
-            continue
-
-        node_id = str(item)
-        display_name = item.name + ("/" if item.is_dir() else "")
-
-        tree.create_node(display_name, node_id, parent=parent)
-
-        if item.is_dir():
-            _build_tree(
-                item,
-                tree,
-                parent=node_id,
-                max_depth=max_depth,
-                current_depth=current_depth + 1,
-                gitignore_patterns=gitignore_patterns,
-            )
+        is_dir = item.is_dir()
+        relative = item.relative_to(matcher.root).as_posix()
+        if not matcher.is_ignored(relative, is_dir):
+            entries.append((item, item.name + ("/" if is_dir else ""), is_dir))
+    entries.sort(key=lambda entry: entry[1])
+    return entries
@@ -0,0 +1,56 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure_imports(modules: list[str]) -> list[ImportTiming]:
+    """Imports the modules in a fresh interpreter and returns Python's -X importtime data."""
+    code = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return parse_import_times(completed.stderr)
+
+
+def parse_import_times(output: str) -> list[ImportTiming]:
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return timings
+
+
+def format_startup_report(timings: list[ImportTiming], top: int = 30) -> str:
+    total_us = sum(timing.self_us for timing in timings)
+    lines = [
+        f"Startup imports: {total_us / 1000:.1f} ms in {len(timings)} modules",
+        "",
+        "Top-level imports (cumulative):",
+    ]
+    for timing in sorted(
+        (t for t in timings if t.depth == 0), key=lambda t: -t.cumulative_us
+    ):
+        lines.append(f"{timing.cumulative_us / 1000:9.1f} ms  {timing.module}")
+
+    lines += ["", f"Slowest {top} modules (self):"]
+    for timing in sorted(timings, key=lambda t: -t.self_us)[:top]:
+        lines.append(f"{timing.self_us / 1000:9.1f} ms  {timing.module}")
+    return "\n".join(lines)
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from simple_agent.application.event_bus import SimpleEventBus
 from simple_agent.application.event_store import EventStore
 from simple_agent.application.events import (
@@ -7,11 +9,14 @@ from simple_agent.application.events import (
     AssistantRespondedEvent,
     AssistantSaidEvent,
     ErrorEvent,
+    HistoryReplayFinishedEvent,
+    HistoryReplayStartedEvent,
     ModelChangedEvent,
     SessionClearedEvent,
     SessionEndedEvent,
     SessionInterruptedEvent,
     SessionStartedEvent,
+    StatsShownEvent,
     ToolCalledEvent,
     ToolCancelledEvent,
     ToolResultEvent,
@@ -20,15 +25,16 @@ from simple_agent.application.events import (
 )
 from simple_agent.infrastructure.event_logger import EventLogger
 from simple_agent.infrastructure.file_system_todo_cleanup import FileSystemTodoCleanup
-from simple_agent.infrastructure.textual.textual_app import TextualApp
-from simple_agent.infrastructure.textual.textual_messages import DomainEventMessage
+
+if TYPE_CHECKING:
+    from simple_agent.infrastructure.textual.textual_app import TextualApp
 
 
 def subscribe_events(
     event_bus: SimpleEventBus,
     event_logger: EventLogger,
     todo_cleanup: FileSystemTodoCleanup,
-    app: TextualApp | None = None,
+    app: "TextualApp | None" = None,
 ):
     event_bus.subscribe(SessionStartedEvent, event_logger.log_event)
     event_bus.subscribe(UserPromptRequestedEvent, event_logger.log_event)
@@ -44,22 +50,26 @@ def subscribe_events(
 
     event_bus.subscribe(
         AgentFinishedEvent,
-        lambda event: todo_cleanup.cleanup_todos_for_agent(event.agent_id)
-        if event.agent_id and event.agent_id.has_parent()
-        else None,
+        lambda event: (
+            todo_cleanup.cleanup_todos_for_agent(event.agent_id)
+            if event.agent_id and event.agent_id.has_parent()
+            else None
+        ),
     )
     event_bus.subscribe(
         SessionClearedEvent,
-        lambda event: todo_cleanup.cleanup_todos_for_agent(event.agent_id)
-        if event.agent_id
-        else None,
+        lambda event: (
+            todo_cleanup.cleanup_todos_for_agent(event.agent_id)
+            if event.agent_id
+            else None
+        ),
     )
 
     if app:
-
-        def _post_domain_event(event):
-            app.post_message(DomainEventMessage(event))
-
+        forwarder = _DomainEventForwarder(app)
+        _post_domain_event = forwarder.post
+        event_bus.subscribe(HistoryReplayStartedEvent, forwarder.replay_started)
+        event_bus.subscribe(HistoryReplayFinishedEvent, forwarder.replay_finished)
         event_bus.subscribe(AgentStartedEvent, _post_domain_event)
         event_bus.subscribe(SessionStartedEvent, _post_domain_event)
         event_bus.subscribe(UserPromptRequestedEvent, _post_domain_event)
@@ -74,9 +84,39 @@ def subscribe_events(
         event_bus.subscribe(ToolCancelledEvent, _post_domain_event)
         event_bus.subscribe(SessionInterruptedEvent, _post_domain_event)
         event_bus.subscribe(ErrorEvent, _post_domain_event)
+        event_bus.subscribe(StatsShownEvent, _post_domain_event)
         event_bus.subscribe(SessionEndedEvent, _post_domain_event)
 
 
+class _DomainEventForwarder:
+    """Posts domain events to the app, collecting replayed history into one message."""
+
+    def __init__(self, app: "TextualApp"):
+        self._app = app
+        self._replayed: list | None = None
+
+    def post(self, event) -> None:
+        if self._replayed is not None:
+            self._replayed.append(event)
+            return
+        from simple_agent.infrastructure.textual.textual_messages import (
+            DomainEventMessage,
+        )
+
+        self._app.post_message(DomainEventMessage(event))
+
+    def replay_started(self, _event) -> None:
+        self._replayed = []
+
+    def replay_finished(self, _event) -> None:
+        from simple_agent.infrastructure.textual.textual_messages import (
+            HistoryReplayedMessage,
+        )
+
+        events, self._replayed = self._replayed or [], None
+        self._app.post_message(HistoryReplayedMessage(events))
+
+
 def subscribe_persistence(
     event_bus: SimpleEventBus,
     event_store: EventStore,
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from simple_agent.application.file_search import FileSearcher
@@ -30,11 +31,15 @@ class AtSymbolTrigger:
 
 
 class FileSearchProvider:
-    def __init__(self, searcher: FileSearcher):
+    def __init__(self, searcher: FileSearcher, debounce_seconds: float = 0.0):
         self.searcher = searcher
+        self._debounce_seconds = debounce_seconds
 
     async def suggest(self, cursor_and_line: CursorAndLine) -> SuggestionList:
         query = cursor_and_line.word[1:]  # Strip '@'
+        if self._debounce_seconds:
+            # The input cancels this task on the next keystroke.
+            await asyncio.sleep(self._debounce_seconds)
         try:
             results = await self.searcher.search(query)
             return SuggestionList([FileSuggestion(str(res)) for res in results])
@@ -7,7 +7,10 @@ from textual.app import App, ComposeResult
 from textual.containers import Vertical
 
 from simple_agent.application.agent_id import AgentId
-from simple_agent.application.agent_task_manager import AgentTaskManager
+from simple_agent.application.agent_task_manager import (
+    AgentTaskManager,
+    format_task_report,
+)
 from simple_agent.application.slash_command_registry import SlashCommandRegistry
 from simple_agent.infrastructure.native_file_searcher import NativeFileSearcher
 from simple_agent.infrastructure.textual.smart_input import SmartInput
@@ -25,7 +28,10 @@ from simple_agent.infrastructure.textual.smart_input.autocomplete.slash_commands
     SlashCommandArgumentTrigger,
     SlashCommandProvider,
 )
-from simple_agent.infrastructure.textual.textual_messages import DomainEventMessage
+from simple_agent.infrastructure.textual.textual_messages import (
+    DomainEventMessage,
+    HistoryReplayedMessage,
+)
 from simple_agent.infrastructure.textual.widgets.agent_tabs import AgentTabs
 from simple_agent.infrastructure.textual.widgets.file_loader import (
     DiskFileLoader,
@@ -34,6 +40,8 @@ from simple_agent.infrastructure.textual.widgets.file_loader import (
 
 logger = logging.getLogger(__name__)
 
+FILE_SEARCH_DEBOUNCE_SECONDS = 0.08
+
 
 class TextualApp(App):
     async def run_with_session_async(
@@ -52,6 +60,7 @@ class TextualApp(App):
         ("ctrl+c", "quit", "Quit"),
         ("ctrl+q", "quit", "Quit"),
         ("enter", "submit_input", "Submit"),
+        ("ctrl+t", "show_tasks", "Agent Tasks"),
     ]
 
     CSS = """
@@ -132,6 +141,7 @@ class TextualApp(App):
         agent_task_manager: AgentTaskManager,
         available_models: list[str] | None = None,
         available_agents: list[str] | None = None,
+        file_searcher: NativeFileSearcher | None = None,
     ):
         super().__init__()
         self.user_input = user_input
@@ -142,7 +152,7 @@ class TextualApp(App):
             available_models=available_models,
             available_agents=available_agents,
         )
-        self._file_searcher = NativeFileSearcher()
+        self._file_searcher = file_searcher or NativeFileSearcher()
         self.file_loader = XmlFormattingFileLoader(DiskFileLoader())
         self._suggestion_provider = self._create_suggestion_provider()
 
@@ -166,7 +176,10 @@ class TextualApp(App):
                 ),
                 TriggeredSuggestionProvider(
                     trigger=AtSymbolTrigger(),
-                    provider=FileSearchProvider(self._file_searcher),
+                    provider=FileSearchProvider(
+                        self._file_searcher,
+                        debounce_seconds=FILE_SEARCH_DEBOUNCE_SECONDS,
+                    ),
                 ),
             ]
         )
@@ -186,6 +199,8 @@ class TextualApp(App):
         except Exception as e:
             logger.warning("Could not focus smart input on mount: %s", e)
 
+        self._file_searcher.start_indexing()
+
         if self._session_runner:
             self.agent_task_manager.start_task(self._root_agent_id, self._run_session())
 
@@ -230,6 +245,12 @@ class TextualApp(App):
     def action_next_tab(self) -> None:
         self.query_one(AgentTabs).switch_tab(1)
 
+    def action_show_tasks(self) -> None:
+        workspace = self.query_one(AgentTabs).active_workspace
+        if workspace:
+            report = format_task_report(self.agent_task_manager.snapshot())
+            workspace.write_message(f"\n**Agent tasks**\n```\n{report}\n```")
+
     def action_submit_input(self) -> None:
         """Called when Enter is pressed and handled by binding."""
         # Find active smart input
@@ -256,3 +277,6 @@ class TextualApp(App):
 
     def on_domain_event_message(self, message: DomainEventMessage) -> None:
         self.query_one(AgentTabs).handle_event(message.event)
+
+    def on_history_replayed_message(self, message: HistoryReplayedMessage) -> None:
+        self.query_one(AgentTabs).replay(message.events)
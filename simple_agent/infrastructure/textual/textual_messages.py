@@ -5,3 +5,9 @@ class DomainEventMessage(Message):
     def __init__(self, event) -> None:
         super().__init__()
         self.event = event
+
+
+class HistoryReplayedMessage(Message):
+    def __init__(self, events: list) -> None:
+        super().__init__()
+        self.events = events
@@ -1,29 +1,35 @@
 import asyncio
-from queue import Empty, Queue
 
 from simple_agent.application.user_input import UserInput
 
+# Queued by close() and handed on by every reader, so all waiting agents wake.
+_CLOSED = None
+
 
 class TextualUserInput(UserInput):
     def __init__(self):
-        self.input_queue: Queue[str] = Queue()
+        self.input_queue: asyncio.Queue[str | None] = asyncio.Queue()
         self.escape_flag = False
         self.closing = False
 
     async def read_async(self) -> str:
-        while not self.closing:
-            try:
-                return self.input_queue.get_nowait()
-            except Empty:
-                await asyncio.sleep(0.05)
-        return ""
+        if self.closing:
+            return ""
+        message = await self.input_queue.get()
+        if message is None:
+            # Closed, hand the sentinel on to the next waiting reader.
+            self.input_queue.put_nowait(_CLOSED)
+            return ""
+        return message
 
     def submit_input(self, message: str):
         self.escape_flag = False
-        self.input_queue.put(message)
+        self.input_queue.put_nowait(message)
 
     def escape_requested(self) -> bool:
         return self.escape_flag
 
     def close(self):
-        self.closing = True
+        if not self.closing:
+            self.closing = True
+            self.input_queue.put_nowait(_CLOSED)
@@ -16,6 +16,7 @@ from simple_agent.application.events import (
     SessionEndedEvent,
     SessionInterruptedEvent,
     SessionStartedEvent,
+    StatsShownEvent,
     ToolCalledEvent,
     ToolCancelledEvent,
     ToolResultEvent,
@@ -43,6 +44,7 @@ class AgentTabs(TabbedContent):
         self._tool_results_to_agent: dict[str, AgentId] = {}
         self._agent_models: dict[AgentId, str] = {}
         self._agent_token_display: dict[AgentId, str] = {}
+        self._replaying = False
 
     def on_mount(self) -> None:
         self._ensure_agent_tab_exists(self._root_agent_id, None, None)
@@ -78,6 +80,8 @@ class AgentTabs(TabbedContent):
             id="tab-content",
         )
 
+        if self._replaying:
+            workspace.begin_batch()
         self._agent_workspaces[str(agent_id)] = workspace
         self._agent_panel_ids[agent_id] = (log_id, tool_results_id)
         self._tool_results_to_agent[tool_results_id] = agent_id
@@ -140,6 +144,19 @@ class AgentTabs(TabbedContent):
             if workspace and workspace.smart_input:
                 workspace.smart_input.focus()
 
+    def replay(self, events) -> None:
+        """Applies replayed history, mounting each panel's new widgets in one go."""
+        self._replaying = True
+        for workspace in self._agent_workspaces.values():
+            workspace.begin_batch()
+        try:
+            for event in events:
+                self.handle_event(event)
+        finally:
+            self._replaying = False
+            for workspace in self._agent_workspaces.values():
+                workspace.end_batch()
+
     def handle_event(self, event) -> None:
         agent_id = getattr(event, "agent_id", None)
         if agent_id is None:
@@ -227,6 +244,10 @@ class AgentTabs(TabbedContent):
             workspace = self._agent_workspaces.get(str(agent_id))
             if workspace:
                 workspace.write_message(f"\n**❌ Error: {event.message}**")
+        elif isinstance(event, StatsShownEvent):
+            workspace = self._agent_workspaces.get(str(agent_id))
+            if workspace:
+                workspace.write_message(f"\n```\n{event.report}\n```")
         elif isinstance(event, AssistantRespondedEvent):
             self._agent_models[agent_id] = event.model
             self._agent_token_display[agent_id] = event.token_usage_display
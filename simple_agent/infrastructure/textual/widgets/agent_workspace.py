@@ -52,8 +52,21 @@ class AgentWorkspace(Vertical):
         # Smart input for this specific agent
         self.smart_input = SmartInput(provider=suggestion_provider, id="user-input")
 
+        self._batching = False
+
         super().__init__(self.split_view, self.smart_input, **kwargs)
 
+    def begin_batch(self) -> None:
+        self._batching = True
+        self.chat_log.begin_batch()
+        self.tool_log.begin_batch()
+
+    def end_batch(self) -> None:
+        self._batching = False
+        self.chat_log.end_batch()
+        self.tool_log.end_batch()
+        self.refresh_todos()
+
     def refresh_todos(self) -> None:
         self.todo_view.refresh_content()
         self.left_panel.set_bottom_visibility(self.todo_view.has_content)
@@ -63,11 +76,13 @@ class AgentWorkspace(Vertical):
 
     def on_tool_result(self, call_id: str, result: ToolResult) -> None:
         self.tool_log.add_tool_result(call_id, result)
-        self.refresh_todos()
+        if not self._batching:
+            self.refresh_todos()
 
     def on_tool_cancelled(self, call_id: str) -> None:
         self.tool_log.add_tool_cancelled(call_id)
-        self.refresh_todos()
+        if not self._batching:
+            self.refresh_todos()
 
     def write_message(self, message: str) -> None:
         self.chat_log.write(message)
@@ -79,7 +94,7 @@ class AgentWorkspace(Vertical):
         self.chat_log.add_assistant_message(message, agent_name)
 
     def clear(self) -> None:
-        self.chat_log.remove_children()
+        self.chat_log.clear()
         self.tool_log.clear()
         self.todo_view.update("")
         self.left_panel.set_bottom_visibility(False)
@@ -1,28 +1,106 @@
 import re
+from collections import deque
 
 from textual.containers import VerticalScroll
 from textual.widgets import Markdown
 
+MAX_MOUNTED_MESSAGES = 200
+OLDER_PAGE_SIZE = 50
+
 
 class ChatLog(VerticalScroll):
+    """Chat history of which only a window of recent messages is mounted.
+
+    Messages are kept as plain text and only the newest ones get a Markdown
+    widget. Reaching the top mounts the previous page, and new messages drop
+    the oldest widgets again while the log follows the end, so the widget
+    count stays bounded no matter how long the session gets.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._pending_messages = []
+        self._messages: list[str] = []
+        self._mounted: deque[Markdown] = deque()
+        self._first_mounted = 0
+        self._end_mounted = 0
+        self._batching = False
+        self._following = True
+
+    @property
+    def message_count(self) -> int:
+        return len(self._messages)
 
     def on_mount(self) -> None:
-        if self._pending_messages:
-            # Batch mount all historical messages for performance
-            widgets = [Markdown(m.rstrip()) for m in self._pending_messages]
-            self.mount(*widgets)
-            self._pending_messages.clear()
-            self.scroll_end(animate=False)
+        self._mount_pending()
+
+    def begin_batch(self) -> None:
+        self._batching = True
+
+    def end_batch(self) -> None:
+        self._batching = False
+        if self.is_mounted:
+            self._mount_pending()
 
     def write(self, message: str) -> None:
-        if not self.is_mounted:
-            self._pending_messages.append(message)
+        self._messages.append(message.rstrip())
+        if not self._batching and self.is_mounted:
+            self._mount_pending()
+
+    def clear(self) -> None:
+        self._messages = []
+        self._first_mounted = self._end_mounted = 0
+        self._following = True
+        self._mounted.clear()
+        self.remove_children()
+
+    def _mount_pending(self) -> None:
+        if self._end_mounted == len(self._messages):
+            return
+        start = max(self._end_mounted, len(self._messages) - MAX_MOUNTED_MESSAGES)
+        if start > self._end_mounted:
+            # Everything mounted so far falls out of the window anyway.
+            self.remove_children(list(self._mounted))
+            self._mounted.clear()
+            self._first_mounted = start
+        widgets = [Markdown(m) for m in self._messages[start:]]
+        self._mounted.extend(widgets)
+        self.mount(*widgets)
+        self._end_mounted = len(self._messages)
+        if self._following:
+            self._unmount_oldest()
+            self.scroll_end(animate=False)
+
+    def _unmount_oldest(self) -> None:
+        excess = len(self._mounted) - MAX_MOUNTED_MESSAGES
+        if excess > 0:
+            self.remove_children([self._mounted.popleft() for _ in range(excess)])
+            self._first_mounted += excess
+
+    def _trim_to_window(self) -> None:
+        if self._following and len(self._mounted) > MAX_MOUNTED_MESSAGES:
+            self._unmount_oldest()
+            self.scroll_end(animate=False)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        following = self.is_vertical_scroll_end
+        if following and not self._following:
+            # Messages written while scrolled up were kept, drop them now.
+            self.call_later(self._trim_to_window)
+        self._following = following
+        if new_value == 0 and self._first_mounted > 0:
+            self.call_later(self._mount_older)
+
+    def _mount_older(self) -> None:
+        if self._first_mounted == 0 or not self._mounted:
             return
-        self.mount(Markdown(message.rstrip()))
-        self.scroll_end(animate=False)
+        start = max(0, self._first_mounted - OLDER_PAGE_SIZE)
+        anchor = self._mounted[0]
+        widgets = [Markdown(m) for m in self._messages[start : self._first_mounted]]
+        self._mounted.extendleft(reversed(widgets))
+        self.mount(*widgets, before=anchor)
+        self._first_mounted = start
+        self.call_after_refresh(self.scroll_to_widget, anchor, top=True, animate=False)
 
     def add_user_message(self, text: str) -> None:
         display_text = text
@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 
 from simple_agent.application.file_loader import FileLoader
+from simple_agent.infrastructure.file_cache import file_cache
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ class DiskFileLoader:
         try:
             path = Path(file_path_str)
             if path.exists() and path.is_file():
-                return path.read_text(encoding="utf-8")
+                return file_cache.read_text(path)
         except Exception as e:
             logger.error(f"Failed to read referenced file {file_path_str}: {e}")
         return None
@@ -5,6 +5,7 @@ from textual.css.query import NoMatches
 from textual.widgets import Markdown
 
 from simple_agent.application.agent_id import AgentId
+from simple_agent.infrastructure.file_cache import file_cache
 
 
 class TodoView(VerticalScroll):
@@ -20,14 +21,17 @@ class TodoView(VerticalScroll):
 
     def load_content(self) -> str:
         path = Path(self.agent_id.todo_filename())
-        if not path.exists():
+        try:
+            self.content = file_cache.read_text(path).strip()
+        except FileNotFoundError:
             self.content = ""
-        else:
-            self.content = path.read_text(encoding="utf-8").strip()
         return self.content
 
     def refresh_content(self) -> None:
+        previous = self.content
         content = self.load_content()
+        if content == previous:
+            return
         try:
             markdown = self.query_one(Markdown)
             markdown.update(content)
@@ -1,8 +1,10 @@
 import logging
+from dataclasses import dataclass
 
 from rich.syntax import Syntax
 from textual.containers import VerticalScroll
 from textual.css.query import NoMatches
+from textual.widget import Widget
 from textual.widgets import Collapsible, Static, TextArea
 
 from simple_agent.application.tool_results import ToolResult
@@ -10,38 +12,58 @@ from simple_agent.application.tool_results import ToolResult
 logger = logging.getLogger(__name__)
 
 
+@dataclass(eq=False)
+class _ToolEntry:
+    message: str
+    title: str
+    collapsed: bool = False
+    loading: bool = False
+    cancelled: bool = False
+    result: ToolResult | None = None
+    collapsible: Collapsible | None = None
+    body: TextArea | Static | None = None
+
+
 class ToolLog(VerticalScroll):
+    """Tool calls of one agent, one collapsible entry per call.
+
+    Entries are plain records until they are mounted, and an entry only gets a
+    body widget while it is expanded. Collapsed history therefore costs a header
+    row, and the result of a collapsed call is rendered when it is opened.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._pending_tool_calls = {}
+        self._pending_tool_calls: dict[str, _ToolEntry] = {}
         self._suppressed_tool_calls = set()
-        self._collapsibles = []
+        self._entries: list[_ToolEntry] = []
+        self._entry_by_collapsible: dict[Collapsible, _ToolEntry] = {}
+        self._expanded: set[_ToolEntry] = set()
         self._deferred_loading: set[str] = set()
+        self._batching = False
 
     def add_tool_call(self, call_id: str, message: str) -> None:
         if "write-todos" in message:
             self._suppressed_tool_calls.add(call_id)
             return
 
-        for collapsible in self._collapsibles:
-            collapsible.collapsed = True
-
-        text_area = TextArea(
-            "",
-            read_only=True,
-            language="markdown",
-            show_cursor=False,
-            classes="tool-call",
-        )
-        text_area.styles.height = 3
+        for expanded in self._expanded:
+            self._set_collapsed(expanded, True)
+            self._drop_body(expanded)
+        self._expanded.clear()
 
         title = message.splitlines()[0] if message else "Tool Call"
-        collapsible = Collapsible(text_area, title=title, collapsed=False)
-        self._collapsibles.append(collapsible)
-        self._pending_tool_calls[call_id] = (message, text_area, collapsible)
+        entry = _ToolEntry(message, title)
+        self._entries.append(entry)
+        self._expanded.add(entry)
+        self._pending_tool_calls[call_id] = entry
+
+        if self._batching:
+            # Replayed history is mounted by end_batch and needs no spinner.
+            return
 
         if self.is_mounted:
-            self.mount(collapsible)
+            self.mount(self._build(entry))
             self.scroll_end(animate=False)
 
         # Defer showing the loading spinner to the next frame.
@@ -53,19 +75,80 @@ class ToolLog(VerticalScroll):
         if call_id not in self._deferred_loading:
             return
         self._deferred_loading.discard(call_id)
-        if call_id in self._pending_tool_calls:
-            _, text_area, _ = self._pending_tool_calls[call_id]
-            text_area.loading = True
+        entry = self._pending_tool_calls.get(call_id)
+        if entry is not None:
+            entry.loading = True
+            if entry.body is not None:
+                entry.body.loading = True
 
     def _cancel_deferred_loading(self, call_id: str) -> None:
         self._deferred_loading.discard(call_id)
 
     def on_mount(self) -> None:
-        for collapsible in self._collapsibles:
-            if collapsible.parent is None:
-                self.mount(collapsible)
+        self._mount_pending()
+
+    def begin_batch(self) -> None:
+        self._batching = True
+
+    def end_batch(self) -> None:
+        self._batching = False
+        if self.is_mounted:
+            self._mount_pending()
+
+    def _mount_pending(self) -> None:
+        pending = [self._build(e) for e in self._entries if e.collapsible is None]
+        if pending:
+            self.mount(*pending)
         self.scroll_end(animate=False)
 
+    def _build(self, entry: _ToolEntry) -> Collapsible:
+        if not entry.collapsed:
+            entry.body = self._build_body(entry)
+        children = [entry.body] if entry.body is not None else []
+        collapsible = Collapsible(
+            *children, title=entry.title, collapsed=entry.collapsed
+        )
+        entry.collapsible = collapsible
+        self._entry_by_collapsible[collapsible] = entry
+        return collapsible
+
+    def _build_body(self, entry: _ToolEntry) -> TextArea | Static:
+        if entry.cancelled:
+            text_area = self._text_area("Cancelled", "tool-result tool-result-error")
+            text_area.styles.height = 3
+            return text_area
+        if entry.result is None:
+            text_area = self._text_area("", "tool-call")
+            text_area.styles.height = 3
+            text_area.loading = entry.loading
+            return text_area
+
+        message, language, classes = self._result_display(entry.result)
+        if language == "diff":
+            return self._diff_widget(message, classes)
+        text_area = self._text_area(message, classes, language)
+        text_area.styles.height = self._body_height(message)
+        return text_area
+
+    def on_collapsible_expanded(self, event: Collapsible.Expanded) -> None:
+        entry = self._entry_by_collapsible.get(event.collapsible)
+        if entry is None:
+            return
+        entry.collapsed = False
+        self._expanded.add(entry)
+        if entry.body is None:
+            entry.body = self._build_body(entry)
+            self._mount_body(event.collapsible, entry.body)
+
+    def on_collapsible_collapsed(self, event: Collapsible.Collapsed) -> None:
+        entry = self._entry_by_collapsible.get(event.collapsible)
+        if entry is None:
+            return
+        entry.collapsed = True
+        self._expanded.discard(entry)
+        if self._is_collapsed(entry):
+            self._drop_body(entry)
+
     def add_tool_result(self, call_id: str, result: ToolResult) -> None:
         if call_id in self._suppressed_tool_calls:
             return
@@ -76,50 +159,39 @@ class ToolLog(VerticalScroll):
             self.add_tool_call(call_id, result.display_title or "Recovered Tool Call")
             self._cancel_deferred_loading(call_id)
 
-        _, text_area, call_collapsible = self._pending_tool_calls.pop(call_id)
-        message = result.display_body or result.message or "No output"
-        language = result.display_language or "python"
-        classes = (
-            "tool-result tool-result-success"
-            if result.success
-            else "tool-result tool-result-error"
-        )
+        entry = self._pending_tool_calls.pop(call_id)
+        entry.result = result
+        entry.loading = False
+
+        if result.display_title:
+            self._set_title(entry, result.display_title)
+
+        if self._is_collapsed(entry):
+            self._drop_body(entry)
+        elif isinstance(entry.body, TextArea):
+            self._show_result(entry, entry.body, result)
 
+        if self.is_mounted and not self._batching:
+            self.scroll_end(animate=False)
+
+    def _show_result(
+        self, entry: _ToolEntry, text_area: TextArea, result: ToolResult
+    ) -> None:
+        message, language, classes = self._result_display(result)
         text_area.loading = False
 
-        if language == "diff":
-            diff_widget = Static(
-                Syntax(
-                    message,
-                    "diff",
-                    theme="ansi_dark",
-                    line_numbers=False,
-                    word_wrap=True,
-                )
-            )
-            for cls in classes.split():
-                diff_widget.add_class(cls)
-            height = min((len(message.splitlines()) or 1) + 2, 30)
-            diff_widget.styles.height = height
+        if language == "diff" and entry.collapsible is not None:
+            diff_widget = self._diff_widget(message, classes)
             text_area.remove()
-            try:
-                contents = call_collapsible.query_one(Collapsible.Contents)
-                contents.mount(diff_widget)
-            except NoMatches:
-                call_collapsible.mount(diff_widget)
+            entry.body = diff_widget
+            self._mount_body(entry.collapsible, diff_widget)
         else:
             text_area.load_text(message)
             text_area.language = language
             text_area.remove_class("tool-call")
             for cls in classes.split():
                 text_area.add_class(cls)
-            text_area.styles.height = min((len(message.splitlines()) or 1) + 2, 30)
-
-        if result.display_title:
-            call_collapsible.title = result.display_title
-
-        if self.is_mounted:
-            self.scroll_end(animate=False)
+            text_area.styles.height = self._body_height(message)
 
     def add_tool_cancelled(self, call_id: str) -> None:
         if call_id in self._suppressed_tool_calls:
@@ -128,23 +200,28 @@ class ToolLog(VerticalScroll):
 
         self._cancel_deferred_loading(call_id)
 
-        pending_entry = self._pending_tool_calls.pop(call_id, None)
-        if pending_entry is None:
+        entry = self._pending_tool_calls.pop(call_id, None)
+        if entry is None:
             logger.warning("Tool cancelled with no matching call. call_id=%s", call_id)
             return
 
-        title_source, text_area, call_collapsible = pending_entry
-        text_area.loading = False
-        text_area.load_text("Cancelled")
-        text_area.remove_class("tool-call")
-        text_area.add_class("tool-result")
-        text_area.add_class("tool-result-error")
-        text_area.styles.height = 3
+        entry.cancelled = True
+        entry.loading = False
+        title = entry.message.splitlines()[0] if entry.message else "Tool Call"
+        self._set_title(entry, f"{title} (Cancelled)")
 
-        title = title_source.splitlines()[0] if title_source else "Tool Call"
-        call_collapsible.title = f"{title} (Cancelled)"
+        if self._is_collapsed(entry):
+            self._drop_body(entry)
+        elif isinstance(entry.body, TextArea):
+            text_area = entry.body
+            text_area.loading = False
+            text_area.load_text("Cancelled")
+            text_area.remove_class("tool-call")
+            text_area.add_class("tool-result")
+            text_area.add_class("tool-result-error")
+            text_area.styles.height = 3
 
-        if self.is_mounted:
+        if self.is_mounted and not self._batching:
             self.scroll_end(animate=False)
 
     def clear(self) -> None:
@@ -152,4 +229,79 @@ class ToolLog(VerticalScroll):
         self.remove_children()
         self._pending_tool_calls.clear()
         self._suppressed_tool_calls.clear()
-        self._collapsibles.clear()
+        self._entries.clear()
+        self._entry_by_collapsible.clear()
+        self._expanded.clear()
+
+    @staticmethod
+    def _is_collapsed(entry: _ToolEntry) -> bool:
+        if entry.collapsible is not None:
+            return entry.collapsible.collapsed
+        return entry.collapsed
+
+    @staticmethod
+    def _set_collapsed(entry: _ToolEntry, collapsed: bool) -> None:
+        entry.collapsed = collapsed
+        if entry.collapsible is not None:
+            entry.collapsible.collapsed = collapsed
+
+    @staticmethod
+    def _set_title(entry: _ToolEntry, title: str) -> None:
+        entry.title = title
+        if entry.collapsible is not None:
+            entry.collapsible.title = title
+
+    @staticmethod
+    def _drop_body(entry: _ToolEntry) -> None:
+        # Rendered again from the stored result once the entry is expanded.
+        if entry.body is not None:
+            entry.body.remove()
+            entry.body = None
+
+    @staticmethod
+    def _mount_body(collapsible: Collapsible, body: Widget) -> None:
+        try:
+            contents = collapsible.query_one(Collapsible.Contents)
+            contents.mount(body)
+        except NoMatches:
+            collapsible.mount(body)
+
+    @staticmethod
+    def _result_display(result: ToolResult) -> tuple[str, str, str]:
+        message = result.display_body or result.message or "No output"
+        language = result.display_language or "python"
+        classes = (
+            "tool-result tool-result-success"
+            if result.success
+            else "tool-result tool-result-error"
+        )
+        return message, language, classes
+
+    @staticmethod
+    def _text_area(text: str, classes: str, language: str = "markdown") -> TextArea:
+        return TextArea(
+            text,
+            read_only=True,
+            language=language,
+            show_cursor=False,
+            classes=classes,
+        )
+
+    @staticmethod
+    def _diff_widget(message: str, classes: str) -> Static:
+        diff_widget = Static(
+            Syntax(
+                message,
+                "diff",
+                theme="ansi_dark",
+                line_numbers=False,
+                word_wrap=True,
+            ),
+            classes=classes,
+        )
+        diff_widget.styles.height = ToolLog._body_height(message)
+        return diff_widget
+
+    @staticmethod
+    def _body_height(message: str) -> int:
+        return min((len(message.splitlines()) or 1) + 2, 30)
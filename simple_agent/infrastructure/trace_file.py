@@ -0,0 +1,19 @@
+import json
+import time
+from pathlib import Path
+
+from simple_agent.application.tracing import Tracer, tracer
+
+
+def trace_file_name() -> str:
+    return time.strftime("trace-%Y%m%d-%H%M%S.json")
+
+
+def write_trace(path: Path, trace: Tracer = tracer) -> Path | None:
+    """Stops tracing and writes the spans as Chrome trace-event JSON, returns the file."""
+    document = trace.stop()
+    if document is None:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
@@ -4,11 +4,17 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Self
 
+from simple_agent.application.agent_task_manager import (
+    DEFAULT_MAX_RUNNING,
+    DEFAULT_MAX_RUNNING_PER_PARENT,
+)
 from simple_agent.application.agent_type import AgentType
 from simple_agent.application.session import SessionArgs
+from simple_agent.application.tool_output_budget import DEFAULT_MAX_OUTPUT_CHARS
 from simple_agent.infrastructure.model_config import ModelsRegistry
 
 DEFAULT_STARTING_AGENT_TYPE = "orchestrator"
+TOOL_SYNTAXES = ("emoji_bracket", "native")
 APP_DIR = str(Path(__file__).resolve().parents[2])
 
 
@@ -78,6 +84,47 @@ class UserConfiguration:
     def models_registry(self) -> ModelsRegistry:
         return ModelsRegistry.from_config(self._config)
 
+    def max_running_agents(self) -> int:
+        return self._agents_limit("max_running", DEFAULT_MAX_RUNNING)
+
+    def max_running_agents_per_parent(self) -> int:
+        return self._agents_limit(
+            "max_running_per_parent", DEFAULT_MAX_RUNNING_PER_PARENT
+        )
+
+    def _agents_limit(self, key: str, default: int) -> int:
+        agents_section = self._config.get("agents")
+        if isinstance(agents_section, Mapping):
+            value = agents_section.get(key)
+            if value is not None:
+                limit = int(value)
+                if limit < 1:
+                    raise ConfigurationError(f"agents.{key} must be at least 1")
+                return limit
+        return default
+
+    def tool_output_max_chars(self) -> int:
+        tools_section = self._config.get("tools")
+        if isinstance(tools_section, Mapping):
+            value = tools_section.get("max_output_chars")
+            if value is not None:
+                return int(value)
+        return DEFAULT_MAX_OUTPUT_CHARS
+
+    def tool_syntax(self) -> str:
+        tools_section = self._config.get("tools")
+        if isinstance(tools_section, Mapping):
+            value = tools_section.get("syntax")
+            if value is not None:
+                syntax = str(value).strip().lower()
+                if syntax not in TOOL_SYNTAXES:
+                    raise ConfigurationError(
+                        f"unknown tool syntax '{value}', expected one of: "
+                        + ", ".join(TOOL_SYNTAXES)
+                    )
+                return syntax
+        return TOOL_SYNTAXES[0]
+
     def log_level(self) -> str:
         log_section = self._config.get("log")
         if isinstance(log_section, Mapping):
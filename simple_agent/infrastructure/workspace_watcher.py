@@ -0,0 +1,378 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from simple_agent.infrastructure.gitignore import GITIGNORE, GitignoreMatcher
+from simple_agent.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+POLL_INTERVAL_SECONDS = 2.0
+COALESCE_SECONDS = 0.05
+MAX_BURST_SECONDS = 0.5
+
+
+class ChangeKind(Enum):
+    CREATED = "created"
+    DELETED = "deleted"
+    MODIFIED = "modified"
+    # Events were lost, anything below the path may have changed.
+    RESCAN = "rescan"
+
+
+@dataclass(frozen=True)
+class FileChange:
+    path: Path
+    kind: ChangeKind
+
+    @property
+    def affects_listing(self) -> bool:
+        """Whether directory listings or ignore rules below the root may differ."""
+        return self.kind != ChangeKind.MODIFIED or self.path.name in (
+            GITIGNORE,
+            "exclude",
+        )
+
+
+ChangeSubscriber = Callable[[set[FileChange]], None]
+
+
+class WorkspaceWatcher:
+    """Reports file changes below a root directory to its subscribers.
+
+    Uses inotify on Linux, with one watch per directory that is not ignored,
+    and falls back to periodically comparing stats elsewhere or when inotify
+    is unavailable. Subscribers are called from the watcher thread with the
+    changes of a short burst coalesced into one set.
+
+    Setting up the watches walks the whole tree, start_in_background() does
+    that off the caller's thread and then reports a RESCAN of the root, since
+    changes made before the watches were in place went unseen.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        force_polling: bool = False,
+    ):
+        self.root = Path(os.path.abspath(root))
+        self._poll_interval = poll_interval
+        self._force_polling = force_polling
+        self._subscribers: list[ChangeSubscriber] = []
+        self._backend: _InotifyBackend | _PollingBackend | None = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def subscribe(self, subscriber: ChangeSubscriber) -> None:
+        self._subscribers.append(subscriber)
+
+    @property
+    def backend(self) -> str | None:
+        return self._backend.name if self._backend else None
+
+    def start(self) -> None:
+        with self._lock:
+            self._stopped = False
+            if self._backend is not None:
+                return
+        self._start_backend()
+
+    def start_in_background(self) -> None:
+        with self._lock:
+            self._stopped = False
+            if self._backend is not None:
+                return
+        threading.Thread(
+            target=self._start_and_rescan, name="workspace-watcher-start", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            backend, self._backend = self._backend, None
+        if backend is not None:
+            backend.stop()
+
+    def _start_and_rescan(self) -> None:
+        if self._start_backend():
+            self._publish({FileChange(self.root, ChangeKind.RESCAN)})
+
+    def _start_backend(self) -> bool:
+        backend: _InotifyBackend | _PollingBackend | None = None
+        if not self._force_polling:
+            try:
+                backend = _InotifyBackend(self.root, self._publish)
+            except OSError as error:
+                logger.info("inotify unavailable, polling for changes: %s", error)
+        if backend is None:
+            backend = _PollingBackend(self.root, self._publish, self._poll_interval)
+        with self._lock:
+            # Stopped or started elsewhere while the tree was being walked.
+            discard = self._stopped or self._backend is not None
+            if not discard:
+                self._backend = backend
+                backend.start()
+        if discard:
+            backend.discard()
+        return not discard
+
+    def _publish(self, changes: set[FileChange]) -> None:
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber(changes)
+            except Exception:
+                logger.exception("Workspace change subscriber failed")
+
+
+def _is_ignored(matcher: GitignoreMatcher, path: Path, is_dir: bool) -> bool:
+    relative = path.relative_to(matcher.root).as_posix()
+    return relative != "." and matcher.is_ignored(relative, is_dir)
+
+
+def _watched_directories(matcher: GitignoreMatcher, start: Path) -> Iterable[Path]:
+    root = matcher.root
+    if _is_ignored(matcher, start, True):
+        return
+    for directory, subdirectories, _ in os.walk(start):
+        relative = Path(directory).relative_to(root).as_posix()
+        prefix = "" if relative == "." else relative + "/"
+        subdirectories[:] = [
+            d for d in subdirectories if not matcher.is_ignored(prefix + d, True)
+        ]
+        yield Path(directory)
+
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _InotifyBackend:
+    name = "inotify"
+
+    def __init__(self, root: Path, publish: ChangeSubscriber):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify requires Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("libc has no inotify support")
+
+        self._libc = libc
+        self._root = root
+        self._publish = publish
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: dict[int, Path] = {}
+        self._matcher = GitignoreMatcher(root)
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        try:
+            self._watch_tree(root)
+        except OSError:
+            self._close()
+            raise
+        self._thread = threading.Thread(
+            target=self._run, name="workspace-watcher", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        os.write(self._wakeup_write, b"x")
+        self._thread.join()
+        self._close()
+
+    def discard(self) -> None:
+        """Releases a backend that was never started."""
+        self._close()
+
+    def _close(self) -> None:
+        for fd in (self._fd, self._wakeup_read, self._wakeup_write):
+            os.close(fd)
+
+    def _watch_tree(self, start: Path) -> list[Path]:
+        watched = []
+        for directory in _watched_directories(self._matcher, start):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if wd < 0:
+                errno = ctypes.get_errno()
+                if directory == start and start == self._root:
+                    raise OSError(errno, f"cannot watch {directory}")
+                logger.warning("Cannot watch %s: %s", directory, os.strerror(errno))
+                continue
+            self._directories[wd] = directory
+            watched.append(directory)
+        return watched
+
+    def _run(self) -> None:
+        while True:
+            readable, _, _ = select.select([self._fd, self._wakeup_read], [], [])
+            if self._wakeup_read in readable:
+                return
+            changes: set[FileChange] = set()
+            deadline = time.monotonic() + MAX_BURST_SECONDS
+            while True:
+                self._read_events(changes)
+                # Keep collecting while a burst of events is still arriving.
+                readable, _, _ = select.select(
+                    [self._fd, self._wakeup_read], [], [], COALESCE_SECONDS
+                )
+                if self._fd not in readable or time.monotonic() > deadline:
+                    break
+            if changes:
+                self._publish(changes)
+            if self._wakeup_read in readable:
+                return
+
+    def _read_events(self, changes: set[FileChange]) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            self._handle_event(wd, mask, os.fsdecode(name), changes)
+
+    def _handle_event(
+        self, wd: int, mask: int, name: str, changes: set[FileChange]
+    ) -> None:
+        if mask & IN_Q_OVERFLOW:
+            changes.add(FileChange(self._root, ChangeKind.RESCAN))
+            return
+        if mask & IN_IGNORED:
+            self._directories.pop(wd, None)
+            return
+        directory = self._directories.get(wd)
+        if directory is None or mask & IN_DELETE_SELF:
+            return
+
+        path = directory / name if name else directory
+        if name == GITIGNORE:
+            self._matcher = GitignoreMatcher(self._root)
+        if _is_ignored(self._matcher, path, bool(mask & IN_ISDIR)):
+            return
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            changes.add(FileChange(path, ChangeKind.CREATED))
+            if mask & IN_ISDIR:
+                # Entries created before the watch was added are reported too.
+                for watched in self._watch_tree(path):
+                    try:
+                        with os.scandir(watched) as entries:
+                            for entry in entries:
+                                created = Path(entry.path)
+                                is_dir = entry.is_dir(follow_symlinks=False)
+                                if not _is_ignored(self._matcher, created, is_dir):
+                                    changes.add(FileChange(created, ChangeKind.CREATED))
+                    except OSError:
+                        continue
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            changes.add(FileChange(path, ChangeKind.DELETED))
+        else:
+            changes.add(FileChange(path, ChangeKind.MODIFIED))
+
+
+class _PollingBackend:
+    name = "polling"
+
+    def __init__(self, root: Path, publish: ChangeSubscriber, interval: float):
+        self._root = root
+        self._publish = publish
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._snapshot = self._take_snapshot()
+        self._thread = threading.Thread(
+            target=self._run, name="workspace-watcher", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def discard(self) -> None:
+        """Releases a backend that was never started."""
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            snapshot = self._take_snapshot()
+            changes = self._compare(self._snapshot, snapshot)
+            self._snapshot = snapshot
+            if changes:
+                self._publish(changes)
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        matcher = GitignoreMatcher(self._root)
+        for directory in _watched_directories(matcher, self._root):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            if _is_ignored(matcher, Path(entry.path), is_dir):
+                                continue
+                            if is_dir:
+                                # Only their entries count, as with inotify.
+                                snapshot[Path(entry.path)] = (0, 0)
+                                continue
+                            stat = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    @staticmethod
+    def _compare(
+        before: dict[Path, tuple[int, int]], after: dict[Path, tuple[int, int]]
+    ) -> set[FileChange]:
+        changes = set()
+        for path, stat in after.items():
+            previous = before.get(path)
+            if previous is None:
+                changes.add(FileChange(path, ChangeKind.CREATED))
+            elif previous != stat:
+                changes.add(FileChange(path, ChangeKind.MODIFIED))
+        for path in before.keys() - after.keys():
+            changes.add(FileChange(path, ChangeKind.DELETED))
+        return changes
@@ -1,12 +1,16 @@
 #!/usr/bin/env -S uv run --script
 
+from __future__ import annotations
+
 import argparse
 import asyncio
 import io
+import json
 import os
 import sys
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from simple_agent.application.agent_factory import AgentFactory
 from simple_agent.application.agent_id import AgentId
@@ -18,32 +22,57 @@ from simple_agent.application.event_bus import SimpleEventBus
 from simple_agent.application.event_store import NoOpEventStore
 from simple_agent.application.events import UserPromptRequestedEvent
 from simple_agent.application.llm_stub import StubLLMProvider
+from simple_agent.application.native_tool_syntax import NativeToolSyntax
 from simple_agent.application.session import Session, SessionArgs
+from simple_agent.application.session_metrics import ModelPrice, SessionMetrics
 from simple_agent.application.tool_documentation import generate_tools_documentation
 from simple_agent.application.tool_library_factory import ToolContext
+from simple_agent.application.tool_output_budget import ToolOutputBudget
+from simple_agent.application.tracing import tracer
 from simple_agent.application.user_input import DummyUserInput
 from simple_agent.infrastructure.agent_library import create_agent_library
 from simple_agent.infrastructure.event_logger import EventLogger
+from simple_agent.infrastructure.file_artifact_store import FileArtifactStore
+from simple_agent.infrastructure.file_cache import file_cache
 from simple_agent.infrastructure.file_event_store import FileEventStore
 from simple_agent.infrastructure.file_session_storage import FileSessionStorage
 from simple_agent.infrastructure.file_system_todo_cleanup import FileSystemTodoCleanup
-from simple_agent.infrastructure.llm import RemoteLLMProvider
+from simple_agent.infrastructure.headless_display import HeadlessDisplay
+from simple_agent.infrastructure.llm import RemoteLLMProvider, adapter_module
+from simple_agent.infrastructure.native_file_searcher import NativeFileSearcher
 from simple_agent.infrastructure.non_interactive_user_input import (
     NonInteractiveUserInput,
 )
 from simple_agent.infrastructure.project_tree import FileSystemProjectTree
+from simple_agent.infrastructure.startup_profile import (
+    format_startup_report,
+    measure_imports,
+)
 from simple_agent.infrastructure.subscribe_events import (
     subscribe_events,
     subscribe_persistence,
 )
-from simple_agent.infrastructure.textual.textual_app import TextualApp
-from simple_agent.infrastructure.textual.textual_user_input import TextualUserInput
+from simple_agent.infrastructure.trace_file import trace_file_name, write_trace
 from simple_agent.infrastructure.user_configuration import (
     ConfigurationError,
     UserConfiguration,
 )
-from simple_agent.logging_config import setup_logging
+from simple_agent.infrastructure.workspace_watcher import (
+    ChangeKind,
+    FileChange,
+    WorkspaceWatcher,
+)
+from simple_agent.logging_config import get_logger, setup_logging
 from simple_agent.tools.all_tools import AllToolsFactory
+from simple_agent.tools.workspace_index import WorkspaceIndex
+
+if TYPE_CHECKING:
+    from simple_agent.application.tool_syntax import ToolSyntax
+    from simple_agent.infrastructure.textual.textual_app import TextualApp
+
+logger = get_logger(__name__)
+
+TEXTUAL_APP_MODULE = "simple_agent.infrastructure.textual.textual_app"
 
 
 class TextualRunStrategy(Protocol):
@@ -88,9 +117,17 @@ async def _run_main(
         setup_logging(user_config=user_config)
         return print_system_prompt_command(user_config, cwd, args)
 
-    if args.non_interactive:
+    if args.profile_startup:
+        return print_startup_profile_command(user_config, args)
+
+    headless = args.display_type != DisplayType.TEXTUAL
+    if args.non_interactive or headless:
         textual_user_input = NonInteractiveUserInput()
     else:
+        from simple_agent.infrastructure.textual.textual_user_input import (
+            TextualUserInput,
+        )
+
         textual_user_input = TextualUserInput()
 
     agent_library = create_agent_library(user_config, args)
@@ -104,6 +141,9 @@ async def _run_main(
         user_config=user_config,
         log_file=session_storage.session_root() / "session.log",
     )
+    trace_path = session_storage.session_root() / trace_file_name()
+    if args.trace:
+        tracer.start()
     todo_cleanup = FileSystemTodoCleanup(session_storage.session_root())
     event_store = FileEventStore(session_storage.session_root())
 
@@ -112,9 +152,22 @@ async def _run_main(
 
     event_logger = EventLogger()
     event_bus = SimpleEventBus()
+    metrics = SessionMetrics(event_bus, _model_prices(user_config))
 
-    tool_syntax = EmojiBracketToolSyntax()
-    tool_library_factory = AllToolsFactory(tool_syntax)
+    tool_syntax = create_tool_syntax(user_config)
+    output_budget = ToolOutputBudget(
+        FileArtifactStore(session_storage.session_root()),
+        user_config.tool_output_max_chars(),
+    )
+    agent_task_manager = AgentTaskManager(
+        user_config.max_running_agents(), user_config.max_running_agents_per_parent()
+    )
+    workspace_watcher = WorkspaceWatcher(Path(cwd))
+    workspace_watcher.subscribe(_invalidate_file_cache)
+    workspace_index = WorkspaceIndex(Path(cwd), watcher=workspace_watcher)
+    tool_library_factory = AllToolsFactory(
+        tool_syntax, output_budget, agent_task_manager, workspace_index
+    )
 
     if llm_provider is None:
         if args.stub_llm:
@@ -122,12 +175,17 @@ async def _run_main(
         else:
             llm_provider = RemoteLLMProvider(user_config)
 
-    project_tree = FileSystemProjectTree(Path(cwd))
+    project_tree = FileSystemProjectTree(Path(cwd), watcher=workspace_watcher)
 
     starting_agent_id = agent_library.starting_agent_id().with_root(
         session_storage.session_root()
     )
-    agent_task_manager = AgentTaskManager()
+
+    def on_replay_complete():
+        # Replayed events belong to earlier runs and are neither stored nor counted.
+        subscribe_persistence(event_bus, event_store)
+        metrics.subscribe()
+
     session = Session(
         starting_agent_id,
         event_bus=event_bus,
@@ -139,31 +197,100 @@ async def _run_main(
         project_tree=project_tree,
         event_store=event_store,
         agent_task_manager=agent_task_manager,
-        on_replay_complete=lambda: subscribe_persistence(event_bus, event_store),
+        on_replay_complete=on_replay_complete,
     )
+    if headless:
+        display = HeadlessDisplay(args.display_type)
+        subscribe_events(event_bus, event_logger, todo_cleanup)
+        display.subscribe(event_bus)
+        workspace_watcher.start_in_background()
+        try:
+            result = await session.run_async(args)
+        finally:
+            workspace_watcher.stop()
+            workspace_index.flush()
+            _write_trace(trace_path)
+            _write_stats(session_storage.session_root(), metrics)
+        logger.info("File cache: %s", file_cache.stats())
+        return display.exit_code(result)
+
+    from simple_agent.infrastructure.textual.textual_app import TextualApp
+
     textual_app = TextualApp(
         textual_user_input,
         starting_agent_id,
         agent_task_manager=agent_task_manager,
         available_models=llm_provider.get_available_models(),
         available_agents=agent_library.list_agent_types(),
+        file_searcher=NativeFileSearcher(Path(cwd), watcher=workspace_watcher),
     )
     subscribe_events(event_bus, event_logger, todo_cleanup, textual_app)
     if event_subscriber:
         event_subscriber(event_bus, textual_app)
 
     async def run_session():
+        # Walking the tree for the watcher would delay the first frame.
+        workspace_watcher.start_in_background()
         await session.run_async(args)
+        logger.info("File cache: %s", file_cache.stats())
+
+    try:
+        return await run_strategy.run(textual_app, run_session)
+    finally:
+        workspace_watcher.stop()
+        workspace_index.flush()
+        _write_trace(trace_path)
+        _write_stats(session_storage.session_root(), metrics)
+
 
-    return await run_strategy.run(textual_app, run_session)
+def create_tool_syntax(user_config: UserConfiguration) -> ToolSyntax:
+    if user_config.tool_syntax() == "native":
+        return NativeToolSyntax()
+    return EmojiBracketToolSyntax()
+
+
+def _model_prices(user_config: UserConfiguration) -> dict[str, ModelPrice]:
+    try:
+        return user_config.models_registry().prices()
+    except ValueError:
+        # Without a models section only the stub LLM can run, it has no cost.
+        return {}
+
+
+def _write_stats(session_root: Path, metrics: SessionMetrics) -> None:
+    stats = {**metrics.snapshot(), "file_cache": asdict(file_cache.stats())}
+    try:
+        (session_root / "stats.json").write_text(
+            json.dumps(stats, indent=2), encoding="utf-8"
+        )
+    except OSError as error:
+        # Runs while the session shuts down, it must not hide the real outcome.
+        logger.warning("Could not write session stats: %s", error)
+
+
+def _write_trace(trace_path: Path) -> None:
+    path = write_trace(trace_path)
+    if path is not None:
+        logger.info("Trace written to %s", path)
+
+
+def _invalidate_file_cache(changes: set[FileChange]) -> None:
+    for change in changes:
+        if change.kind == ChangeKind.RESCAN:
+            file_cache.clear()
+        else:
+            file_cache.invalidate(change.path)
 
 
 def main():
     try:
-        return asyncio.run(_run_main(ProductionTextualRunStrategy()))
+        result = asyncio.run(_run_main(ProductionTextualRunStrategy()))
     except ConfigurationError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
+    if isinstance(result, int):
+        sys.exit(result)
+    return result
 
 
 async def main_async(on_user_prompt_requested=None, llm_provider=None):
@@ -186,7 +313,7 @@ async def main_async(on_user_prompt_requested=None, llm_provider=None):
 
 
 def print_system_prompt_command(user_config, cwd, args):
-    tool_syntax = EmojiBracketToolSyntax()
+    tool_syntax = create_tool_syntax(user_config)
     tool_library_factory = AllToolsFactory(tool_syntax)
     dummy_event_bus = SimpleEventBus()
     agent_library = create_agent_library(user_config, args)
@@ -215,6 +342,16 @@ def print_system_prompt_command(user_config, cwd, args):
     return
 
 
+def print_startup_profile_command(user_config, args):
+    modules = ["simple_agent.main"]
+    if not args.stub_llm:
+        adapter = user_config.models_registry().get(None).adapter
+        modules.append(adapter_module(adapter))
+    if args.display_type == DisplayType.TEXTUAL:
+        modules.append(TEXTUAL_APP_MODULE)
+    print(format_startup_report(measure_imports(modules)))
+
+
 def parse_args(argv=None) -> SessionArgs:
     parser = argparse.ArgumentParser(description="Simple Agent")
     parser.add_argument(
@@ -235,20 +372,52 @@ def parse_args(argv=None) -> SessionArgs:
         action="store_true",
         help="Run in non-interactive mode (no user input prompts)",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without the terminal UI, printing events to stdout; "
+        "the exit code reports whether the task succeeded",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Run headless and print events as JSON lines",
+    )
     parser.add_argument("--stub", action="store_true", help="Use LLM stub for testing")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the import time of every module loaded at startup and exit",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record where each turn spends its time as a Chrome trace "
+        "in the session directory, viewable in Perfetto",
+    )
     parser.add_argument("message", nargs="*", help="Message to send to the agent")
     parsed = parser.parse_args(argv)
     return SessionArgs(
         bool(getattr(parsed, "continue")),
         build_start_message(parsed.message),
         bool(parsed.system_prompt),
-        DisplayType.TEXTUAL,
+        _display_type(parsed),
         bool(parsed.stub),
         bool(parsed.non_interactive),
         parsed.agent,
+        bool(parsed.profile_startup),
+        bool(parsed.trace),
     )
 
 
+def _display_type(parsed) -> DisplayType:
+    if parsed.json:
+        return DisplayType.JSON
+    if parsed.headless:
+        return DisplayType.TEXT
+    return DisplayType.TEXTUAL
+
+
 def build_start_message(message_parts):
     if not message_parts:
         return None
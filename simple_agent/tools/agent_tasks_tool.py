@@ -0,0 +1,25 @@
+from simple_agent.application.agent_task_manager import (
+    AgentTaskManager,
+    format_task_report,
+)
+from simple_agent.application.tool_results import SingleToolResult
+
+from .base_tool import BaseTool
+
+
+class AgentTasksTool(BaseTool):
+    name = "agent-tasks"
+    description = "List the asynchronously started agents with their state (queued, running, finished, cancelled, failed) and how long each has been queued, running and waiting for the LLM."
+    examples = [
+        {
+            "reasoning": "I started async subagents and want to know whether they are done.",
+            "result": "Agent: running (queued 0.0s, running 95.2s, llm 40.1s)\nAgent/Coding: finished (queued 0.0s, running 31.7s, llm 20.4s)\nAgent/Coding-2: queued (queued 12.3s, running 0.0s, llm 0.0s)",
+        },
+    ]
+
+    def __init__(self, agent_task_manager: AgentTaskManager):
+        super().__init__()
+        self._agent_task_manager = agent_task_manager
+
+    async def execute(self, raw_call):
+        return SingleToolResult(format_task_report(self._agent_task_manager.snapshot()))
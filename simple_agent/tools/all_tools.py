@@ -1,4 +1,6 @@
+from simple_agent.application.agent_task_manager import AgentTaskManager
 from simple_agent.application.agent_types import AgentTypes
+from simple_agent.application.llm import ToolUse
 from simple_agent.application.subagent_spawner import SubagentSpawner
 from simple_agent.application.tool_library import (
     MessageAndParsedTools,
@@ -11,15 +13,23 @@ from simple_agent.application.tool_library_factory import (
     ToolLibraryFactory,
 )
 from simple_agent.application.tool_message_parser import parse_tool_calls
+from simple_agent.application.tool_output_budget import ToolOutputBudget
 from simple_agent.application.tool_syntax import ToolSyntax
 
+from .agent_tasks_tool import AgentTasksTool
 from .bash_tool import BashTool
+from .batch_replace_file_content_tool import BatchReplaceFileContentTool
 from .cat_tool import CatTool
 from .complete_task_tool import CompleteTaskTool
 from .create_file_tool import CreateFileTool
 from .ls_tool import LsTool
+from .parallel_subagents_tool import ParallelSubagentsTool
+from .read_artifact_tool import ReadArtifactTool
+from .read_many_tool import ReadManyTool
 from .replace_file_content_tool import ReplaceFileContentTool
+from .search_tool import SearchTool
 from .subagent_tool import SubagentTool
+from .workspace_index import WorkspaceIndex
 from .write_todos_tool import WriteTodosTool
 
 
@@ -30,11 +40,17 @@ class AllTools(ToolLibrary):
         spawner: SubagentSpawner,
         agent_types: AgentTypes,
         tool_syntax: ToolSyntax,
+        output_budget: ToolOutputBudget | None = None,
+        agent_task_manager: AgentTaskManager | None = None,
+        workspace_index: WorkspaceIndex | None = None,
     ):
         self.tool_context = tool_context
         self._spawner = spawner
         self._agent_types = agent_types
         self.tool_syntax = tool_syntax
+        self._output_budget = output_budget
+        self._agent_task_manager = agent_task_manager
+        self._workspace_index = workspace_index
         self.tool_keys = tool_context.tool_keys if tool_context.tool_keys else []
 
         static_tools = self._create_static_tools()
@@ -49,11 +65,25 @@ class AllTools(ToolLibrary):
             ),
             "ls": lambda: LsTool(),
             "cat": lambda: CatTool(),
+            "read_many": lambda: ReadManyTool(self._output_budget),
+            "search": lambda: SearchTool(self._workspace_index),
             "create_file": lambda: CreateFileTool(),
             "replace_file_content": lambda: ReplaceFileContentTool(),
+            "batch_replace_file_content": lambda: BatchReplaceFileContentTool(),
             "complete_task": lambda: CompleteTaskTool(),
             "bash": lambda: BashTool(),
             "subagent": lambda: SubagentTool(self._spawner, self._agent_types),
+            "parallel_subagents": lambda: ParallelSubagentsTool(
+                self._spawner, self._agent_types
+            ),
+            "read_artifact": lambda: (
+                ReadArtifactTool(self._output_budget) if self._output_budget else None
+            ),
+            "agent_tasks": lambda: (
+                AgentTasksTool(self._agent_task_manager)
+                if self._agent_task_manager
+                else None
+            ),
         }
 
         if not self.tool_keys:
@@ -80,16 +110,41 @@ class AllTools(ToolLibrary):
 
         return MessageAndParsedTools(message=parsed.message, tools=tools)
 
+    def resolve_tool_uses(
+        self, message: str, tool_uses: list[ToolUse]
+    ) -> MessageAndParsedTools:
+        tools = []
+        for tool_use in tool_uses:
+            tool_instance = self.tool_dict.get(tool_use.name)
+            if not tool_instance:
+                return MessageAndParsedTools(message=message, tools=[])
+            raw_call = self.tool_syntax.to_raw_call(tool_use, tool_instance)
+            tools.append(ParsedTool(raw_call, tool_instance))
+
+        return MessageAndParsedTools(message=message, tools=tools)
+
     async def execute_parsed_tool(self, parsed_tool):
-        return await parsed_tool.tool_instance.execute(parsed_tool.raw_call)
+        result = await parsed_tool.tool_instance.execute(parsed_tool.raw_call)
+        if self._output_budget:
+            return self._output_budget.apply(result)
+        return result
 
     def _discover_dynamic_tools(self):
         return []
 
 
 class AllToolsFactory(ToolLibraryFactory):
-    def __init__(self, tool_syntax: ToolSyntax):
+    def __init__(
+        self,
+        tool_syntax: ToolSyntax,
+        output_budget: ToolOutputBudget | None = None,
+        agent_task_manager: AgentTaskManager | None = None,
+        workspace_index: WorkspaceIndex | None = None,
+    ):
         self.tool_syntax = tool_syntax
+        self.output_budget = output_budget
+        self.agent_task_manager = agent_task_manager
+        self.workspace_index = workspace_index
 
     def create(
         self,
@@ -97,4 +152,12 @@ class AllToolsFactory(ToolLibraryFactory):
         spawner: SubagentSpawner,
         agent_types: AgentTypes,
     ) -> ToolLibrary:
-        return AllTools(tool_context, spawner, agent_types, self.tool_syntax)
+        return AllTools(
+            tool_context,
+            spawner,
+            agent_types,
+            self.tool_syntax,
+            self.output_budget,
+            self.agent_task_manager,
+            self.workspace_index,
+        )
@@ -1,4 +1,10 @@
 import shlex
+from collections.abc import Iterable
+from typing import Any
+
+from ..application.tool_library import ToolArgument, argument_text
+
+FLAG_VALUES = ("true", "yes", "1")
 
 
 def create_lexer(text):
@@ -12,3 +18,37 @@ def create_lexer(text):
 def split_arguments(text):
     lexer = create_lexer(text)
     return list(lexer)
+
+
+def join_arguments(
+    header: list[ToolArgument], values: dict[str, Any], flags: Iterable[str] = ()
+) -> str:
+    """Quotes structured header values so split_arguments() returns them unchanged.
+
+    Flags are written as their own name when set. A missing optional value
+    before a given one becomes an empty placeholder to keep later positions.
+    """
+    flags = set(flags)
+    tokens: list[str] = []
+    missing = 0
+    for arg in header:
+        value = values.get(arg.name)
+        if arg.name in flags:
+            if is_flag_set(value, arg.name):
+                tokens.append(arg.name)
+            continue
+        text = argument_text(value)
+        if not text:
+            missing += 1
+            continue
+        tokens += [""] * missing
+        missing = 0
+        tokens.append(text)
+    return shlex.join(tokens)
+
+
+def is_flag_set(value: Any, name: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = argument_text(value).strip().lower()
+    return text == name or text in FLAG_VALUES
@@ -1,8 +1,9 @@
 import asyncio
 import subprocess
 import time
+from typing import Any
 
-from simple_agent.application.tool_library import Tool, ToolArguments
+from simple_agent.application.tool_library import Tool, ToolArguments, argument_text
 from simple_agent.application.tool_results import ToolResult
 from simple_agent.application.tool_syntax import RawToolCall
 
@@ -63,6 +64,15 @@ class BaseTool(Tool):
     async def run_command_async(command, args=None, cwd=None):
         return await asyncio.to_thread(BaseTool.run_command, command, args, cwd)
 
+    def format_arguments(self, values: dict[str, Any]) -> str:
+        """Joins the header values in order, for tools that read their arguments as text.
+
+        Tools that split their arguments with split_arguments() quote them
+        with join_arguments() instead.
+        """
+        texts = [argument_text(values.get(arg.name)) for arg in self.arguments.header]
+        return " ".join(text for text in texts if text)
+
     def get_template_variables(self) -> dict[str, str]:
         """Return variables to substitute in documentation templates.
 
@@ -9,7 +9,7 @@ from .base_tool import BaseTool
 
 class BashTool(BaseTool):
     name = "bash"
-    description = "Execute bash commands. Tip: Avoid grep, but use ripgrep (the rg command) for search. To run a command in the background, end it with an ampersand (&)."
+    description = "Execute bash commands. Tip: To find text in the workspace prefer the search tool; otherwise avoid grep, but use ripgrep (the rg command). To run a command in the background, end it with an ampersand (&)."
     arguments = ToolArguments(
         header=[
             ToolArgument(
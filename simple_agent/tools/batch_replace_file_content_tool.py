@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+
+from ..application.tool_library import ToolArgument, ToolArguments
+from ..application.tool_results import SingleToolResult, ToolResultStatus
+from .argument_parser import split_arguments
+from .base_tool import BaseTool
+from .file_patch import FilePatch, Hunk, PartialWriteError, write_atomically
+from .replace_file_content_tool import ReplaceFileContentTool
+
+HUNK_MARKER = "📄"
+SEPARATOR = "@@@"
+
+
+@dataclass
+class FileHunk:
+    filename: str
+    hunk: Hunk
+
+
+class BatchReplaceFileContentTool(BaseTool):
+    name = "batch-replace-file-content"
+    description = "Apply many exact string replacements, across one or more files, in a single call. All replacements are validated before anything is written; if any of them fails, no file is modified."
+
+    arguments = ToolArguments(
+        header=[],
+        body=ToolArgument(
+            name="hunks",
+            type="string",
+            required=True,
+            description=f"One or more hunks. Each hunk starts with a line '{HUNK_MARKER} <filename> [single|all]', followed by the search string, a line containing only {SEPARATOR}, and the replacement string. Search strings are matched against the file as it was before the call and must not overlap.",
+        ),
+    )
+
+    examples = [
+        {
+            "reasoning": "I'll rename a function and update its caller in one step.",
+            "hunks": f"{HUNK_MARKER} src/math.py\ndef add(a, b):\n{SEPARATOR}\ndef plus(a, b):\n{HUNK_MARKER} src/main.py all\nadd(\n{SEPARATOR}\nplus(",
+            "result": "Successfully applied 2 replacements to 2 files",
+        },
+    ]
+
+    async def execute(self, raw_call):
+        hunks, error = self.parse_hunks(raw_call.body)
+        if error or hunks is None:
+            return SingleToolResult(
+                error or "Failed to parse hunks", status=ToolResultStatus.FAILURE
+            )
+
+        patches: dict[str, FilePatch] = {}
+        for index, file_hunk in enumerate(hunks, start=1):
+            try:
+                patch = patches.get(file_hunk.filename)
+                if patch is None:
+                    patch = FilePatch.load(file_hunk.filename)
+                    patches[file_hunk.filename] = patch
+                patch.add(file_hunk.hunk)
+            except (ValueError, OSError) as e:
+                return SingleToolResult(
+                    f"Hunk {index} ({file_hunk.filename}): {str(e)}\nNo files were modified.",
+                    status=ToolResultStatus.FAILURE,
+                )
+
+        try:
+            write_atomically(list(patches.values()))
+        except PartialWriteError as e:
+            return SingleToolResult(
+                f"Error writing replacements: {str(e)}\n"
+                f"Files left modified: {', '.join(e.modified)}",
+                status=ToolResultStatus.FAILURE,
+            )
+        except OSError as e:
+            return SingleToolResult(
+                f"Error writing replacements: {str(e)}\nNo files were modified.",
+                status=ToolResultStatus.FAILURE,
+            )
+
+        diffs = [
+            ReplaceFileContentTool._format_diff(diff_lines)
+            for diff_lines in (patch.build_diff() for patch in patches.values())
+            if diff_lines
+        ]
+        if not diffs:
+            summary = f"No changes made to {', '.join(patches)}"
+            return SingleToolResult(summary, display_body=summary)
+
+        changed_files = sum(1 for patch in patches.values() if patch.changed)
+        summary = (
+            f"Successfully applied {len(hunks)} replacements to {changed_files} files"
+        )
+        diff_message = "\n".join(diffs)
+        return SingleToolResult(
+            f"{summary}\n\n{diff_message}",
+            display_body=diff_message,
+            display_language="diff",
+        )
+
+    @staticmethod
+    def parse_hunks(body) -> tuple[list[FileHunk], None] | tuple[None, str]:
+        if not body or not body.strip():
+            return None, "batch-replace-file-content requires at least one hunk"
+
+        sections: list[tuple[str, list[str]]] = []
+        for line in body.split("\n"):
+            if line.startswith(HUNK_MARKER):
+                sections.append((line[len(HUNK_MARKER) :].strip(), []))
+            elif sections:
+                sections[-1][1].append(line)
+            elif line.strip():
+                return None, f"Content before the first '{HUNK_MARKER}' hunk header"
+
+        if not sections:
+            return (
+                None,
+                f"No hunks found. Start each hunk with '{HUNK_MARKER} <filename>'",
+            )
+
+        hunks = []
+        for index, (header, lines) in enumerate(sections, start=1):
+            try:
+                parts = split_arguments(header)
+            except ValueError as e:
+                return None, f"Hunk {index}: Error parsing header: {str(e)}"
+            if not parts:
+                return None, f"Hunk {index}: Missing filename"
+            if len(parts) > 2:
+                return None, f"Hunk {index}: Too many arguments in header"
+
+            replace_mode = parts[1] if len(parts) > 1 else "single"
+            if replace_mode not in ["single", "all"]:
+                return None, f"Hunk {index}: Invalid replace_mode: {replace_mode}"
+
+            if lines.count(SEPARATOR) != 1:
+                return (
+                    None,
+                    f"Hunk {index}: Expected exactly one '{SEPARATOR}' line between search and replacement content",
+                )
+            separator = lines.index(SEPARATOR)
+            old_string = "\n".join(lines[:separator]).rstrip("\n")
+            new_string = "\n".join(lines[separator + 1 :]).rstrip("\n")
+            if not old_string:
+                return None, f"Hunk {index}: Search string must not be empty"
+
+            hunks.append(FileHunk(parts[0], Hunk(old_string, new_string, replace_mode)))
+
+        return hunks, None
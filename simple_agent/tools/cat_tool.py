@@ -1,6 +1,10 @@
+import io
+
+from simple_agent.infrastructure.file_cache import file_cache
+
 from ..application.tool_library import ToolArgument, ToolArguments
 from ..application.tool_results import SingleToolResult, ToolResultStatus
-from .argument_parser import split_arguments
+from .argument_parser import join_arguments, split_arguments
 from .base_tool import BaseTool
 
 
@@ -39,6 +43,11 @@ class CatTool(BaseTool):
         {"filename": "script.py", "with_line_numbers": "with_line_numbers"},
     ]
 
+    def format_arguments(self, values):
+        return join_arguments(
+            self.arguments.header, values, flags=("with_line_numbers",)
+        )
+
     def _parse_arguments(self, args):
         if not args:
             return None, None, False, "STDERR: cat: missing file operand"
@@ -97,29 +106,27 @@ class CatTool(BaseTool):
             output, success = self._read_file_range(
                 filename, start_line, end_line, with_line_numbers
             )
-            status = ToolResultStatus.SUCCESS if success else ToolResultStatus.FAILURE
-            return SingleToolResult(output, status=status)
-        elif with_line_numbers:
-            result = await self.run_command_async("cat", ["-n", filename])
-            status = (
-                ToolResultStatus.SUCCESS
-                if result["success"]
-                else ToolResultStatus.FAILURE
-            )
-            return SingleToolResult(result["output"], status=status)
         else:
-            result = await self.run_command_async("cat", [filename])
-            status = (
-                ToolResultStatus.SUCCESS
-                if result["success"]
-                else ToolResultStatus.FAILURE
-            )
-            return SingleToolResult(result["output"], status=status)
+            output, success = self._read_file(filename, with_line_numbers)
+        status = ToolResultStatus.SUCCESS if success else ToolResultStatus.FAILURE
+        return SingleToolResult(output, status=status)
+
+    def _read_file(self, filename, with_line_numbers):
+        try:
+            lines = io.StringIO(file_cache.read_text(filename)).readlines()
+        except FileNotFoundError:
+            return f"STDERR: cat: {filename}: No such file or directory", False
+        except IsADirectoryError:
+            return f"STDERR: cat: {filename}: Is a directory", False
+        except UnicodeDecodeError:
+            return f"STDERR: cat: {filename}: not a UTF-8 text file", False
+        except OSError as e:
+            return f"STDERR: cat: {filename}: {e.strerror or e}", False
+        return self._format_output(lines, 0, len(lines), with_line_numbers), True
 
     def _read_file_range(self, filename, start_line, end_line, with_line_numbers):
         try:
-            with open(filename, encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = io.StringIO(file_cache.read_text(filename)).readlines()
 
             if not lines:
                 return "", True
@@ -1,5 +1,7 @@
 import os
 
+from simple_agent.infrastructure.file_cache import file_cache
+
 from ..application.tool_library import ToolArgument, ToolArguments
 from ..application.tool_results import SingleToolResult, ToolResultStatus
 from .base_tool import BaseTool
@@ -76,6 +78,7 @@ class CreateFileTool(BaseTool):
                 if content is not None:
                     # Write content as-is, no processing
                     f.write(content)
+            file_cache.invalidate(filename)
             if content is not None:
                 return SingleToolResult(
                     f"Created file: {filename} with content", display_body=content
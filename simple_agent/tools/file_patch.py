@@ -0,0 +1,273 @@
+import bisect
+import contextlib
+import difflib
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+
+from simple_agent.infrastructure.file_cache import file_cache
+
+CONTEXT_LINES = 3
+NOT_FOUND_MESSAGE = "Action Failed: File not modified. The provided text to be replaced was not found in the file. Please use 'cat' to verify the exact content before retrying."
+
+_RANGE_HEADER = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+class PartialWriteError(OSError):
+    """Renaming failed partway and some files could not be restored."""
+
+    def __init__(self, message: str, modified: list[str]):
+        super().__init__(message)
+        self.modified = modified
+
+
+@dataclass
+class Hunk:
+    old_string: str
+    new_string: str
+    replace_mode: str = "single"
+
+
+@dataclass(frozen=True)
+class _Span:
+    start: int
+    end: int
+    text: str
+
+    def overlaps(self, other: "_Span") -> bool:
+        if self.start == self.end == other.start == other.end:
+            return True
+        return self.start < other.end and other.start < self.end
+
+
+class FilePatch:
+    """All replacements for one file, matched against its original content.
+
+    Hunks never see each other's output: every search string is located in the
+    original text, overlapping matches are rejected, and the new content is
+    stitched together once. That keeps validation up front and lets the diff
+    be computed over the touched line windows only.
+    """
+
+    def __init__(self, filename: str, original_content: str):
+        self.filename = filename
+        self.original_content = original_content
+        self._spans: list[_Span] = []
+        self._new_content: str | None = None
+
+    @classmethod
+    def load(cls, filename: str) -> "FilePatch":
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f'File "{filename}" not found')
+
+        return cls(filename, file_cache.read_text(filename))
+
+    def add(self, hunk: Hunk) -> None:
+        starts = self._find(hunk.old_string, hunk.replace_mode)
+        if not starts:
+            raise ValueError(NOT_FOUND_MESSAGE)
+
+        spans = [
+            _Span(start, start + len(hunk.old_string), hunk.new_string)
+            for start in starts
+        ]
+        for span in spans:
+            if any(span.overlaps(existing) for existing in self._spans):
+                raise ValueError(
+                    "Action Failed: File not modified. Two replacements overlap in the same region. Combine them into a single replacement."
+                )
+        self._spans = sorted(self._spans + spans, key=lambda span: span.start)
+        self._new_content = None
+
+    def _find(self, old_string: str, replace_mode: str) -> list[int]:
+        content = self.original_content
+        first = content.find(old_string)
+        if first == -1:
+            return []
+        if replace_mode == "single":
+            return [first]
+        if replace_mode != "all":
+            raise ValueError(f"Invalid replace_mode: {replace_mode}")
+
+        starts = []
+        position = first
+        while position != -1:
+            starts.append(position)
+            position = content.find(old_string, position + max(len(old_string), 1))
+        return starts
+
+    @property
+    def new_content(self) -> str:
+        if self._new_content is None:
+            self._new_content = self._stitch(0, len(self.original_content))
+        return self._new_content
+
+    @property
+    def changed(self) -> bool:
+        return self.new_content != self.original_content
+
+    def _stitch(self, begin: int, end: int) -> str:
+        parts = []
+        position = begin
+        for span in self._spans:
+            if span.start < begin or span.end > end:
+                continue
+            parts.append(self.original_content[position : span.start])
+            parts.append(span.text)
+            position = span.end
+        parts.append(self.original_content[position:end])
+        return "".join(parts)
+
+    def build_diff(self) -> list[str]:
+        if not self.changed:
+            return []
+
+        lines = self.original_content.splitlines(keepends=True)
+        starts = _line_starts(lines)
+        header = [
+            f"--- {self.filename} (original)\n",
+            f"+++ {self.filename} (updated)\n",
+        ]
+
+        diff_lines: list[str] = []
+        line_delta = 0
+        for first, last in self._windows(lines, starts):
+            begin = starts[first] if first < len(lines) else len(self.original_content)
+            end = starts[last] if last < len(lines) else len(self.original_content)
+            new_lines = self._stitch(begin, end).splitlines(keepends=True)
+
+            context_first = max(0, first - CONTEXT_LINES)
+            context_last = min(len(lines), last + CONTEXT_LINES)
+            old_slice = lines[context_first:context_last]
+            new_slice = (
+                lines[context_first:first] + new_lines + lines[last:context_last]
+            )
+
+            window_diff = list(difflib.unified_diff(old_slice, new_slice))[2:]
+            diff_lines.extend(
+                _shift_range_header(line, context_first, context_first + line_delta)
+                for line in window_diff
+            )
+            line_delta += len(new_lines) - (last - first)
+
+        if not diff_lines:
+            return []
+        return header + diff_lines
+
+    def _windows(self, lines: list[str], starts: list[int]) -> list[tuple[int, int]]:
+        """Line ranges [first, last) touched by replacements, merged when their context would touch."""
+        windows: list[tuple[int, int]] = []
+        for span in self._spans:
+            first = self._line_of(span.start, lines, starts)
+            if span.end > span.start:
+                last = self._line_of(span.end - 1, lines, starts) + 1
+            else:
+                last = min(first + 1, len(lines))
+
+            if windows and first - windows[-1][1] <= 2 * CONTEXT_LINES:
+                previous_first, previous_last = windows[-1]
+                windows[-1] = (previous_first, max(previous_last, last))
+            else:
+                windows.append((first, last))
+        return windows
+
+    def _line_of(self, position: int, lines: list[str], starts: list[int]) -> int:
+        if position >= len(self.original_content):
+            if lines and lines[-1].splitlines()[0] == lines[-1]:
+                return len(lines) - 1
+            return len(lines)
+        return bisect.bisect_right(starts, position) - 1
+
+    def save(self) -> None:
+        write_atomically([self])
+
+
+def write_atomically(patches: list[FilePatch]) -> None:
+    """Stage every changed file next to its target, then rename them all into place.
+
+    Nothing is renamed until every file has been staged, so a failure while
+    writing leaves all targets untouched. When a rename fails, the files
+    already renamed are restored from their original content; the ones that
+    cannot be restored are reported in a PartialWriteError.
+    """
+    staged: list[tuple[str, FilePatch]] = []
+    try:
+        for patch in patches:
+            if patch.changed:
+                staged.append((_stage(patch.filename, patch.new_content), patch))
+    except BaseException:
+        _remove_staged(staged)
+        raise
+
+    replaced: list[FilePatch] = []
+    try:
+        for temp_path, patch in staged:
+            os.replace(temp_path, patch.filename)
+            replaced.append(patch)
+            file_cache.invalidate(patch.filename)
+    except OSError as error:
+        _remove_staged(staged[len(replaced) :])
+        modified = _restore(replaced)
+        if modified:
+            raise PartialWriteError(
+                f"{error}; could not restore {', '.join(modified)}", modified
+            ) from error
+        raise
+
+
+def _restore(patches: list[FilePatch]) -> list[str]:
+    """Writes back the original content, returns the files left modified."""
+    modified = []
+    for patch in patches:
+        try:
+            os.replace(_stage(patch.filename, patch.original_content), patch.filename)
+        except OSError:
+            modified.append(patch.filename)
+        file_cache.invalidate(patch.filename)
+    return modified
+
+
+def _remove_staged(staged: list[tuple[str, FilePatch]]) -> None:
+    for temp_path, _ in staged:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+def _stage(filename: str, content: str) -> str:
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(filename)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+        with contextlib.suppress(OSError):
+            shutil.copymode(filename, temp_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    return temp_path
+
+
+def _line_starts(lines: list[str]) -> list[int]:
+    starts = []
+    offset = 0
+    for line in lines:
+        starts.append(offset)
+        offset += len(line)
+    return starts
+
+
+def _shift_range_header(line: str, old_offset: int, new_offset: int) -> str:
+    match = _RANGE_HEADER.match(line)
+    if not match:
+        return line
+    old_start, old_length, new_start, new_length = match.groups()
+    return (
+        f"@@ -{int(old_start) + old_offset}{old_length or ''} "
+        f"+{int(new_start) + new_offset}{new_length or ''} @@"
+        f"{line[match.end() :]}"
+    )
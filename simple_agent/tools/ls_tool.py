@@ -1,11 +1,20 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from simple_agent.infrastructure.gitignore import GitignoreMatcher
+
 from ..application.tool_library import ToolArgument, ToolArguments
 from ..application.tool_results import SingleToolResult, ToolResultStatus
+from .argument_parser import join_arguments, split_arguments
 from .base_tool import BaseTool
 
+MAX_ENTRIES = 2000
+
 
 class LsTool(BaseTool):
     name = "ls"
-    description = "List directory contents with detailed information"
+    description = "List directory contents, optionally recursively, without gitignored files or with sizes"
     arguments = ToolArguments(
         header=[
             ToolArgument(
@@ -13,22 +22,162 @@ class LsTool(BaseTool):
                 type="string",
                 required=False,
                 description="Directory path to list (defaults to current directory)",
-            )
+            ),
+            ToolArgument(
+                name="depth",
+                type="string",
+                required=False,
+                description="Optional 'depth=N' to also list subdirectories down to N levels",
+            ),
+            ToolArgument(
+                name="respect_gitignore",
+                type="string",
+                required=False,
+                description="Optional parameter to leave out gitignored entries, e.g. 'respect_gitignore'",
+            ),
+            ToolArgument(
+                name="with_sizes",
+                type="string",
+                required=False,
+                description="Optional parameter to show file sizes in bytes, e.g. 'with_sizes'",
+            ),
         ]
     )
     examples = [
         {
             "reasoning": "I'll list files in the current directory.",
             "path": "",
-            "result": "total 48\ndrwxr-xr-x  5 user  staff   160 Dec 19 10:30 .\ndrwxr-xr-x 10 user  staff   320 Dec 19 10:25 ..\n-rw-r--r--  1 user  staff  1234 Dec 19 10:30 file.txt",
+            "result": ".\n..\nfile.txt\nsrc",
         },
         {"path": "/home/user"},
+        {
+            "reasoning": "I'll look at the source layout without build output.",
+            "path": "src",
+            "depth": "depth=2",
+            "respect_gitignore": "respect_gitignore",
+            "result": "app/\napp/main.py\nREADME.md",
+        },
     ]
 
+    def format_arguments(self, values):
+        depth = values.get("depth")
+        if depth is not None and not str(depth).startswith("depth="):
+            values = {**values, "depth": f"depth={depth}"}
+        return join_arguments(
+            self.arguments.header, values, flags=("respect_gitignore", "with_sizes")
+        )
+
     async def execute(self, raw_call):
-        path = raw_call.arguments if raw_call.arguments else "."
-        result = await self.run_command_async("ls", ["-a", path] if path else ["-a"])
-        status = (
-            ToolResultStatus.SUCCESS if result["success"] else ToolResultStatus.FAILURE
+        try:
+            path, depth, respect_gitignore, with_sizes = self._parse_arguments(
+                raw_call.arguments
+            )
+        except ValueError as exc:
+            return SingleToolResult(
+                f"STDERR: ls: {exc}", status=ToolResultStatus.FAILURE
+            )
+
+        if not os.path.exists(path):
+            return SingleToolResult(
+                f"STDERR: ls: cannot access '{path}': No such file or directory",
+                status=ToolResultStatus.FAILURE,
+            )
+        if not os.path.isdir(path):
+            return SingleToolResult(path)
+
+        matcher, prefix = (
+            self._gitignore_matcher(path) if respect_gitignore else (None, "")
         )
-        return SingleToolResult(result["output"], status=status)
+        structured = depth is not None or respect_gitignore or with_sizes
+        listing = _Listing(matcher, prefix, structured, with_sizes)
+        if not structured:
+            listing.lines += [".", ".."]
+        try:
+            complete = listing.add(path, "", depth or 1)
+        except OSError as e:
+            return SingleToolResult(
+                f"STDERR: ls: cannot open directory '{path}': {e.strerror or e}",
+                status=ToolResultStatus.FAILURE,
+            )
+        if not complete:
+            listing.lines.append(f"[... listing stopped after {MAX_ENTRIES} entries]")
+        return SingleToolResult("\n".join(listing.lines))
+
+    @staticmethod
+    def _parse_arguments(args) -> tuple[str, int | None, bool, bool]:
+        parts = split_arguments(args or "")
+        depth = None
+        respect_gitignore = with_sizes = False
+        # Options follow the path, which may contain unquoted spaces.
+        while parts:
+            part = parts[-1]
+            if part == "respect_gitignore":
+                respect_gitignore = True
+            elif part == "with_sizes":
+                with_sizes = True
+            elif part.startswith("depth="):
+                try:
+                    depth = int(part.removeprefix("depth="))
+                except ValueError:
+                    depth = 0
+                if depth < 1:
+                    raise ValueError(f"invalid depth '{part}', expected depth=N")
+            else:
+                break
+            parts.pop()
+        path = " ".join(parts) or "."
+        return path, depth, respect_gitignore, with_sizes
+
+    @staticmethod
+    def _gitignore_matcher(path: str) -> tuple[GitignoreMatcher, str]:
+        relative = os.path.relpath(os.path.abspath(path))
+        if relative == "." or relative.startswith(".."):
+            return GitignoreMatcher(Path(path), ignore_hidden=False), ""
+        return (
+            GitignoreMatcher(Path.cwd(), ignore_hidden=False),
+            Path(relative).as_posix() + "/",
+        )
+
+
+@dataclass
+class _Listing:
+    matcher: GitignoreMatcher | None
+    prefix: str
+    structured: bool
+    with_sizes: bool
+    lines: list[str] = field(default_factory=list)
+
+    def add(self, directory: str, relative: str, depth: int) -> bool:
+        """Appends the entries below directory, returns False once capped."""
+        with os.scandir(directory) as scanned:
+            entries = sorted(scanned, key=lambda entry: entry.name)
+        for entry in entries:
+            name = relative + entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if self.matcher and self.matcher.is_ignored(self.prefix + name, is_dir):
+                continue
+            if len(self.lines) >= MAX_ENTRIES:
+                return False
+            self.lines.append(self._format(entry, name, is_dir))
+            if is_dir and depth > 1:
+                try:
+                    if not self.add(entry.path, name + "/", depth - 1):
+                        return False
+                except OSError:
+                    continue
+        return True
+
+    def _format(self, entry: os.DirEntry, name: str, is_dir: bool) -> str:
+        if not self.structured:
+            return name
+        if is_dir:
+            name += "/"
+        if not self.with_sizes:
+            return name
+        if is_dir:
+            return f"{'-':>10}  {name}"
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            return f"{'?':>10}  {name}"
+        return f"{size:>10}  {name}"
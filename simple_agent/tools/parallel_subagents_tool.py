@@ -0,0 +1,159 @@
+import asyncio
+from dataclasses import dataclass
+
+from simple_agent.application.agent_types import AgentTypes
+from simple_agent.application.subagent_spawner import SubagentSpawner
+from simple_agent.application.tool_library import ToolArgument, ToolArguments
+from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
+
+from ..application.agent_type import AgentType
+from .base_tool import BaseTool
+
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_TIMEOUT_SECONDS = 600
+
+
+@dataclass
+class SubagentTask:
+    agent_type: str
+    description: str
+
+
+@dataclass
+class SubagentOutcome:
+    task: SubagentTask
+    success: bool
+    message: str
+
+
+class ParallelSubagentsTool(BaseTool):
+    name = "parallel-subagents"
+    description = "Runs several independent tasks at the same time, one subagent per task, and reports all of their results together once every subagent has finished. Use it instead of consecutive subagent calls when the tasks do not depend on each other."
+    arguments = ToolArguments(
+        header=[
+            ToolArgument(
+                name="max_parallel",
+                type="integer",
+                required=False,
+                description=f"Maximum number of subagents running at once (default {DEFAULT_MAX_PARALLEL})",
+            ),
+            ToolArgument(
+                name="timeout_seconds",
+                type="integer",
+                required=False,
+                description=f"Deadline for each subagent in seconds (default {DEFAULT_TIMEOUT_SECONDS})",
+            ),
+        ],
+        body=ToolArgument(
+            name="tasks",
+            type="string",
+            required=True,
+            description="One task per line: the agent type followed by the task description. {{AGENT_TYPES}}",
+        ),
+    )
+    examples = [
+        {
+            "reasoning": "Three modules can be reviewed independently, so I review them in parallel:",
+            "tasks": "coding Review parser.py for error handling\ncoding Review lexer.py for error handling\ncoding Review printer.py for error handling",
+            "result": "3 of 3 subagents succeeded\n\n## Task 1 (coding): Review parser.py for error handling\n✅ ...",
+        },
+    ]
+
+    def __init__(self, spawn_subagent: SubagentSpawner, agent_types: AgentTypes):
+        super().__init__()
+        self._spawn_subagent = spawn_subagent
+        self._agent_types = agent_types
+
+    async def execute(self, raw_call):
+        limits, error = self._parse_limits(raw_call.arguments)
+        if error or limits is None:
+            return SingleToolResult(
+                f"STDERR: parallel-subagents: {error}", status=ToolResultStatus.FAILURE
+            )
+        max_parallel, timeout = limits
+
+        tasks, error = self._parse_tasks(raw_call.body)
+        if error:
+            return SingleToolResult(
+                f"STDERR: parallel-subagents: {error}", status=ToolResultStatus.FAILURE
+            )
+        if not tasks:
+            return SingleToolResult(
+                "STDERR: parallel-subagents: no tasks given, expected one '<agenttype> <task description>' per line",
+                status=ToolResultStatus.FAILURE,
+            )
+
+        semaphore = asyncio.Semaphore(max_parallel)
+        outcomes = await asyncio.gather(
+            *(self._run(task, semaphore, timeout) for task in tasks)
+        )
+        succeeded = sum(1 for outcome in outcomes if outcome.success)
+        status = (
+            ToolResultStatus.SUCCESS
+            if succeeded == len(outcomes)
+            else ToolResultStatus.FAILURE
+        )
+        return SingleToolResult(self._format(outcomes, succeeded), status=status)
+
+    async def _run(
+        self, task: SubagentTask, semaphore: asyncio.Semaphore, timeout: float
+    ) -> SubagentOutcome:
+        async with semaphore:
+            try:
+                result = await self._spawn_subagent(
+                    AgentType(task.agent_type),
+                    task.description,
+                    until_complete=True,
+                    timeout=timeout,
+                )
+                return SubagentOutcome(task, result.success, str(result))
+            except TimeoutError:
+                return SubagentOutcome(task, False, f"timed out after {timeout:g}s")
+            except Exception as e:
+                return SubagentOutcome(task, False, f"subagent error: {str(e)}")
+
+    @staticmethod
+    def _parse_limits(arguments) -> tuple[tuple[int, float] | None, str | None]:
+        parts = (arguments or "").split()
+        if len(parts) > 2:
+            return None, "too many arguments, expected [max_parallel] [timeout_seconds]"
+        try:
+            max_parallel = int(parts[0]) if parts else DEFAULT_MAX_PARALLEL
+            timeout = float(parts[1]) if len(parts) > 1 else DEFAULT_TIMEOUT_SECONDS
+        except ValueError:
+            return None, f"invalid limits '{arguments.strip()}', expected numbers"
+        if max_parallel < 1 or timeout <= 0:
+            return None, "max_parallel and timeout_seconds must be positive"
+        return (max_parallel, timeout), None
+
+    @staticmethod
+    def _parse_tasks(body) -> tuple[list[SubagentTask], str | None]:
+        tasks = []
+        for number, line in enumerate((body or "").splitlines(), start=1):
+            parts = line.strip().split(None, 1)
+            if not parts:
+                continue
+            if len(parts) == 1:
+                return [], (
+                    f"line {number} '{line.strip()}' has no task description, "
+                    "expected '<agenttype> <task description>'"
+                )
+            tasks.append(SubagentTask(parts[0], parts[1]))
+        return tasks, None
+
+    @staticmethod
+    def _format(outcomes: list[SubagentOutcome], succeeded: int) -> str:
+        sections = [f"{succeeded} of {len(outcomes)} subagents succeeded"]
+        for index, outcome in enumerate(outcomes, start=1):
+            marker = "✅" if outcome.success else "❌"
+            sections.append(
+                f"## Task {index} ({outcome.task.agent_type}): {outcome.task.description}\n"
+                f"{marker} {outcome.message}"
+            )
+        return "\n\n".join(sections)
+
+    def get_template_variables(self) -> dict:
+        if not self._agent_types:
+            return {}
+        types_str = ", ".join(f"'{t}'" for t in self._agent_types)
+        return {"AGENT_TYPES": f"Available types: {types_str}"}
@@ -0,0 +1,140 @@
+import re
+
+from ..application.tool_library import ToolArgument, ToolArguments
+from ..application.tool_output_budget import ToolOutputBudget
+from ..application.tool_results import SingleToolResult, ToolResultStatus
+from .argument_parser import join_arguments, split_arguments
+from .base_tool import BaseTool
+
+PAGE_LINES = 200
+MAX_GREP_MATCHES = 200
+CLIPPED_NOTICE = "\n... output clipped, request a smaller range or a narrower pattern"
+
+
+class ReadArtifactTool(BaseTool):
+    name = "read-artifact"
+    description = "Read a stored tool output artifact that was too large for the conversation. Page through it, slice a line range, or grep it."
+    arguments = ToolArguments(
+        header=[
+            ToolArgument(
+                name="artifact_id",
+                type="string",
+                required=True,
+                description="Id of the artifact, as reported in the truncated tool result",
+            ),
+            ToolArgument(
+                name="mode",
+                type="string",
+                required=False,
+                description=f"'page N' (default 'page 1', {PAGE_LINES} lines per page), 'lines START-END', or 'grep PATTERN' (regular expression)",
+            ),
+        ]
+    )
+    examples = [
+        {
+            "reasoning": "The test output was stored as an artifact; I want to find the failures.",
+            "artifact_id": "3f2a9c0d1b7e4c6a8d5f0e1b2c3d4e5f",
+            "mode": "grep FAILED",
+            "result": "  1042\tFAILED tests/test_parser.py::test_empty_input",
+        },
+        {"artifact_id": "3f2a9c0d1b7e4c6a8d5f0e1b2c3d4e5f", "mode": "page 2"},
+        {"artifact_id": "3f2a9c0d1b7e4c6a8d5f0e1b2c3d4e5f", "mode": "lines 1000-1100"},
+    ]
+
+    def __init__(self, output_budget: ToolOutputBudget):
+        self._output_budget = output_budget
+
+    def format_arguments(self, values):
+        return join_arguments(self.arguments.header, values)
+
+    async def execute(self, raw_call):
+        try:
+            parts = split_arguments(raw_call.arguments or "")
+        except ValueError as e:
+            return SingleToolResult(
+                f"Error parsing arguments: {str(e)}", status=ToolResultStatus.FAILURE
+            )
+        if not parts:
+            return SingleToolResult(
+                "Usage: read-artifact <artifact_id> [page N | lines START-END | grep PATTERN]",
+                status=ToolResultStatus.FAILURE,
+            )
+
+        artifact_id = parts[0]
+        content = self._output_budget.artifact_store.load(artifact_id)
+        if content is None:
+            return SingleToolResult(
+                f"Artifact '{artifact_id}' not found", status=ToolResultStatus.FAILURE
+            )
+
+        lines = content.splitlines()
+        # The mode may arrive as one quoted token, e.g. from a native tool call.
+        mode, _, value = " ".join(parts[1:]).strip().partition(" ")
+        mode = mode or "page"
+        if mode == "page":
+            output, error = self._page(lines, value or "1")
+        elif mode == "lines":
+            output, error = self._slice(lines, value)
+        elif mode == "grep":
+            output, error = self._grep(lines, value)
+        else:
+            output, error = None, f"Invalid mode '{mode}'. Use page, lines or grep"
+
+        if error is not None:
+            return SingleToolResult(error, status=ToolResultStatus.FAILURE)
+        return SingleToolResult(self._clip(output or ""))
+
+    def _page(self, lines, value):
+        try:
+            page = int(value)
+        except ValueError:
+            return None, f"Invalid page number '{value}'"
+        pages = max(1, -(-len(lines) // PAGE_LINES))
+        if page < 1 or page > pages:
+            return None, f"Page {page} out of range (1-{pages})"
+
+        start = (page - 1) * PAGE_LINES
+        body = _numbered(lines, start, min(start + PAGE_LINES, len(lines)))
+        return f"Page {page} of {pages}\n{body}", None
+
+    def _slice(self, lines, value):
+        try:
+            start_line, end_line = map(int, value.split("-"))
+        except ValueError:
+            return None, f"Invalid range format '{value}'. Use format 'start-end'"
+        if start_line < 1 or start_line > end_line:
+            return None, f"Invalid range {start_line}-{end_line}"
+        return _numbered(lines, start_line - 1, min(end_line, len(lines))), None
+
+    def _grep(self, lines, pattern):
+        if not pattern:
+            return None, "grep requires a pattern"
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            return None, f"Invalid pattern '{pattern}': {str(e)}"
+
+        matches = [index for index, line in enumerate(lines) if regex.search(line)]
+        if not matches:
+            return f"No lines match '{pattern}'", None
+
+        output = "\n".join(
+            f"{index + 1:6}\t{lines[index]}" for index in matches[:MAX_GREP_MATCHES]
+        )
+        if len(matches) > MAX_GREP_MATCHES:
+            output += f"\n... {len(matches) - MAX_GREP_MATCHES} more matches"
+        return output, None
+
+    def _clip(self, output):
+        # The result passes through the output budget again, so the notice must
+        # fit inside it, otherwise every large read is spilled to a new artifact.
+        max_chars = self._output_budget.max_chars
+        if len(output) <= max_chars:
+            return output
+        clipped = output[: max(0, max_chars - len(CLIPPED_NOTICE))]
+        cut = clipped.rfind("\n")
+        return (clipped[:cut] if cut > 0 else clipped) + CLIPPED_NOTICE
+
+
+def _numbered(lines, start, end):
+    return "\n".join(f"{index + 1:6}\t{lines[index]}" for index in range(start, end))
@@ -0,0 +1,270 @@
+import asyncio
+import glob
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from simple_agent.infrastructure.file_cache import file_cache
+from simple_agent.infrastructure.gitignore import GitignoreMatcher
+
+from ..application.tool_library import ToolArgument, ToolArguments
+from ..application.tool_output_budget import DEFAULT_MAX_OUTPUT_CHARS, ToolOutputBudget
+from ..application.tool_results import SingleToolResult, ToolResultStatus
+from .argument_parser import split_arguments
+from .base_tool import BaseTool
+
+MAX_FILES = 40
+GLOB_CHARS = "*?["
+
+
+@dataclass
+class FileRequest:
+    path: str
+    start_line: int | None = None
+    end_line: int | None = None
+    # A glob that matched no files, reported instead of being dropped.
+    unmatched: bool = False
+
+    @property
+    def label(self) -> str:
+        if self.start_line is None:
+            return self.path
+        return f"{self.path} (lines {self.start_line}-{self.end_line})"
+
+
+@dataclass
+class FileContent:
+    request: FileRequest
+    text: str
+    error: str | None = None
+
+
+class ReadManyTool(BaseTool):
+    name = "read-many"
+    description = "Read several files in one call. Each line names a file, optionally followed by a line range, or a glob such as 'src/**/*.py'. Quote paths that contain spaces. Files are read concurrently and the combined output is capped; truncated files say how to read the rest. Prefer it over consecutive cat calls when you already know which files you need."
+    arguments = ToolArguments(
+        header=[
+            ToolArgument(
+                name="max_chars",
+                type="integer",
+                required=False,
+                description="Total size of the output in characters (default and maximum: the tool output limit)",
+            ),
+        ],
+        body=ToolArgument(
+            name="files",
+            type="string",
+            required=True,
+            description="One path or glob per line, quoted if it contains spaces, a path may be followed by a line range 'start-end'",
+        ),
+    )
+    examples = [
+        {
+            "reasoning": "I need the parser, the first part of the lexer and all parser tests:",
+            "files": "src/parser.py\nsrc/lexer.py 1-80\ntests/parser_*_test.py",
+            "result": "==> src/parser.py <==\n...\n==> src/lexer.py (lines 1-80) <==\n...",
+        },
+    ]
+
+    def __init__(self, output_budget: ToolOutputBudget | None = None):
+        # The whole result stays within the output budget, so it is never
+        # spilled to an artifact.
+        self._output_limit = (
+            output_budget.max_chars if output_budget else DEFAULT_MAX_OUTPUT_CHARS
+        )
+
+    async def execute(self, raw_call):
+        max_chars, error = self._parse_max_chars(raw_call.arguments)
+        if error or max_chars is None:
+            return SingleToolResult(
+                f"STDERR: read-many: {error}", status=ToolResultStatus.FAILURE
+            )
+
+        requests, error = self._parse_requests(raw_call.body)
+        if error:
+            return SingleToolResult(
+                f"STDERR: read-many: {error}", status=ToolResultStatus.FAILURE
+            )
+        if not requests:
+            return SingleToolResult(
+                "STDERR: read-many: no files given, expected one path or glob per line",
+                status=ToolResultStatus.FAILURE,
+            )
+
+        skipped = max(0, len(requests) - MAX_FILES)
+        contents = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._read, request)
+                for request in requests[:MAX_FILES]
+            )
+        )
+        output = self._format(contents, min(max_chars, self._output_limit), skipped)
+        failed = all(content.error for content in contents)
+        status = ToolResultStatus.FAILURE if failed else ToolResultStatus.SUCCESS
+        return SingleToolResult(output, status=status)
+
+    def _parse_max_chars(self, arguments) -> tuple[int | None, str | None]:
+        value = (arguments or "").strip()
+        if not value:
+            return self._output_limit, None
+        try:
+            max_chars = int(value)
+        except ValueError:
+            return None, f"invalid max_chars '{value}', expected a number"
+        if max_chars <= 0:
+            return None, "max_chars must be positive"
+        return max_chars, None
+
+    @staticmethod
+    def _parse_requests(body) -> tuple[list[FileRequest], str | None]:
+        requests: list[FileRequest] = []
+        seen = set()
+        for line in (body or "").splitlines():
+            try:
+                parts = split_arguments(line)
+            except ValueError:
+                return [], f"unbalanced quotes in '{line.strip()}'"
+            if not parts:
+                continue
+            spec, line_range = parts[0], " ".join(parts[1:])
+            start_line = end_line = None
+            if line_range:
+                try:
+                    start_line, end_line = map(int, line_range.split("-"))
+                except ValueError:
+                    return (
+                        [],
+                        f"invalid range '{line_range}' for {spec}, use 'start-end' "
+                        "and quote paths that contain spaces",
+                    )
+                if start_line < 1 or start_line > end_line:
+                    return [], f"invalid range '{line_range}' for {spec}"
+
+            paths = _expand(spec)
+            if not paths:
+                requests.append(FileRequest(spec, start_line, end_line, unmatched=True))
+            for path in paths:
+                key = (path, start_line, end_line)
+                if key not in seen:
+                    seen.add(key)
+                    requests.append(FileRequest(path, start_line, end_line))
+        return requests, None
+
+    @staticmethod
+    def _read(request: FileRequest) -> FileContent:
+        if request.unmatched:
+            return FileContent(request, "", "No files match this glob")
+        try:
+            text = file_cache.read_text(request.path)
+        except FileNotFoundError:
+            return FileContent(request, "", "No such file or directory")
+        except IsADirectoryError:
+            return FileContent(request, "", "Is a directory")
+        except UnicodeDecodeError:
+            return FileContent(request, "", "Not a UTF-8 text file")
+        except OSError as e:
+            return FileContent(request, "", e.strerror or str(e))
+
+        if request.start_line is not None:
+            lines = text.splitlines(keepends=True)
+            text = "".join(lines[request.start_line - 1 : request.end_line])
+        return FileContent(request, text.rstrip("\n"))
+
+    @staticmethod
+    def _format(contents: list[FileContent], max_chars: int, skipped: int) -> str:
+        """Joins the files so the whole output, headers and notes included, fits max_chars."""
+        sections = [f"==> {content.request.label} <==" for content in contents]
+        for index, content in enumerate(contents):
+            if content.error:
+                sections[index] += f"\nSTDERR: {content.error}"
+        notes = []
+        if skipped:
+            notes.append(
+                f"[... {skipped} more files not read, at most {MAX_FILES} per call]"
+            )
+        separators = 2 * (len(sections) + len(notes) - 1)
+        fixed = sum(map(len, sections + notes)) + separators + len(contents)
+
+        # Every truncated file gets a note, which shrinks the room left for
+        # text and may truncate more files, until the count settles.
+        sizes = [0 if content.error else len(content.text) for content in contents]
+        truncated = 0
+        while True:
+            room = max(0, max_chars - fixed - truncated * TRUNCATION_NOTE_CHARS)
+            allowances = _share_budget(sizes, room)
+            count = sum(
+                size > allowance
+                for size, allowance in zip(sizes, allowances, strict=True)
+            )
+            if count <= truncated:
+                break
+            truncated = count
+
+        for index, content in enumerate(contents):
+            if not content.error:
+                sections[index] += "\n" + _clip(content, allowances[index])
+        return "\n\n".join(sections + notes)
+
+
+def _clip(content: FileContent, allowance: int) -> str:
+    text = content.text
+    if len(text) <= allowance:
+        return text
+    first = content.request.start_line or 1
+    last = first + text.count("\n")
+    cut = text.rfind("\n", 0, allowance)
+    if cut <= 0:
+        return _truncation_note(first, last, shown=0)
+    shown = text.count("\n", 0, cut) + 1
+    return text[:cut] + "\n" + _truncation_note(first, last, shown)
+
+
+def _truncation_note(first: int, last: int, shown: int) -> str:
+    if not shown:
+        return (
+            f"[... lines {first}-{last} not shown, read them with cat and a line range]"
+        )
+    return (
+        f"[... truncated after line {first + shown - 1} of {last}, "
+        "read the rest with cat and a line range]"
+    )
+
+
+# Room reserved per truncated file, enough for a note and its line break.
+TRUNCATION_NOTE_CHARS = (
+    max(len(_truncation_note(10**9, 10**9, shown)) for shown in (0, 1)) + 1
+)
+
+
+def _expand(spec: str) -> list[str]:
+    if not any(char in spec for char in GLOB_CHARS):
+        return [spec]
+    matcher = GitignoreMatcher(Path.cwd())
+    paths = []
+    for path in sorted(glob.glob(spec, recursive=True)):
+        if not os.path.isfile(path):
+            continue
+        relative = os.path.relpath(path)
+        if relative.startswith("..") or not matcher.is_ignored(
+            Path(relative).as_posix()
+        ):
+            paths.append(path)
+    return paths
+
+
+def _share_budget(sizes: list[int], budget: int) -> list[int]:
+    """Splits the budget so small files are complete and large ones share the rest."""
+    allowances = [0] * len(sizes)
+    remaining = budget
+    pending = sorted(range(len(sizes)), key=lambda index: sizes[index])
+    while pending:
+        share = remaining // len(pending)
+        index = pending[0]
+        if sizes[index] > share:
+            for index in pending:
+                allowances[index] = share
+            break
+        allowances[index] = sizes[index]
+        remaining -= sizes[index]
+        pending.pop(0)
+    return allowances
@@ -1,11 +1,10 @@
-import difflib
-import os
 from dataclasses import dataclass
 
 from ..application.tool_library import ToolArgument, ToolArguments
 from ..application.tool_results import SingleToolResult, ToolResultStatus
-from .argument_parser import split_arguments
+from .argument_parser import join_arguments, split_arguments
 from .base_tool import BaseTool
+from .file_patch import FilePatch, Hunk
 
 
 @dataclass
@@ -21,51 +20,28 @@ class FileReplacer:
 
     def __init__(self, filename):
         self.filename = filename
-        self.original_content = ""
-        self.new_content = ""
+        self._patch = FilePatch(filename, "")
 
-    def load_file(self):
-        if not os.path.exists(self.filename):
-            raise FileNotFoundError(f'File "{self.filename}" not found')
+    @property
+    def original_content(self):
+        return self._patch.original_content
+
+    @property
+    def new_content(self):
+        return self._patch.new_content
 
-        with open(self.filename, encoding="utf-8") as f:
-            self.original_content = f.read()
+    def load_file(self):
+        self._patch = FilePatch.load(self.filename)
 
     def save_file(self):
-        with open(self.filename, "w", encoding="utf-8", newline="\n") as f:
-            f.write(self.new_content)
+        self._patch.save()
 
     def replace(self, old_string: str, new_string: str, replace_mode: str):
         """Replace content using exact string matching."""
-        content = self.original_content
-
-        # Count occurrences for uniqueness check
-        count = content.count(old_string)
-        if count == 0:
-            raise ValueError(
-                "Action Failed: File not modified. The provided text to be replaced was not found in the file. Please use 'cat' to verify the exact content before retrying."
-            )
-
-        if replace_mode == "single":
-            self.new_content = content.replace(old_string, new_string, 1)
-        elif replace_mode == "all":
-            self.new_content = content.replace(old_string, new_string)
-        else:
-            raise ValueError(f"Invalid replace_mode: {replace_mode}")
+        self._patch.add(Hunk(old_string, new_string, replace_mode))
 
     def build_diff(self):
-        original_lines = self.original_content.splitlines(keepends=True)
-        new_lines = self.new_content.splitlines(keepends=True)
-
-        diff_lines = list(
-            difflib.unified_diff(
-                original_lines,
-                new_lines,
-                fromfile=f"{self.filename} (original)",
-                tofile=f"{self.filename} (updated)",
-            )
-        )
-        return diff_lines
+        return self._patch.build_diff()
 
 
 class ReplaceFileContentTool(BaseTool):
@@ -106,6 +82,9 @@ class ReplaceFileContentTool(BaseTool):
         "🛠️[replace-file-content test.txt all]\nfoo\n@@@\nbar\n🛠️[/end]",
     ]
 
+    def format_arguments(self, values):
+        return join_arguments(self.arguments.header, values)
+
     async def execute(self, raw_call):
         replace_args, error = self.parse_arguments(raw_call)
         if error or replace_args is None:
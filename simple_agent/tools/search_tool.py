@@ -0,0 +1,127 @@
+import asyncio
+from pathlib import Path
+
+from ..application.tool_library import ToolArgument, ToolArguments
+from ..application.tool_results import SingleToolResult, ToolResultStatus
+from .argument_parser import join_arguments, split_arguments
+from .base_tool import BaseTool
+from .workspace_index import MAX_FILE_BYTES, SearchResults, WorkspaceIndex
+
+MAX_MATCHES = 100
+MAX_LINE_LENGTH = 200
+MAX_SKIPPED_LISTED = 10
+
+
+class SearchTool(BaseTool):
+    name = "search"
+    description = "Search the text of all files in the workspace for an exact string. Uses a persistent index, respects .gitignore and is much faster than running rg or grep through bash. Results are grouped by file and capped."
+    arguments = ToolArguments(
+        header=[
+            ToolArgument(
+                name="query",
+                type="string",
+                required=True,
+                description="Exact text to find. Quote it if it contains spaces",
+            ),
+            ToolArgument(
+                name="path",
+                type="string",
+                required=False,
+                description="Optional directory or file prefix to restrict the search to",
+            ),
+            ToolArgument(
+                name="ignore_case",
+                type="string",
+                required=False,
+                description="Optional parameter to match case-insensitively, e.g. 'ignore_case'",
+            ),
+        ]
+    )
+    examples = [
+        {
+            "reasoning": "I need to find where the main function is defined.",
+            "query": '"def main("',
+            "result": "Found 1 match in 1 file\nfoo.py\n    82: def main() -> None:",
+        },
+        {"query": "TODO", "path": "src/", "ignore_case": "ignore_case"},
+    ]
+
+    def __init__(self, index: WorkspaceIndex | None = None):
+        self._index_override = index
+        self._indexes: dict[Path, WorkspaceIndex] = {}
+
+    def format_arguments(self, values):
+        return join_arguments(self.arguments.header, values, flags=("ignore_case",))
+
+    async def execute(self, raw_call):
+        try:
+            parts = split_arguments(raw_call.arguments or "")
+        except ValueError as e:
+            return SingleToolResult(
+                f"Error parsing arguments: {str(e)}", status=ToolResultStatus.FAILURE
+            )
+        if not parts or not parts[0]:
+            return SingleToolResult(
+                "Usage: search <query> [path] [ignore_case]",
+                status=ToolResultStatus.FAILURE,
+            )
+
+        query = parts[0]
+        ignore_case = "ignore_case" in parts[1:]
+        rest = [part for part in parts[1:] if part != "ignore_case"]
+        if len(rest) > 1:
+            return SingleToolResult(
+                "Too many arguments for search", status=ToolResultStatus.FAILURE
+            )
+        path_prefix = rest[0].removeprefix("./") if rest else ""
+
+        results = await asyncio.to_thread(
+            self._index().search, query, path_prefix, ignore_case, MAX_MATCHES
+        )
+        return SingleToolResult(self._format(query, results))
+
+    def _index(self) -> WorkspaceIndex:
+        if self._index_override is not None:
+            return self._index_override
+        root = Path.cwd()
+        if root not in self._indexes:
+            self._indexes[root] = WorkspaceIndex(root)
+        return self._indexes[root]
+
+    @classmethod
+    def _format(cls, query, results: SearchResults):
+        lines = cls._format_matches(query, results.matches, results.truncated)
+        if results.skipped:
+            listed = ", ".join(results.skipped[:MAX_SKIPPED_LISTED])
+            more = len(results.skipped) - MAX_SKIPPED_LISTED
+            if more > 0:
+                listed += f" and {more} more"
+            lines.append(
+                f"Not searched, larger than {MAX_FILE_BYTES:,} bytes: {listed}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_matches(query, matches, truncated) -> list[str]:
+        if not matches:
+            return [f"No matches for '{query}'"]
+
+        file_count = len({match.path for match in matches})
+        found = f"more than {len(matches)}" if truncated else str(len(matches))
+        lines = [
+            f"Found {found} {'match' if found == '1' else 'matches'} "
+            f"in {file_count} {'file' if file_count == 1 else 'files'}"
+        ]
+        current_path = None
+        for match in matches:
+            if match.path != current_path:
+                current_path = match.path
+                lines.append(current_path)
+            text = match.line.strip()
+            if len(text) > MAX_LINE_LENGTH:
+                text = text[:MAX_LINE_LENGTH] + "..."
+            lines.append(f"{match.line_number:6}: {text}")
+
+        if truncated:
+            lines.append("... more matches not shown, narrow the query or path")
+        return lines
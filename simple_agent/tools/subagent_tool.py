@@ -1,9 +1,14 @@
 from simple_agent.application.agent_types import AgentTypes
 from simple_agent.application.subagent_spawner import SubagentSpawner
-from simple_agent.application.tool_library import ToolArgument, ToolArguments
+from simple_agent.application.tool_library import (
+    ToolArgument,
+    ToolArguments,
+    argument_text,
+)
 from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
 
 from ..application.agent_type import AgentType
+from .argument_parser import is_flag_set
 from .base_tool import BaseTool
 
 
@@ -50,6 +55,16 @@ class SubagentTool(BaseTool):
         self._spawn_subagent = spawn_subagent
         self._agent_types = agent_types
 
+    def format_arguments(self, values):
+        # execute() splits on whitespace, so the values stay unquoted.
+        parts = [
+            argument_text(values.get("agenttype")),
+            argument_text(values.get("task_description")),
+        ]
+        if is_flag_set(values.get("--async"), "--async"):
+            parts.append("--async")
+        return " ".join(part for part in parts if part)
+
     async def execute(self, raw_call):
         args = raw_call.arguments
         if not args or not args.strip():
@@ -0,0 +1,348 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from simple_agent.infrastructure.gitignore import GITIGNORE, GitignoreMatcher
+from simple_agent.infrastructure.workspace_watcher import (
+    ChangeKind,
+    FileChange,
+    WorkspaceWatcher,
+)
+from simple_agent.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 2
+MAX_FILE_BYTES = 1_000_000
+BINARY_SNIFF_BYTES = 8192
+SAVE_INTERVAL_SECONDS = 30.0
+RESCAN_INTERVAL_SECONDS = 2.0
+SKIPPED_TOO_LARGE = "too large"
+SKIPPED_BINARY = "binary"
+
+
+@dataclass
+class IndexedFile:
+    mtime_ns: int
+    size: int
+    trigrams: set[str]
+    # Why the file is not searched, None for indexed text files.
+    skipped: str | None = None
+
+
+@dataclass
+class SearchMatch:
+    path: str
+    line_number: int
+    line: str
+
+
+@dataclass
+class SearchResults:
+    matches: list[SearchMatch]
+    # Files below the path prefix that were too large to index.
+    skipped: list[str] = field(default_factory=list)
+    # More matches exist than max_matches, the scan stopped early.
+    truncated: bool = False
+
+
+class WorkspaceIndex:
+    """Trigram index of the text files below a root directory.
+
+    Every file is reduced to the set of lower-cased three character sequences it
+    contains. A query can only match files holding all of its trigrams, so only
+    those candidates are read and scanned line by line. The index is persisted
+    as JSON and refreshed from file mtimes and sizes before each search.
+
+    With a workspace watcher only the paths it reported are checked again, and
+    the whole tree is only walked after lost events or edited ignore files.
+    Without one the tree is walked at most every RESCAN_INTERVAL_SECONDS.
+    Saving is debounced, a crash loses at most the last few updates, which the
+    next refresh finds again.
+
+    Searches may run concurrently from worker threads, the index lock keeps
+    them from reading the files and postings while a refresh updates them.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        index_path: Path | None = None,
+        watcher: WorkspaceWatcher | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._root = root
+        self._index_path = index_path or root / ".simple-agent" / "search-index.json"
+        self._files: dict[str, IndexedFile] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._loaded = False
+        self._clock = clock
+        self._saved_at: float | None = None
+        self._unsaved = False
+        self._scanned_at: float | None = None
+        self._watched = watcher is not None
+        # Guards the index itself, reentrant because refresh() may flush().
+        self._index_lock = threading.RLock()
+        # Guards the changes reported by the watcher thread.
+        self._lock = threading.Lock()
+        self._changed_paths: set[str] = set()
+        self._rescan = True
+        if watcher is not None:
+            watcher.subscribe(self._on_changes)
+
+    def search(
+        self,
+        query: str,
+        path_prefix: str = "",
+        ignore_case: bool = False,
+        max_matches: int | None = None,
+    ) -> SearchResults:
+        with self._index_lock:
+            self.refresh()
+            candidates = sorted(
+                path for path in self._candidates(query) if path.startswith(path_prefix)
+            )
+            skipped = sorted(
+                path
+                for path, indexed in self._files.items()
+                if indexed.skipped == SKIPPED_TOO_LARGE and path.startswith(path_prefix)
+            )
+
+        needle = query.lower() if ignore_case else query
+        matches: list[SearchMatch] = []
+        for path in candidates:
+            if max_matches is None:
+                matches.extend(self._scan(path, needle, ignore_case))
+                continue
+            # One match past the limit tells that the results were cut.
+            remaining = max_matches + 1 - len(matches)
+            matches.extend(self._scan(path, needle, ignore_case, remaining))
+            if len(matches) > max_matches:
+                return SearchResults(matches[:max_matches], skipped, truncated=True)
+        return SearchResults(matches, skipped)
+
+    def refresh(self) -> None:
+        with self._index_lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+            with self._lock:
+                rescan = self._rescan or (not self._watched and self._rescan_due())
+                changed_paths = self._changed_paths
+                self._rescan = False
+                self._changed_paths = set()
+
+            if rescan:
+                changed = self._refresh_all()
+                self._scanned_at = self._clock()
+            else:
+                changed = self._refresh_paths(changed_paths)
+            self._unsaved = self._unsaved or changed
+            if self._unsaved and (
+                self._saved_at is None
+                or self._clock() - self._saved_at >= SAVE_INTERVAL_SECONDS
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes pending updates of the index to disk."""
+        with self._index_lock:
+            if self._unsaved:
+                self._save()
+                self._unsaved = False
+            self._saved_at = self._clock()
+
+    def _rescan_due(self) -> bool:
+        return (
+            self._scanned_at is None
+            or self._clock() - self._scanned_at >= RESCAN_INTERVAL_SECONDS
+        )
+
+    def _on_changes(self, changes: set[FileChange]) -> None:
+        with self._lock:
+            for change in changes:
+                if change.kind == ChangeKind.RESCAN or change.path.name in (
+                    GITIGNORE,
+                    "exclude",
+                ):
+                    self._rescan = True
+                    continue
+                try:
+                    relative = change.path.relative_to(self._root).as_posix()
+                except ValueError:
+                    continue
+                self._changed_paths.add(relative)
+
+    def _refresh_all(self) -> bool:
+        changed = False
+        seen = set()
+        for path, stat in self._walk(self._root, GitignoreMatcher(self._root)):
+            seen.add(path)
+            changed = self._update(path, stat) or changed
+
+        for path in set(self._files) - seen:
+            self._remove(path)
+            changed = True
+        return changed
+
+    def _refresh_paths(self, paths: set[str]) -> bool:
+        changed = False
+        matcher = GitignoreMatcher(self._root)
+        for path in paths:
+            full_path = self._root / path
+            if full_path.is_dir() and not matcher.is_ignored(path, True):
+                for file, stat in self._walk(full_path, matcher):
+                    changed = self._update(file, stat) or changed
+                continue
+            try:
+                stat = full_path.stat()
+            except OSError:
+                stat = None
+            if stat is not None and not matcher.is_ignored(path):
+                changed = self._update(path, stat) or changed
+                continue
+            # Deleted, ignored or a directory that was moved away.
+            below = path + "/"
+            for indexed in [p for p in self._files if p == path or p.startswith(below)]:
+                self._remove(indexed)
+                changed = True
+        return changed
+
+    def _update(self, path: str, stat: os.stat_result) -> bool:
+        indexed = self._files.get(path)
+        if (
+            indexed
+            and indexed.mtime_ns == stat.st_mtime_ns
+            and indexed.size == stat.st_size
+        ):
+            return False
+        self._remove(path)
+        indexed = self._read(path, stat)
+        if indexed is not None:
+            self._add(path, indexed)
+        return True
+
+    def _candidates(self, query: str) -> set[str]:
+        query_trigrams = trigrams_of(query.lower())
+        if not query_trigrams:
+            return {path for path, f in self._files.items() if f.skipped is None}
+
+        postings = sorted(
+            (self._postings.get(trigram, set()) for trigram in query_trigrams), key=len
+        )
+        return set.intersection(*postings)
+
+    def _scan(
+        self, path: str, needle: str, ignore_case: bool, limit: int | None = None
+    ) -> list[SearchMatch]:
+        matches = []
+        try:
+            with open(self._root / path, encoding="utf-8", errors="replace") as f:
+                for line_number, line in enumerate(f, start=1):
+                    haystack = line.lower() if ignore_case else line
+                    if needle in haystack:
+                        matches.append(
+                            SearchMatch(path, line_number, line.rstrip("\r\n"))
+                        )
+                        if limit is not None and len(matches) >= limit:
+                            break
+        except OSError:
+            pass
+        return matches
+
+    def _walk(self, start: Path, matcher: GitignoreMatcher):
+        for root, dirs, files in os.walk(start):
+            root_path = Path(root)
+            relative_root = root_path.relative_to(self._root).as_posix()
+            prefix = "" if relative_root == "." else relative_root + "/"
+            dirs[:] = sorted(
+                d for d in dirs if not matcher.is_ignored(prefix + d, True)
+            )
+            for file in files:
+                relative = prefix + file
+                if matcher.is_ignored(relative):
+                    continue
+                try:
+                    stat = (root_path / file).stat()
+                except OSError:
+                    continue
+                yield relative, stat
+
+    def _read(self, path: str, stat: os.stat_result) -> IndexedFile | None:
+        if stat.st_size > MAX_FILE_BYTES:
+            return IndexedFile(stat.st_mtime_ns, stat.st_size, set(), SKIPPED_TOO_LARGE)
+        try:
+            with open(self._root / path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if b"\0" in data[:BINARY_SNIFF_BYTES]:
+            return IndexedFile(stat.st_mtime_ns, stat.st_size, set(), SKIPPED_BINARY)
+        trigrams = trigrams_of(data.decode("utf-8", errors="replace").lower())
+        return IndexedFile(stat.st_mtime_ns, stat.st_size, trigrams)
+
+    def _add(self, path: str, indexed: IndexedFile) -> None:
+        self._files[path] = indexed
+        for trigram in indexed.trigrams:
+            self._postings.setdefault(trigram, set()).add(path)
+
+    def _remove(self, path: str) -> None:
+        indexed = self._files.pop(path, None)
+        if indexed is None:
+            return
+        for trigram in indexed.trigrams:
+            paths = self._postings.get(trigram)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._postings[trigram]
+
+    def _load(self) -> None:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        for path, entry in data.get("files", {}).items():
+            self._add(
+                path,
+                IndexedFile(
+                    entry["mtime_ns"],
+                    entry["size"],
+                    set(entry["trigrams"]),
+                    entry.get("skipped"),
+                ),
+            )
+
+    def _save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "files": {
+                path: {
+                    "mtime_ns": indexed.mtime_ns,
+                    "size": indexed.size,
+                    "trigrams": sorted(indexed.trigrams),
+                    "skipped": indexed.skipped,
+                }
+                for path, indexed in self._files.items()
+            },
+        }
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._index_path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self._index_path)
+        except OSError as error:
+            logger.warning("Could not save search index: %s", error)
+
+
+def trigrams_of(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from simple_agent.application.tool_library import ToolArgument, ToolArguments
 from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
+from simple_agent.infrastructure.file_cache import file_cache
 
 from .base_tool import BaseTool
 
@@ -45,4 +46,5 @@ class WriteTodosTool(BaseTool):
 
         path = Path(self.filename)
         path.write_text(content, encoding="utf-8")
+        file_cache.invalidate(path)
         return SingleToolResult("Updated TODOS")
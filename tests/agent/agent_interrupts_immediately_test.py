@@ -7,6 +7,7 @@ import pytest
 from simple_agent.application.agent import Agent
 from simple_agent.application.agent_id import AgentId
 from simple_agent.application.brain import Brain
+from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
 from simple_agent.application.event_bus import SimpleEventBus
 from simple_agent.application.input import Input
 from simple_agent.application.llm import Messages
@@ -26,7 +27,7 @@ class SlowLLM:
     def model(self) -> str:
         return "slow-model"
 
-    async def call_async(self, messages):
+    async def call_async(self, messages, tools=None):
         await asyncio.sleep(10)
         return _make_response("This should not be reached")
 
@@ -45,11 +46,14 @@ def _make_input_with_message(message: str) -> Input:
 class EmptyToolLibrary:
     def __init__(self):
         self.tools: list[Tool] = []
-        self.tool_syntax: ToolSyntax = Mock()
+        self.tool_syntax: ToolSyntax = EmojiBracketToolSyntax()
 
     def parse_message_and_tools(self, text: str) -> MessageAndParsedTools:
         return MessageAndParsedTools(text, [])
 
+    def resolve_tool_uses(self, message: str, tool_uses) -> MessageAndParsedTools:
+        return MessageAndParsedTools(message, [])
+
     async def execute_parsed_tool(self, parsed_tool: ParsedTool):
         return SingleToolResult()
 
@@ -114,7 +118,7 @@ class ToolCallingLLM:
     def model(self) -> str:
         return "tool-calling-model"
 
-    async def call_async(self, messages):
+    async def call_async(self, messages, tools=None):
         self._call_count += 1
         if self._call_count == 1:
             return _make_response("<tool>slow_tool</tool>")
@@ -125,7 +129,7 @@ class ToolCallingToolLibrary:
     def __init__(self, slow_tool: SlowTool):
         self._slow_tool = slow_tool
         self.tools: list[Tool] = []
-        self.tool_syntax: ToolSyntax = Mock()
+        self.tool_syntax: ToolSyntax = EmojiBracketToolSyntax()
 
     def parse_message_and_tools(self, text: str) -> MessageAndParsedTools:
         if "<tool>slow_tool</tool>" in text:
@@ -133,6 +137,9 @@ class ToolCallingToolLibrary:
             return MessageAndParsedTools("", [ParsedTool(tool_call, self._slow_tool)])
         return MessageAndParsedTools(text, [])
 
+    def resolve_tool_uses(self, message: str, tool_uses) -> MessageAndParsedTools:
+        return MessageAndParsedTools(message, [])
+
     async def execute_parsed_tool(self, parsed_tool: ParsedTool):
         return await self._slow_tool()
 
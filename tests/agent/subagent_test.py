@@ -62,3 +62,14 @@ async def verify_chat(inputs, answers):
     )
 
     verify(result.as_approval_string())
+
+
+async def test_parallel_subagents():
+    await verify_chat(
+        ["Say hello through parallel subagents", "\n"],
+        [
+            "🛠️[parallel-subagents]\ncoding say hello\n🛠️[/end]",
+            "hello\n🛠️[complete-task I successfully said hello]",
+            "🛠️[complete-task All subagents said hello]",
+        ],
+    )
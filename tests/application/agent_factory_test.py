@@ -0,0 +1,128 @@
+import asyncio
+
+from simple_agent.application.agent_factory import AgentFactory
+from simple_agent.application.agent_id import AgentId
+from simple_agent.application.agent_task_manager import (
+    AgentTaskManager,
+    AgentTaskState,
+)
+from simple_agent.application.agent_type import AgentType
+from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
+from simple_agent.application.event_bus import SimpleEventBus
+from simple_agent.application.event_store import NoOpEventStore
+from simple_agent.application.llm_stub import StubLLMProvider, create_llm_stub
+from simple_agent.infrastructure.agent_library import BuiltinAgentLibrary
+from simple_agent.tools.all_tools import AllToolsFactory
+from tests.test_helpers import DummyProjectTree
+
+
+class PendingUserInput:
+    """Keeps every agent waiting for input until the user leaves."""
+
+    def __init__(self):
+        self.left = asyncio.Event()
+
+    async def read_async(self) -> str:
+        await self.left.wait()
+        return ""
+
+    def escape_requested(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+def create_factory(agent_task_manager, user_input, llm_provider=None):
+    return AgentFactory(
+        event_bus=SimpleEventBus(),
+        tool_library_factory=AllToolsFactory(EmojiBracketToolSyntax()),
+        agent_library=BuiltinAgentLibrary(),
+        user_input=user_input,
+        llm_provider=llm_provider or StubLLMProvider.dummy(),
+        project_tree=DummyProjectTree(),
+        event_store=NoOpEventStore(),
+        agent_task_manager=agent_task_manager,
+    )
+
+
+async def test_async_subagents_waiting_for_input_do_not_hold_slots():
+    manager = AgentTaskManager(max_running=2, max_running_per_parent=2)
+    user_input = PendingUserInput()
+    spawn = create_factory(manager, user_input).create_spawner(AgentId("Agent"))
+
+    for index in range(5):
+        result = await spawn(AgentType("coding"), f"task {index}", is_async=True)
+        assert result.message == "Subagent started"
+    await asyncio.sleep(0.05)
+
+    waiting = [info.state for info in manager.snapshot()]
+    user_input.left.set()
+    await asyncio.sleep(0.05)
+
+    assert waiting == [AgentTaskState.WAITING] * 5
+    assert [info.state for info in manager.snapshot()] == [AgentTaskState.FINISHED] * 5
+
+
+async def test_sync_subagents_run_under_the_limits():
+    manager = AgentTaskManager(max_running=1)
+    factory = create_factory(manager, PendingUserInput())
+    blocker = manager.start_task(AgentId("Other"), asyncio.Event().wait())
+    spawn = factory.create_spawner(AgentId("Agent"))
+
+    child = asyncio.ensure_future(
+        spawn(AgentType("coding"), "task", until_complete=True)
+    )
+    await asyncio.sleep(0.05)
+
+    try:
+        states = {str(info.agent_id): info.state for info in manager.snapshot()}
+        assert states["Other"] == AgentTaskState.RUNNING
+        assert states["Agent/Coding"] == AgentTaskState.QUEUED
+    finally:
+        child.cancel()
+        blocker.cancel()
+        await asyncio.gather(child, blocker, return_exceptions=True)
+
+
+async def test_sync_subagent_timeout_does_not_count_time_spent_queued():
+    llm = StubLLMProvider.for_testing(create_llm_stub(["🛠️[complete-task All done /]"]))
+    manager = AgentTaskManager(max_running=1)
+    factory = create_factory(manager, PendingUserInput(), llm)
+    release = asyncio.Event()
+    blocker = manager.start_task(AgentId("Other"), release.wait())
+    spawn = factory.create_spawner(AgentId("Agent"))
+
+    child = asyncio.ensure_future(
+        spawn(AgentType("coding"), "task", until_complete=True, timeout=0.05)
+    )
+    await asyncio.sleep(0.2)
+    release.set()
+    result = await asyncio.wait_for(child, 1)
+    await blocker
+
+    assert result.success is True
+    assert "All done" in str(result)
+
+
+async def test_subagent_stopping_without_complete_task_fails_with_its_last_message():
+    llm = StubLLMProvider.for_testing(create_llm_stub(["Here is what I found."]))
+    factory = create_factory(AgentTaskManager(), PendingUserInput(), llm)
+    spawn = factory.create_spawner(AgentId("Agent"))
+
+    result = await spawn(AgentType("coding"), "task", until_complete=True)
+
+    assert result.success is False
+    assert result.do_continue() is False
+    assert result.message.endswith("last message:\nHere is what I found.")
+
+
+async def test_subagent_calling_complete_task_returns_its_summary():
+    llm = StubLLMProvider.for_testing(create_llm_stub(["🛠️[complete-task All done /]"]))
+    factory = create_factory(AgentTaskManager(), PendingUserInput(), llm)
+    spawn = factory.create_spawner(AgentId("Agent"))
+
+    result = await spawn(AgentType("coding"), "task", until_complete=True)
+
+    assert result.success is True
+    assert "All done" in str(result)
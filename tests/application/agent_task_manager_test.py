@@ -3,7 +3,10 @@ import asyncio
 import pytest
 
 from simple_agent.application.agent_id import AgentId
-from simple_agent.application.agent_task_manager import AgentTaskManager
+from simple_agent.application.agent_task_manager import (
+    AgentTaskManager,
+    AgentTaskState,
+)
 
 
 @pytest.mark.asyncio
@@ -86,3 +89,144 @@ async def test_cancel_all_tasks():
 
     with pytest.raises(asyncio.CancelledError):
         await asyncio.gather(task1, task2)
+
+
+@pytest.mark.asyncio
+async def test_queues_tasks_over_the_global_limit():
+    manager = AgentTaskManager(max_running=1)
+    release = asyncio.Event()
+    started = []
+
+    async def sample_coro(name):
+        started.append(name)
+        await release.wait()
+
+    first = manager.start_task(AgentId("Agent/A"), sample_coro("A"))
+    second = manager.start_task(AgentId("Agent/B"), sample_coro("B"))
+    await asyncio.sleep(0.01)
+
+    assert started == ["A"]
+    states = {str(info.agent_id): info.state for info in manager.snapshot()}
+    assert states == {
+        "Agent/A": AgentTaskState.RUNNING,
+        "Agent/B": AgentTaskState.QUEUED,
+    }
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert started == ["A", "B"]
+    assert {info.state for info in manager.snapshot()} == {AgentTaskState.FINISHED}
+
+
+@pytest.mark.asyncio
+async def test_limits_running_children_per_parent():
+    manager = AgentTaskManager(max_running=10, max_running_per_parent=1)
+    release = asyncio.Event()
+
+    async def sample_coro():
+        await release.wait()
+
+    tasks = [
+        manager.start_task(AgentId("Agent/A"), sample_coro()),
+        manager.start_task(AgentId("Agent/B"), sample_coro()),
+        manager.start_task(AgentId("Other/C"), sample_coro()),
+    ]
+    await asyncio.sleep(0.01)
+
+    states = {str(info.agent_id): info.state for info in manager.snapshot()}
+    assert states["Agent/B"] == AgentTaskState.QUEUED
+    assert states["Other/C"] == AgentTaskState.RUNNING
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_starts_shallower_agents_first():
+    manager = AgentTaskManager(max_running=1)
+    release = asyncio.Event()
+    started = []
+
+    async def sample_coro(name):
+        started.append(name)
+        await release.wait()
+
+    blocker = manager.start_task(AgentId("Agent/Blocker"), sample_coro("blocker"))
+    deep = manager.start_task(AgentId("Agent/A/Deep"), sample_coro("deep"))
+    shallow = manager.start_task(AgentId("Agent/B"), sample_coro("shallow"))
+
+    release.set()
+    await asyncio.gather(blocker, deep, shallow)
+
+    assert started == ["blocker", "shallow", "deep"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_queued_task_marks_it_cancelled():
+    manager = AgentTaskManager(max_running=1)
+    release = asyncio.Event()
+
+    async def sample_coro():
+        await release.wait()
+
+    running = manager.start_task(AgentId("Agent/A"), sample_coro())
+    queued = manager.start_task(AgentId("Agent/B"), sample_coro())
+
+    manager.cancel_task(AgentId("Agent/B"))
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    states = {str(info.agent_id): info.state for info in manager.snapshot()}
+    assert states["Agent/B"] == AgentTaskState.CANCELLED
+    release.set()
+    await running
+
+
+@pytest.mark.asyncio
+async def test_records_llm_time_on_the_enclosing_task():
+    manager = AgentTaskManager()
+
+    async def sample_coro():
+        manager.record_llm_time(AgentId("Agent/Coding"), 1.5)
+
+    await manager.start_task(AgentId("Agent"), sample_coro())
+
+    assert manager.snapshot()[0].llm_seconds == 1.5
+
+
+@pytest.mark.asyncio
+async def test_waiting_task_frees_its_slot():
+    manager = AgentTaskManager(max_running=1)
+    user_replied = asyncio.Event()
+    release = asyncio.Event()
+    started = []
+
+    async def waits_for_input():
+        async with manager.waiting(AgentId("Agent/A")):
+            await user_replied.wait()
+        started.append("A resumed")
+        await release.wait()
+
+    async def sample_coro(name):
+        started.append(name)
+        await release.wait()
+
+    waiting = manager.start_task(AgentId("Agent/A"), waits_for_input())
+    await asyncio.sleep(0.01)
+    other = manager.start_task(AgentId("Agent/B"), sample_coro("B"))
+    await asyncio.sleep(0.01)
+
+    states = {str(info.agent_id): info.state for info in manager.snapshot()}
+    assert states == {
+        "Agent/A": AgentTaskState.WAITING,
+        "Agent/B": AgentTaskState.RUNNING,
+    }
+
+    user_replied.set()
+    await asyncio.sleep(0.01)
+    assert started == ["B"]
+
+    release.set()
+    await asyncio.gather(waiting, other)
+    assert started == ["B", "A resumed"]
@@ -0,0 +1,60 @@
+from simple_agent.application.context_optimizer import (
+    SUPERSEDED_STUB,
+    ContextOptimizer,
+)
+
+FILE = "def main():\n    print('hello world')\n    return 0\n\n\nif __name__ == '__main__':\n    main()\n"
+
+
+def user(content):
+    return {"role": "user", "content": content}
+
+
+def assistant(content):
+    return {"role": "assistant", "content": content}
+
+
+def test_stubs_earlier_identical_read():
+    messages = [
+        user("Look at main.py"),
+        assistant("🛠️[cat main.py /]"),
+        user(f"Result of 🛠️ cat main.py\n{FILE}"),
+        assistant("🛠️[cat main.py /] 🛠️[ls . /]"),
+        user(f"Result of 🛠️ cat main.py\n{FILE}\n\nResult of 🛠️ ls .\nmain.py"),
+    ]
+
+    optimized = ContextOptimizer().optimize(messages)
+
+    assert optimized[2] == user(f"Result of 🛠️ cat main.py\n{SUPERSEDED_STUB}")
+    assert optimized[4] == messages[4]
+    assert messages[2] == user(f"Result of 🛠️ cat main.py\n{FILE}")
+
+
+def test_keeps_reads_whose_content_changed():
+    messages = [
+        user(f"Result of 🛠️ cat main.py\n{FILE}"),
+        assistant("edited"),
+        user(f"Result of 🛠️ cat main.py\n{FILE}# changed\n"),
+    ]
+
+    assert ContextOptimizer().optimize(messages) == messages
+
+
+def test_ignores_tools_with_side_effects():
+    output = "✅ Exit code 0 (0.1s elapsed)\n\nsome long enough output to matter here"
+    messages = [
+        user(f"Result of 🛠️ bash make\n{output}"),
+        user(f"Result of 🛠️ bash make\n{output}"),
+    ]
+
+    assert ContextOptimizer().optimize(messages) == messages
+
+
+def test_optimizing_is_deterministic():
+    messages = [
+        user(f"Result of 🛠️ cat main.py\n{FILE}"),
+        user(f"Result of 🛠️ cat main.py\n{FILE}"),
+    ]
+    optimizer = ContextOptimizer()
+
+    assert optimizer.optimize(messages) == optimizer.optimize(list(messages))
@@ -1,5 +1,6 @@
 from approvaltests import verify
 
+from simple_agent.application import emoji_bracket_tool_syntax
 from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
 from simple_agent.application.tool_library import ToolArgument, ToolArguments
 from simple_agent.tools.base_tool import BaseTool
@@ -544,3 +545,48 @@ class TestEmojiBracketRoundTrip:
         assert result.tool_calls[0].name == "multiline_tool"
         assert "test" in result.tool_calls[0].arguments
         assert "line1" in result.tool_calls[0].body
+
+
+class ScanCountingText(str):
+    """Counts the characters that find() walks over."""
+
+    def __init__(self, _text):
+        self.scanned = 0
+
+    def find(self, sub, start=None, end=None):
+        found = super().find(sub, start, end)
+        self.scanned += (len(self) if found == -1 else found) - (start or 0)
+        return found
+
+
+class ScanCountingPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.scans = 0
+
+    def finditer(self, text):
+        self.scans += 1
+        return self.pattern.finditer(text)
+
+
+class TestEmojiBracketLargeResponses:
+    def test_parses_megabyte_response_with_many_calls_in_linear_time(self, monkeypatch):
+        marker = ScanCountingPattern(emoji_bracket_tool_syntax._MARKER)
+        monkeypatch.setattr(emoji_bracket_tool_syntax, "_MARKER", marker)
+        syntax = EmojiBracketToolSyntax()
+        parts = []
+        for i in range(1000):
+            body = f"line {i}\n" * 110
+            parts.append(f"Writing {i}.\n🛠️[create-file f{i}.txt]\n{body}🛠️[/end]")
+            parts.append(f"🛠[cat f{i}.txt /]")
+        text = ScanCountingText("\n".join(parts))
+        assert len(text) > 1_000_000
+
+        result = syntax.parse(text)
+
+        assert len(result.tool_calls) == 2000
+        assert result.message == "Writing 0."
+        assert result.tool_calls[-2].body == ("line 999\n" * 110).rstrip("\n")
+        assert result.tool_calls[-1].arguments == "f999.txt"
+        assert marker.scans == 1
+        assert text.scanned <= len(text)
@@ -156,6 +156,7 @@ class TestEventSerializer:
             "display_body": "Tool Body",
             "display_language": "python",
             "status": "success",
+            "completes": False,
         }
 
     def test_deserialize_tool_result_event(self):
@@ -181,6 +182,20 @@ class TestEventSerializer:
         assert result.result.display_body == "Tool Body"
         assert result.result.display_language == "python"
         assert result.result.success is True
+        assert result.result.do_continue() is True
+
+    def test_round_trips_completing_tool_result(self):
+        event = ToolResultEvent(
+            agent_id=AgentId("Agent"),
+            call_id="call-123",
+            result=SingleToolResult(message="Done", completes=True),
+        )
+
+        result = EventSerializer.from_dict(EventSerializer.to_dict(event))
+
+        assert isinstance(result, ToolResultEvent)
+        assert result.result is not None
+        assert result.result.do_continue() is False
 
     def test_serialize_session_cleared_event(self):
         event = SessionClearedEvent(agent_id=AgentId("Agent"))
@@ -4,10 +4,13 @@ from simple_agent.application.events import (
     AgentStartedEvent,
     AssistantRespondedEvent,
     SessionClearedEvent,
+    ToolCalledEvent,
+    ToolCancelledEvent,
     ToolResultEvent,
     UserPromptedEvent,
 )
 from simple_agent.application.events_to_messages import events_to_messages
+from simple_agent.application.tool_library import ParsedTool, RawToolCall
 from simple_agent.application.tool_results import SingleToolResult
 
 
@@ -146,3 +149,50 @@ class TestEventsToMessages:
         messages = events_to_messages(events, agent_id)
 
         assert len(messages.to_list()) == 0
+
+    def test_groups_known_tool_calls_like_the_live_context(self):
+        agent_id = AgentId("Agent")
+        events = [
+            AssistantRespondedEvent(agent_id=agent_id, response="Reading"),
+            ToolCalledEvent(
+                agent_id, "call-1", ParsedTool(RawToolCall("cat", "a.txt"), None)
+            ),
+            ToolResultEvent(agent_id, "call-1", SingleToolResult(message="A")),
+            ToolCalledEvent(
+                agent_id, "call-2", ParsedTool(RawToolCall("ls", "."), None)
+            ),
+            ToolResultEvent(agent_id, "call-2", SingleToolResult(message="a.txt")),
+            ToolCalledEvent(
+                agent_id,
+                "call-3",
+                ParsedTool(RawToolCall("complete-task", "done"), None),
+            ),
+            ToolResultEvent(
+                agent_id, "call-3", SingleToolResult(message="done", completes=True)
+            ),
+        ]
+
+        messages = events_to_messages(events, agent_id)
+
+        assert messages.to_list()[1] == {
+            "role": "user",
+            "content": "Result of 🛠️ cat a.txt\nA\n\nResult of 🛠️ ls .\na.txt",
+        }
+
+    def test_drops_results_of_cancelled_tool_batch(self):
+        agent_id = AgentId("Agent")
+        events = [
+            AssistantRespondedEvent(agent_id=agent_id, response="Reading"),
+            ToolCalledEvent(
+                agent_id, "call-1", ParsedTool(RawToolCall("cat", "a.txt"), None)
+            ),
+            ToolResultEvent(agent_id, "call-1", SingleToolResult(message="A")),
+            ToolCalledEvent(
+                agent_id, "call-2", ParsedTool(RawToolCall("bash", "sleep 9"), None)
+            ),
+            ToolCancelledEvent(agent_id, "call-2"),
+        ]
+
+        messages = events_to_messages(events, agent_id)
+
+        assert len(messages.to_list()) == 1
@@ -0,0 +1,64 @@
+import time
+
+from simple_agent.application.agent_id import AgentId
+from simple_agent.application.event_bus import SimpleEventBus
+from simple_agent.application.events import (
+    AssistantSaidEvent,
+    HistoryReplayFinishedEvent,
+    HistoryReplayStartedEvent,
+    UserPromptedEvent,
+)
+from simple_agent.application.history_replayer import HistoryReplayer
+from simple_agent.infrastructure.file_event_store import FileEventStore
+from tests.event_spy import EventSpy
+
+AGENT_ID = AgentId("Agent")
+
+
+async def test_replay_is_wrapped_in_started_and_finished_events(tmp_path):
+    event_store = FileEventStore(tmp_path)
+    event_store.persist(UserPromptedEvent(AGENT_ID, "Hello"))
+    event_store.persist(AssistantSaidEvent(AGENT_ID, "Hi"))
+    event_bus = SimpleEventBus()
+    spy = EventSpy()
+    for event_type in (
+        HistoryReplayStartedEvent,
+        UserPromptedEvent,
+        AssistantSaidEvent,
+        HistoryReplayFinishedEvent,
+    ):
+        event_bus.subscribe(event_type, spy.record_event)
+
+    await HistoryReplayer(event_bus, event_store).replay_all_agents_async(AGENT_ID)
+
+    assert [type(event) for event in spy.events] == [
+        HistoryReplayStartedEvent,
+        UserPromptedEvent,
+        AssistantSaidEvent,
+        HistoryReplayFinishedEvent,
+    ]
+
+
+async def test_replaying_thousands_of_events_does_not_sleep(tmp_path):
+    event_store = FileEventStore(tmp_path)
+    for index in range(2500):
+        event_store.persist(UserPromptedEvent(AGENT_ID, f"question {index}"))
+        event_store.persist(AssistantSaidEvent(AGENT_ID, f"answer {index}"))
+    replayer = HistoryReplayer(SimpleEventBus(), event_store)
+
+    started = time.perf_counter()
+    await replayer.replay_all_agents_async(AGENT_ID)
+
+    assert time.perf_counter() - started < 2
+
+
+async def test_empty_history_publishes_nothing(tmp_path):
+    event_bus = SimpleEventBus()
+    spy = EventSpy()
+    event_bus.subscribe(HistoryReplayStartedEvent, spy.record_event)
+
+    await HistoryReplayer(event_bus, FileEventStore(tmp_path)).replay_all_agents_async(
+        AGENT_ID
+    )
+
+    assert spy.events == []
@@ -12,6 +12,7 @@ from simple_agent.application.llm import (
     LLMProvider,
     LLMResponse,
     TokenUsage,
+    ToolSchema,
 )
 from simple_agent.application.session import Session
 from simple_agent.application.todo_cleanup import TodoCleanup
@@ -30,7 +31,9 @@ class MockLLM(LLM):
     def model(self) -> str:
         return self._model_name
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
         self.calls.append(messages)
         return LLMResponse(
             content=f"Response from {self._model_name}",
@@ -0,0 +1,162 @@
+from simple_agent.application.brain import Brain
+from simple_agent.application.llm import LLMResponse, ToolUse
+from simple_agent.application.native_tool_syntax import NativeToolSyntax
+from simple_agent.application.tool_documentation import generate_tools_documentation
+from simple_agent.application.tool_library import RawToolCall
+from tests.test_helpers import create_all_tools_for_test
+
+
+def tool_named(tools, name):
+    return next(tool for tool in tools.tools if tool.name == name)
+
+
+def test_schemas_describe_header_and_body_arguments():
+    tools = create_all_tools_for_test(NativeToolSyntax())
+
+    schemas = {s.name: s for s in tools.tool_syntax.tool_schemas(tools.tools)}
+
+    read_many = schemas["read-many"].parameters
+    assert read_many["properties"]["max_chars"]["type"] == "integer"
+    assert read_many["properties"]["files"]["type"] == "string"
+    assert read_many["required"] == ["files"]
+    assert "{{AGENT_TYPES}}" not in str(schemas["parallel-subagents"])
+
+
+def test_tool_uses_map_to_raw_calls_in_argument_order():
+    syntax = NativeToolSyntax()
+    tools = create_all_tools_for_test(syntax)
+    cat = tool_named(tools, "cat")
+
+    raw_call = syntax.to_raw_call(
+        ToolUse("cat", {"line_range": "1-5", "filename": "a.py"}), cat
+    )
+
+    assert raw_call == RawToolCall("cat", "a.py 1-5")
+
+
+def test_flag_arguments_are_declared_as_booleans_and_passed_by_name():
+    syntax = NativeToolSyntax()
+    tools = create_all_tools_for_test(syntax)
+    subagent = tool_named(tools, "subagent")
+    schemas = {s.name: s for s in syntax.tool_schemas(tools.tools)}
+
+    flagged = syntax.to_raw_call(
+        ToolUse(
+            "subagent",
+            {"agenttype": "coding", "task_description": "fix the bug", "--async": True},
+        ),
+        subagent,
+    )
+    unflagged = syntax.to_raw_call(
+        ToolUse(
+            "subagent",
+            {
+                "agenttype": "coding",
+                "task_description": "fix the bug",
+                "--async": False,
+            },
+        ),
+        subagent,
+    )
+
+    properties = schemas["subagent"].parameters["properties"]
+    assert properties["--async"]["type"] == "boolean"
+    assert flagged == RawToolCall("subagent", "coding fix the bug --async")
+    assert unflagged == RawToolCall("subagent", "coding fix the bug")
+
+
+async def run_tool_use(tool_use):
+    syntax = NativeToolSyntax()
+    tool = tool_named(create_all_tools_for_test(syntax), tool_use.name)
+    return await tool.execute(syntax.to_raw_call(tool_use, tool))
+
+
+async def test_search_values_with_spaces_and_flags_reach_the_tool(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("DEF MAIN():\n    pass\n")
+    (tmp_path / "other.py").write_text("def main():\n")
+
+    result = await run_tool_use(
+        ToolUse("search", {"query": "def main(", "path": "src", "ignore_case": True})
+    )
+
+    assert result.success
+    assert result.message == "Found 1 match in 1 file\nsrc/app.py\n     1: DEF MAIN():"
+
+
+async def test_cat_reads_file_names_with_spaces(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "my file.txt").write_text("one\ntwo\n")
+
+    result = await run_tool_use(
+        ToolUse("cat", {"filename": "my file.txt", "with_line_numbers": True})
+    )
+
+    assert result.success
+    assert result.message == "     1\tone\n     2\ttwo"
+
+
+async def test_missing_optional_arguments_keep_later_positions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub dir").mkdir()
+    (tmp_path / "sub dir" / "a.txt").write_text("a")
+
+    result = await run_tool_use(ToolUse("ls", {"depth": 2, "with_sizes": False}))
+
+    assert result.success
+    assert result.message == "sub dir/\nsub dir/a.txt"
+
+
+def test_calls_are_formatted_in_emoji_bracket_form():
+    syntax = NativeToolSyntax()
+
+    assert syntax.format_call(RawToolCall("ls", "src")) == "🛠️[ls src /]"
+    assert (
+        syntax.format_call(RawToolCall("create-file", "a.txt", "hello"))
+        == "🛠️[create-file a.txt]\nhello\n🛠️[/end]"
+    )
+
+
+def test_documentation_only_names_the_tools():
+    tools = create_all_tools_for_test(NativeToolSyntax())
+
+    documentation = generate_tools_documentation(tools.tools, tools.tool_syntax)
+
+    assert "tool calling interface" in documentation
+    assert "### Usage" not in documentation
+    assert "read-many" in documentation
+
+
+class ToolUsingLLM:
+    def __init__(self, response: LLMResponse):
+        self.response = response
+        self.tools = None
+
+    @property
+    def model(self) -> str:
+        return "native-model"
+
+    async def call_async(self, messages, tools=None):
+        self.tools = tools
+        return self.response
+
+
+async def test_brain_sends_schemas_and_uses_structured_calls():
+    tools = create_all_tools_for_test(NativeToolSyntax())
+    llm = ToolUsingLLM(
+        LLMResponse(
+            content="Let me look.",
+            tool_uses=[ToolUse("ls", {"path": "src"})],
+        )
+    )
+    brain = Brain("Test", "system prompt", llm, tools)
+
+    response, parsed = await brain.respond([{"role": "user", "content": "Hi"}])
+
+    assert llm.tools is not None and "ls" in {schema.name for schema in llm.tools}
+    assert parsed.message == "Let me look."
+    assert [str(tool) for tool in parsed.tools] == ["🛠️ ls src"]
+    assert response.content == "Let me look.\n🛠️[ls src /]"
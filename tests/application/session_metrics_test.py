@@ -0,0 +1,184 @@
+import pytest
+
+from simple_agent.application.agent_id import AgentId
+from simple_agent.application.event_bus import SimpleEventBus
+from simple_agent.application.events import (
+    AssistantRespondedEvent,
+    StatsRequestedEvent,
+    StatsShownEvent,
+    ToolCalledEvent,
+    ToolCancelledEvent,
+    ToolResultEvent,
+)
+from simple_agent.application.llm import TokenUsage
+from simple_agent.application.session_metrics import (
+    Histogram,
+    ModelPrice,
+    SessionMetrics,
+)
+from simple_agent.application.tool_library import ParsedTool, RawToolCall
+from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
+
+AGENT = AgentId("Agent")
+PRICES = {
+    "priced-model": ModelPrice(input=3.0, output=15.0, cached_input=0.3),
+    "cache-write-model": ModelPrice(
+        input=3.0, output=15.0, cached_input=0.3, cache_write=3.75
+    ),
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def bus():
+    return SimpleEventBus()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def metrics(bus, clock):
+    metrics = SessionMetrics(bus, PRICES, clock=clock)
+    metrics.subscribe()
+    return metrics
+
+
+def respond(
+    bus, model, latency, input_tokens=0, output_tokens=0, cached=0, cache_write=0
+):
+    usage = TokenUsage(
+        input_tokens,
+        output_tokens,
+        input_tokens + output_tokens,
+        None,
+        cached,
+        cache_write,
+    )
+    bus.publish(
+        AssistantRespondedEvent(
+            AGENT, "answer", model=model, usage=usage, latency_seconds=latency
+        )
+    )
+
+
+def run_tool(bus, clock, call_id, name, seconds, success=True):
+    bus.publish(
+        ToolCalledEvent(AGENT, call_id, ParsedTool(RawToolCall(name, ""), None))
+    )
+    clock.now += seconds
+    status = ToolResultStatus.SUCCESS if success else ToolResultStatus.FAILURE
+    bus.publish(ToolResultEvent(AGENT, call_id, SingleToolResult("", status=status)))
+
+
+def test_counts_tokens_and_cost_per_agent_and_model(bus, metrics):
+    respond(bus, "priced-model", 1.0, input_tokens=1_000_000, cached=800_000)
+    respond(bus, "priced-model", 3.0, output_tokens=100_000)
+
+    model = metrics.snapshot()["agents"]["Agent"]["models"]["priced-model"]
+
+    assert model["llm_calls"] == 2
+    assert model["input_tokens"] == 1_000_000
+    assert model["cached_input_tokens"] == 800_000
+    assert model["output_tokens"] == 100_000
+    # 200k uncached at $3, 800k cached at $0.30 and 100k output at $15
+    assert model["cost_usd"] == pytest.approx(0.6 + 0.24 + 1.5)
+    assert model["latency_seconds"]["p50"] == 1.0
+    assert model["latency_seconds"]["max"] == 3.0
+
+
+def test_prices_cache_writes_separately_from_plain_input(bus, metrics):
+    respond(
+        bus,
+        "cache-write-model",
+        1.0,
+        input_tokens=1_000_000,
+        cached=500_000,
+        cache_write=400_000,
+    )
+    respond(bus, "priced-model", 1.0, input_tokens=1_000_000, cache_write=1_000_000)
+
+    snapshot = metrics.snapshot()
+    model = snapshot["agents"]["Agent"]["models"]["cache-write-model"]
+
+    assert model["cache_write_input_tokens"] == 400_000
+    # 100k uncached at $3, 500k cached at $0.30 and 400k written at $3.75
+    assert model["cost_usd"] == pytest.approx(0.3 + 0.15 + 1.5)
+    # Without a cache write price, writes cost the plain input price
+    assert snapshot["agents"]["Agent"]["models"]["priced-model"][
+        "cost_usd"
+    ] == pytest.approx(3.0)
+    assert snapshot["totals"]["cache_write_input_tokens"] == 1_400_000
+
+
+def test_total_cost_is_unknown_once_a_model_has_no_price(bus, metrics):
+    respond(bus, "priced-model", 1.0, input_tokens=1000)
+    respond(bus, "other-model", 1.0, input_tokens=1000)
+
+    totals = metrics.snapshot()["totals"]
+
+    assert totals["input_tokens"] == 2000
+    assert totals["cost_usd"] is None
+
+
+def test_times_tools_from_call_to_result(bus, clock, metrics):
+    run_tool(bus, clock, "1", "cat", 0.5)
+    run_tool(bus, clock, "2", "cat", 1.5, success=False)
+    bus.publish(ToolCalledEvent(AGENT, "3", ParsedTool(RawToolCall("bash", ""), None)))
+    bus.publish(ToolCancelledEvent(AGENT, "3"))
+
+    tools = metrics.snapshot()["agents"]["Agent"]["tools"]
+
+    assert tools == {
+        "cat": {
+            "calls": 2,
+            "failures": 1,
+            "duration_seconds": {
+                "count": 2,
+                "mean": 1.0,
+                "p50": 0.5,
+                "p90": 1.5,
+                "p99": 1.5,
+                "max": 1.5,
+            },
+        }
+    }
+
+
+def test_answers_stats_requests_with_a_report(bus, clock, metrics):
+    shown = []
+    bus.subscribe(StatsShownEvent, shown.append)
+    respond(bus, "priced-model", 2.0, input_tokens=1200, output_tokens=300)
+    run_tool(bus, clock, "1", "cat", 0.25)
+
+    bus.publish(StatsRequestedEvent(AGENT))
+
+    assert shown == [
+        StatsShownEvent(
+            AGENT,
+            "Agent\n"
+            "  priced-model: 1 calls, 1,200 tokens in (0 cached), 300 out, $0.0081\n"
+            "    latency p50 2.00s, p90 2.00s, max 2.00s\n"
+            "  cat: 1 calls, p50 0.25s, p90 0.25s, max 0.25s\n"
+            "Total: 1,200 tokens in (0 cached), 300 out, $0.0081",
+        )
+    ]
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for value in [5, 1, 4, 2, 3]:
+        histogram.observe(value)
+
+    assert histogram.percentile(0) == 1
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(100) == 5
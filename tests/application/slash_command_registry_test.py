@@ -4,7 +4,11 @@ from simple_agent.application.slash_command_registry import (
     CommandParseError,
     SlashCommandRegistry,
 )
-from simple_agent.application.slash_commands import ClearCommand, ModelCommand
+from simple_agent.application.slash_commands import (
+    ClearCommand,
+    ModelCommand,
+    StatsCommand,
+)
 
 
 def test_registry_returns_all_commands():
@@ -13,6 +17,7 @@ def test_registry_returns_all_commands():
 
     assert "/clear" in commands
     assert "/model" in commands
+    assert "/stats" in commands
 
 
 def test_registry_filters_commands_by_prefix():
@@ -29,10 +34,11 @@ def test_registry_returns_all_on_slash_only():
     registry = SlashCommandRegistry()
     matches = registry.get_matching_commands("/")
 
-    assert len(matches) == 2
+    assert len(matches) == 3
     names = [name for name, _ in matches]
     assert "/clear" in names
     assert "/model" in names
+    assert "/stats" in names
 
 
 def test_registry_returns_empty_for_no_matches():
@@ -89,6 +95,14 @@ def test_parse_clear_command_with_args_raises_error():
         registry.parse("/clear foo")
 
 
+def test_parse_stats_command():
+    registry = SlashCommandRegistry()
+
+    assert isinstance(registry.parse("/stats"), StatsCommand)
+    with pytest.raises(CommandParseError, match="does not take arguments"):
+        registry.parse("/stats all")
+
+
 def test_parse_model_command():
     registry = SlashCommandRegistry()
     command = registry.parse("/model gpt-4")
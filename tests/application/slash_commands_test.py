@@ -5,6 +5,7 @@ from simple_agent.application.slash_commands import (
     ClearCommand,
     ModelCommand,
     SlashCommandVisitor,
+    StatsCommand,
 )
 
 
@@ -14,6 +15,7 @@ class SlashCommandVisitorSpy(SlashCommandVisitor):
     def __init__(self):
         self.cleared = False
         self.model_changed_to = None
+        self.stats_shown = False
 
     async def clear_conversation(self, command: ClearCommand) -> None:
         self.cleared = True
@@ -24,6 +26,9 @@ class SlashCommandVisitorSpy(SlashCommandVisitor):
     async def visit_agent_command(self, command: AgentCommand) -> None:
         return None
 
+    async def show_stats(self, command: StatsCommand) -> None:
+        self.stats_shown = True
+
 
 async def test_clear_command_accepts_visitor():
     visitor = SlashCommandVisitorSpy()
@@ -43,6 +48,14 @@ async def test_model_command_accepts_visitor():
     assert visitor.model_changed_to == "gpt-4"
 
 
+async def test_stats_command_accepts_visitor():
+    visitor = SlashCommandVisitorSpy()
+
+    await StatsCommand().accept(visitor)
+
+    assert visitor.stats_shown is True
+
+
 def test_clear_command_has_name_and_description():
     command = ClearCommand()
     assert command.name == "/clear"
@@ -0,0 +1,56 @@
+from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
+from simple_agent.application.tool_documentation import (
+    ToolsDocumentationCache,
+    generate_tools_documentation,
+)
+from simple_agent.tools.base_tool import BaseTool
+
+
+class TemplatedTool(BaseTool):
+    name = "templated"
+    description = "Works with {{TARGETS}}"
+
+    def __init__(self, targets: str):
+        super().__init__()
+        self._targets = targets
+
+    def get_template_variables(self) -> dict:
+        return {"TARGETS": self._targets}
+
+
+class OtherTool(BaseTool):
+    name = "other"
+    description = "Another tool"
+
+
+def test_cache_renders_same_documentation_as_generator():
+    syntax = EmojiBracketToolSyntax()
+    tools = [TemplatedTool("files"), OtherTool()]
+
+    documentation = ToolsDocumentationCache().render(tools, syntax)
+
+    assert documentation == generate_tools_documentation(tools, syntax)
+
+
+def test_cache_reuses_documentation_for_equal_tool_sets():
+    syntax = EmojiBracketToolSyntax()
+    cache = ToolsDocumentationCache()
+
+    first = cache.render([TemplatedTool("files"), OtherTool()], syntax)
+    second = cache.render([TemplatedTool("files"), OtherTool()], syntax)
+
+    assert second is first
+
+
+def test_cache_distinguishes_tool_sets_and_template_variables():
+    syntax = EmojiBracketToolSyntax()
+    cache = ToolsDocumentationCache()
+
+    files = cache.render([TemplatedTool("files")], syntax)
+    agents = cache.render([TemplatedTool("agents")], syntax)
+    both = cache.render([TemplatedTool("files"), OtherTool()], syntax)
+
+    assert "Works with files" in files
+    assert "Works with agents" in agents
+    assert "other tool" in both
+    assert "other tool" not in files
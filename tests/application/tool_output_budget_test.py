@@ -0,0 +1,32 @@
+from simple_agent.application.artifact_store import InMemoryArtifactStore
+from simple_agent.application.tool_output_budget import ToolOutputBudget
+from simple_agent.application.tool_results import SingleToolResult
+
+
+def test_keeps_results_within_budget():
+    budget = ToolOutputBudget(InMemoryArtifactStore(), max_chars=100)
+    result = SingleToolResult("short output")
+
+    assert budget.apply(result) is result
+
+
+def test_spills_oversized_result_to_artifact():
+    store = InMemoryArtifactStore()
+    budget = ToolOutputBudget(store, max_chars=200)
+    output = "\n".join(f"line {i}" for i in range(1, 101))
+
+    spilled = budget.apply(SingleToolResult(output))
+
+    assert store.load("artifact-1") == output
+    assert "artifact-1" in spilled.message
+    assert "line 1\n" in spilled.message
+    assert spilled.message.endswith("line 100")
+    assert "line 50\n" not in spilled.message
+    assert spilled.success is True
+
+
+def test_does_not_spill_completing_results():
+    budget = ToolOutputBudget(InMemoryArtifactStore(), max_chars=10)
+    result = SingleToolResult("a long summary of the task", completes=True)
+
+    assert budget.apply(result) is result
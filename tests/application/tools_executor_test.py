@@ -28,6 +28,9 @@ class ToolLibraryStub(ToolLibrary):
     def parse_message_and_tools(self, text: str) -> MessageAndParsedTools:
         return MessageAndParsedTools(text, [])
 
+    def resolve_tool_uses(self, message: str, tool_uses) -> MessageAndParsedTools:
+        return MessageAndParsedTools(message, [])
+
     async def execute_parsed_tool(self, parsed_tool):
         return await parsed_tool.tool_instance.execute(parsed_tool.raw_call)
 
@@ -0,0 +1,96 @@
+import pytest
+
+from simple_agent.application.tracing import Tracer, tracer
+from tests.session_test_bed import SessionTestBed
+
+
+def read_events(document):
+    return document["traceEvents"]
+
+
+def spans(events):
+    return [event for event in events if event["ph"] == "X"]
+
+
+def test_disabled_tracer_records_nothing():
+    disabled = Tracer()
+
+    with disabled.span("work", agent_id="Agent") as span:
+        span.set("status", 200)
+
+    assert disabled.enabled is False
+    assert disabled.stop() is None
+
+
+def test_nested_spans_inherit_agent_and_call_ids():
+    trace = Tracer()
+    trace.start()
+
+    with trace.span("tool cat", "tool", agent_id="Agent", call_id="Agent::1"):
+        with trace.span("HTTP POST", "http", path="/v1/messages") as span:
+            span.set("status", 200)
+    with trace.span("other"):
+        pass
+    document = trace.stop()
+
+    assert document is not None
+    assert document["displayTimeUnit"] == "ms"
+    http, tool, other = spans(read_events(document))
+    assert http["name"] == "HTTP POST"
+    assert http["args"] == {
+        "agent_id": "Agent",
+        "call_id": "Agent::1",
+        "path": "/v1/messages",
+        "status": "200",
+    }
+    assert http["tid"] == tool["tid"]
+    assert tool["ts"] <= http["ts"]
+    assert http["ts"] + http["dur"] <= tool["ts"] + tool["dur"]
+    assert other["args"] == {}
+    assert other["tid"] != tool["tid"]
+
+
+def test_records_lane_names_and_failures():
+    trace = Tracer()
+    trace.start()
+
+    with pytest.raises(ValueError):
+        with trace.span("Brain.respond", agent_id="Agent/Coder"):
+            raise ValueError("boom")
+    events = read_events(trace.stop())
+
+    assert events[0] == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": events[1]["pid"],
+        "tid": events[1]["tid"],
+        "args": {"name": "Agent/Coder"},
+    }
+    assert events[1]["args"]["error"] == "ValueError"
+
+
+async def test_traces_a_turn_with_a_tool_call(tmp_path):
+    (tmp_path / "notes.txt").write_text("notes")
+    tracer.start()
+    try:
+        await (
+            SessionTestBed()
+            .with_llm_responses(
+                [f"🛠️[cat {tmp_path / 'notes.txt'} /]", "🛠️[complete-task done /]"]
+            )
+            .with_user_inputs("Read the notes")
+            .run()
+        )
+    finally:
+        document = tracer.stop()
+
+    names = [event["name"] for event in spans(read_events(document))]
+    assert "Agent.llm_responds" in names
+    assert "Brain.respond" in names
+    assert "tool cat" in names
+    tool = next(e for e in spans(read_events(document)) if e["name"] == "tool cat")
+    assert tool["args"]["call_id"].endswith("::tool_call::1")
+    handlers = [e for e in spans(read_events(document)) if e["cat"] == "event"]
+    assert {"ToolCalledEvent", "ToolResultEvent"} <= {
+        e["args"]["event"] for e in handlers
+    }
@@ -1,4 +1,5 @@
 import io
+import json
 import os
 import subprocess
 import sys
@@ -110,3 +111,23 @@ def test_non_interactive_stub_exits_successfully(tmp_path):
     )
 
     assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_headless_json_stub_streams_events_and_exits_successfully(tmp_path):
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = project_root
+
+    result = subprocess.run(
+        [sys.executable, "-m", "simple_agent.main", "--stub", "--json", "Hello"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=20,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    events = [json.loads(line) for line in result.stdout.splitlines()]
+    assert events[0]["type"] == "AgentStartedEvent"
+    assert events[-1] == {"type": "AgentFinishedEvent", "agent_id": "Orchestrator"}
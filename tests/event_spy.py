@@ -26,6 +26,8 @@ class EventSpy:
             if type(actual) is not type(expected_event):
                 return False
             for field in fields(expected_event):
+                if not field.compare:
+                    continue
                 expected_val = getattr(expected_event, field.name)
                 if expected_val is None or expected_val == "":
                     # Treat None or empty string as "don't care" for testing convenience
@@ -50,7 +52,7 @@ class EventSpy:
         for event in self.events:
             field_values = []
             for field in fields(event):
-                if field.name != "agent_id":
+                if field.name != "agent_id" and field.compare:
                     field_values.append(str(getattr(event, field.name)))
             lines.append(
                 f"{event.agent_id}: {event.event_name:>21}: {' '.join(field_values)}"
@@ -1,13 +1,27 @@
+import builtins
+import glob
+import os
+
 import pytest
 
+from simple_agent.application.agent_factory import AgentFactory
 from simple_agent.application.agent_id import AgentId
+from simple_agent.application.agent_task_manager import AgentTaskManager
 from simple_agent.application.agent_type import AgentType
+from simple_agent.application.emoji_bracket_tool_syntax import EmojiBracketToolSyntax
+from simple_agent.application.event_bus import SimpleEventBus
+from simple_agent.application.event_store import NoOpEventStore
+from simple_agent.application.llm_stub import StubLLMProvider, create_llm_stub
+from simple_agent.infrastructure import agent_library
 from simple_agent.infrastructure.agent_library import (
     BuiltinAgentLibrary,
     FileSystemAgentLibrary,
     create_agent_library,
 )
 from simple_agent.infrastructure.user_configuration import UserConfiguration
+from simple_agent.tools.all_tools import AllToolsFactory
+from tests.test_helpers import DummyProjectTree
+from tests.user_input_stub import UserInputStub
 
 
 def test_create_agent_library(tmp_path):
@@ -116,3 +130,94 @@ def test_builtin_agent_library_discovers_agents_from_fallback():
     agent_types = library.list_agent_types()
 
     assert "coding" in agent_types
+
+
+def test_filesystem_agent_library_reuses_unchanged_definition(tmp_path):
+    path = tmp_path / "coding.agent.md"
+    path.write_text("---\nname: First\n---\n", encoding="utf-8")
+    library = FileSystemAgentLibrary(str(tmp_path))
+
+    first = library.read_agent_definition(AgentType("coding"))
+    second = library.read_agent_definition(AgentType("coding"))
+
+    assert second is first
+
+
+def test_filesystem_agent_library_rereads_modified_definition(tmp_path):
+    path = tmp_path / "coding.agent.md"
+    path.write_text("---\nname: First\n---\n", encoding="utf-8")
+    library = FileSystemAgentLibrary(str(tmp_path))
+    library.read_agent_definition(AgentType("coding"))
+
+    path.write_text("---\nname: Second\n---\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    definition = library.read_agent_definition(AgentType("coding"))
+
+    assert definition.agent_name() == "Second"
+
+
+def test_filesystem_agent_library_relists_when_directory_changes(tmp_path):
+    (tmp_path / "a.agent.md").write_text("content", encoding="utf-8")
+    library = FileSystemAgentLibrary(str(tmp_path))
+    assert library.list_agent_types() == ["a"]
+
+    (tmp_path / "b.agent.md").write_text("content", encoding="utf-8")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert library.list_agent_types() == ["a", "b"]
+
+
+def test_builtin_agent_library_reuses_definitions():
+    library = BuiltinAgentLibrary()
+
+    first = library.read_agent_definition(AgentType("coding"))
+    second = library.read_agent_definition(AgentType("coding"))
+
+    assert second is first
+
+
+async def test_spawning_200_subagents_scans_and_reads_agent_files_once(
+    tmp_path, monkeypatch
+):
+    (tmp_path / "worker.agent.md").write_text(
+        "---\nname: Worker\ntools: complete_task\n---\nDo the work.",
+        encoding="utf-8",
+    )
+    library = FileSystemAgentLibrary(str(tmp_path))
+    globs = []
+    original_glob = glob.glob
+    monkeypatch.setattr(
+        glob, "glob", lambda pattern: globs.append(pattern) or original_glob(pattern)
+    )
+    opened = []
+    monkeypatch.setattr(
+        agent_library,
+        "open",
+        lambda path, *args, **kwargs: (
+            opened.append(path) or builtins.open(path, *args, **kwargs)
+        ),
+        raising=False,
+    )
+    agent_factory = AgentFactory(
+        event_bus=SimpleEventBus(),
+        tool_library_factory=AllToolsFactory(EmojiBracketToolSyntax()),
+        agent_library=library,
+        user_input=UserInputStub(),
+        llm_provider=StubLLMProvider.for_testing(
+            create_llm_stub([], default="🛠️[complete-task done]")
+        ),
+        project_tree=DummyProjectTree(),
+        event_store=NoOpEventStore(),
+        agent_task_manager=AgentTaskManager(),
+    )
+    spawn = agent_factory.create_spawner(AgentId("Agent"))
+
+    for index in range(200):
+        result = await spawn(AgentType("worker"), f"task {index}", until_complete=True)
+        assert result.success
+
+    assert len(globs) == 1
+    assert opened == [str(tmp_path / "worker.agent.md")]
@@ -1,6 +1,9 @@
+import json
+
 import httpx
 import pytest
 
+from simple_agent.application.llm import ToolSchema, ToolUse
 from simple_agent.infrastructure.claude.claude_client import (
     ClaudeClientError,
     ClaudeLLM,
@@ -36,6 +39,32 @@ async def test_claude_chat_returns_content_text():
     assert result.usage.total_tokens == 30
 
 
+@pytest.mark.asyncio
+async def test_claude_chat_counts_cached_prompt_tokens_as_input():
+    response_data = {
+        "content": [{"text": "assistant response"}],
+        "usage": {
+            "input_tokens": 10,
+            "cache_read_input_tokens": 900,
+            "cache_creation_input_tokens": 90,
+            "output_tokens": 20,
+        },
+    }
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=response_data)
+    )
+
+    result = await ClaudeLLM(build_config(), transport=transport).call_async(
+        [{"role": "user", "content": "Hello"}]
+    )
+
+    assert result.usage is not None
+    assert result.usage.input_tokens == 1000
+    assert result.usage.cached_input_tokens == 900
+    assert result.usage.cache_write_input_tokens == 90
+    assert result.usage.total_tokens == 1020
+
+
 @pytest.mark.asyncio
 async def test_claude_chat_raises_error_when_content_missing():
     transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
@@ -62,6 +91,39 @@ async def test_claude_chat_raises_error_when_request_fails():
     assert "API request failed" in str(error.value)
 
 
+@pytest.mark.asyncio
+async def test_claude_chat_declares_tools_and_returns_tool_uses():
+    captured = {}
+
+    def handler(request):
+        captured["json"] = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "content": [
+                    {"type": "text", "text": "Listing."},
+                    {
+                        "type": "tool_use",
+                        "id": "1",
+                        "name": "ls",
+                        "input": {"path": "src"},
+                    },
+                ]
+            },
+        )
+
+    chat = ClaudeLLM(build_config(), transport=httpx.MockTransport(handler))
+    schema = ToolSchema("ls", "List files", {"type": "object", "properties": {}})
+
+    result = await chat.call_async([{"role": "user", "content": "Hi"}], tools=[schema])
+
+    assert captured["json"]["tools"] == [
+        {"name": "ls", "description": "List files", "input_schema": schema.parameters}
+    ]
+    assert result.content == "Listing."
+    assert result.tool_uses == [ToolUse("ls", {"path": "src"})]
+
+
 def build_config(base_url: str | None = None) -> ModelConfig:
     return ModelConfig(
         name="claude",
@@ -0,0 +1,16 @@
+from simple_agent.infrastructure.file_artifact_store import FileArtifactStore
+
+
+def test_saves_and_loads_artifact(tmp_path):
+    store = FileArtifactStore(tmp_path)
+
+    artifact_id = store.save("big output")
+
+    assert store.load(artifact_id) == "big output"
+    assert (tmp_path / "artifacts" / f"{artifact_id}.txt").exists()
+
+
+def test_rejects_ids_outside_the_store(tmp_path):
+    store = FileArtifactStore(tmp_path)
+
+    assert store.load("../manifest") is None
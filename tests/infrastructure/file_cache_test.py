@@ -0,0 +1,49 @@
+import os
+
+from simple_agent.infrastructure.file_cache import FileCache
+
+
+def test_serves_repeated_reads_from_cache(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("content", encoding="utf-8")
+    cache = FileCache()
+
+    assert cache.read_text(path) == "content"
+    assert cache.read_text(path) == "content"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_rereads_when_file_changes_on_disk(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("before", encoding="utf-8")
+    cache = FileCache()
+    cache.read_text(path)
+
+    path.write_text("after!", encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+    assert cache.read_text(path) == "after!"
+    assert cache.stats().misses == 2
+
+
+def test_invalidate_drops_entry(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("content", encoding="utf-8")
+    cache = FileCache()
+    cache.read_text(path)
+
+    cache.invalidate(path)
+
+    assert cache.stats().entries == 0
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = FileCache(max_bytes=10)
+    for name in ["a", "b", "c"]:
+        (tmp_path / name).write_text(name * 4, encoding="utf-8")
+        cache.read_text(tmp_path / name)
+
+    stats = cache.stats()
+    assert (stats.entries, stats.size, stats.evictions) == (2, 8, 1)
@@ -1,6 +1,9 @@
+import json
+
 import httpx
 import pytest
 
+from simple_agent.application.llm import ToolSchema, ToolUse
 from simple_agent.infrastructure.gemini.gemini_client import (
     GeminiClientError,
     GeminiLLM,
@@ -88,6 +91,32 @@ async def test_gemini_chat_concatenates_multiple_text_parts():
     assert result.content == "First part. Second part."
 
 
+@pytest.mark.asyncio
+async def test_gemini_chat_declares_functions_and_returns_tool_uses():
+    captured = {}
+
+    def handler(request):
+        captured["json"] = json.loads(request.content)
+        part = {"functionCall": {"name": "ls", "args": {"path": "src"}}}
+        return httpx.Response(
+            200, json={"candidates": [{"content": {"parts": [part]}}]}
+        )
+
+    chat = GeminiLLM(build_config(), transport=httpx.MockTransport(handler))
+    schemas = [
+        ToolSchema("ls", "List files", {"type": "object", "properties": {"path": {}}}),
+        ToolSchema("agent-tasks", "Show tasks", {"type": "object", "properties": {}}),
+    ]
+
+    result = await chat.call_async([{"role": "user", "content": "Hi"}], schemas)
+
+    declarations = captured["json"]["tools"][0]["functionDeclarations"]
+    assert declarations[0]["parameters"] == schemas[0].parameters
+    assert "parameters" not in declarations[1]
+    assert result.content == ""
+    assert result.tool_uses == [ToolUse("ls", {"path": "src"})]
+
+
 @pytest.mark.asyncio
 async def test_gemini_chat_raises_error_when_candidates_missing():
     transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
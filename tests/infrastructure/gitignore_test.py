@@ -0,0 +1,97 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from simple_agent.infrastructure.gitignore import GitignoreMatcher, compile_layer
+
+
+def _layer(lines: list[str]):
+    layer = compile_layer(lines)
+    assert layer is not None
+    return layer
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, ignored",
+    [
+        ("*.log", "a/b/debug.log", False, True),
+        ("*.log", "debug.log.txt", False, False),
+        ("/build", "build", True, True),
+        ("/build", "src/build", True, False),
+        ("build/", "src/build", True, True),
+        ("build/", "src/build", False, False),
+        ("docs/*.md", "docs/readme.md", False, True),
+        ("docs/*.md", "docs/api/readme.md", False, False),
+        ("**/cache", "a/b/cache", True, True),
+        ("logs/**", "logs/a/b.txt", False, True),
+        ("a/**/z", "a/z", False, True),
+        ("a/**/z", "a/b/c/z", False, True),
+        ("file?.txt", "file1.txt", False, True),
+        ("file[0-9].txt", "filex.txt", False, False),
+        ("\\#notes", "#notes", False, True),
+    ],
+)
+def test_patterns(pattern, path, is_dir, ignored):
+    layer = _layer([pattern])
+
+    assert (layer.match(path, is_dir) is True) == ignored
+
+
+def test_last_matching_rule_wins():
+    layer = _layer(["*.log", "!keep.log", "# comment", ""])
+
+    assert layer.match("debug.log", False) is True
+    assert layer.match("keep.log", False) is False
+    assert layer.match("main.py", False) is None
+
+
+def test_nested_gitignore_overrides_parent(tmp_path):
+    _write(tmp_path / ".gitignore", "*.tmp\n")
+    _write(tmp_path / "sub" / ".gitignore", "!wanted.tmp\nlocal/\n")
+    matcher = GitignoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("other.tmp")
+    assert matcher.is_ignored("sub/other.tmp")
+    assert not matcher.is_ignored("sub/wanted.tmp")
+    assert matcher.is_ignored("wanted.tmp")
+    assert matcher.is_ignored("sub/local", is_dir=True)
+    assert not matcher.is_ignored("local", is_dir=True)
+
+
+def test_paths_inside_ignored_directories_are_ignored(tmp_path):
+    _write(tmp_path / ".gitignore", "vendor/\n!vendor/keep.py\n")
+    matcher = GitignoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("vendor/keep.py")
+    assert matcher.is_ignored("vendor/deep/module.py")
+
+
+def test_info_exclude_and_hidden_entries(tmp_path):
+    _write(tmp_path / ".git" / "info" / "exclude", "secret.txt\n")
+    matcher = GitignoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("secret.txt")
+    assert matcher.is_ignored(".env")
+    assert matcher.is_ignored(".git", is_dir=True)
+    assert not matcher.is_ignored(".gitignore")
+    assert not GitignoreMatcher(tmp_path, ignore_hidden=False).is_ignored(".env")
+
+
+def test_layers_change_when_a_gitignore_is_edited(tmp_path):
+    gitignore = tmp_path / ".gitignore"
+    _write(gitignore, "*.log\n")
+    before = GitignoreMatcher(tmp_path).layers("")
+
+    assert GitignoreMatcher(tmp_path).layers("") == before
+
+    _write(gitignore, "*.tmp\n")
+    stat = gitignore.stat()
+    os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert GitignoreMatcher(tmp_path).layers("") != before
@@ -0,0 +1,71 @@
+import io
+import json
+
+from simple_agent.application.agent_id import AgentId
+from simple_agent.application.display_type import DisplayType
+from simple_agent.application.event_bus import SimpleEventBus
+from simple_agent.application.events import (
+    AgentStartedEvent,
+    AssistantSaidEvent,
+    ErrorEvent,
+    ToolCalledEvent,
+    ToolResultEvent,
+    UserPromptRequestedEvent,
+)
+from simple_agent.application.tool_library import ParsedTool, RawToolCall
+from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
+from simple_agent.infrastructure.headless_display import HeadlessDisplay
+
+AGENT_ID = AgentId("Agent")
+
+
+def publish_session(display_type: DisplayType) -> str:
+    stream = io.StringIO()
+    event_bus = SimpleEventBus()
+    HeadlessDisplay(display_type, stream).subscribe(event_bus)
+
+    event_bus.publish(AgentStartedEvent(AGENT_ID, "Agent", "stub-model"))
+    event_bus.publish(UserPromptRequestedEvent(AGENT_ID))
+    event_bus.publish(AssistantSaidEvent(AGENT_ID, "Listing files"))
+    event_bus.publish(
+        ToolCalledEvent(AGENT_ID, "call-1", ParsedTool(RawToolCall("ls", "."), None))
+    )
+    event_bus.publish(
+        ToolResultEvent(AGENT_ID, "call-1", SingleToolResult("README.md\n"))
+    )
+    return stream.getvalue()
+
+
+def test_text_output_prints_one_line_per_event():
+    output = publish_session(DisplayType.TEXT)
+
+    assert output.splitlines() == [
+        "[Agent] started Agent (stub-model)",
+        "[Agent] Listing files",
+        "[Agent] 🛠️ ls .",
+        "[Agent] ✅ README.md",
+    ]
+
+
+def test_json_output_prints_serialized_events():
+    output = publish_session(DisplayType.JSON)
+
+    events = [json.loads(line) for line in output.splitlines()]
+    assert [event["type"] for event in events] == [
+        "AgentStartedEvent",
+        "AssistantSaidEvent",
+        "ToolCalledEvent",
+        "ToolResultEvent",
+    ]
+    assert events[2]["tool_name"] == "ls"
+
+
+def test_exit_code_reflects_task_result_and_errors():
+    display = HeadlessDisplay(DisplayType.TEXT, io.StringIO())
+
+    assert display.exit_code(SingleToolResult("done")) == 0
+    assert display.exit_code(SingleToolResult("failed", ToolResultStatus.FAILURE)) == 1
+    assert display.exit_code(None) == 1
+
+    display.show(ErrorEvent(AGENT_ID, "LLM unavailable"))
+    assert display.exit_code(SingleToolResult("done")) == 1
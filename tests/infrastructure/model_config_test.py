@@ -1,5 +1,6 @@
 import pytest
 
+from simple_agent.application.session_metrics import ModelPrice
 from simple_agent.infrastructure.model_config import ModelConfig, ModelsRegistry
 
 
@@ -67,6 +68,23 @@ def test_model_config_from_dict_normalizes_adapter_and_timeout():
     assert model.request_timeout == 30
 
 
+def test_model_config_from_dict_reads_optional_prices():
+    base = {"model": "claude-sonnet-4", "adapter": "claude", "api_key": "key"}
+
+    assert ModelConfig.from_dict("claude", base).price is None
+    model = ModelConfig.from_dict(
+        "claude", {**base, "input_price": 3, "output_price": "15"}
+    )
+    assert model.price == ModelPrice(3.0, 15.0)
+    model = ModelConfig.from_dict(
+        "claude",
+        {**base, "input_price": 3, "output_price": 15, "cache_write_price": 3.75},
+    )
+    assert model.price == ModelPrice(3.0, 15.0, cache_write=3.75)
+    with pytest.raises(ValueError, match="needs both 'input_price' and 'output_price'"):
+        ModelConfig.from_dict("claude", {**base, "input_price": 3})
+
+
 def test_model_config_from_dict_raises_on_invalid_timeout():
     config = {
         "model": "claude-sonnet-4",
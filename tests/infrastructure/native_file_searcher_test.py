@@ -1,6 +1,11 @@
 import pytest
 
 from simple_agent.infrastructure.native_file_searcher import NativeFileSearcher
+from simple_agent.infrastructure.workspace_watcher import (
+    ChangeKind,
+    FileChange,
+    WorkspaceWatcher,
+)
 
 
 @pytest.fixture
@@ -77,3 +82,58 @@ async def test_search_handles_directory_vs_file_ambiguity(bridge_project):
     results = await searcher.search("")  # search for everything
     assert "bridge.py" in results, "'bridge.py' should not be ignored"
     assert "bridge/file.txt" not in results, "'bridge/file.txt' should be ignored"
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_fuzzy_matches(tmp_path):
+    for path in ["src/domain.py", "src/main.py", "docs/manual_index.md"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+    searcher = NativeFileSearcher(root_path=tmp_path)
+
+    results = await searcher.search("main")
+    assert results[0] == "src/main.py"
+    assert set(results) == {"src/main.py", "src/domain.py", "docs/manual_index.md"}
+    assert await searcher.search("mainz") == []
+
+
+@pytest.mark.asyncio
+async def test_search_picks_up_new_files_after_refresh(temp_project, monkeypatch):
+    monkeypatch.setattr(
+        "simple_agent.infrastructure.native_file_searcher.REFRESH_INTERVAL_SECONDS",
+        0,
+    )
+    searcher = NativeFileSearcher(root_path=temp_project)
+    assert await searcher.search("new") == []
+
+    (temp_project / "subdir" / "new_module.py").touch()
+    await searcher.search("new")
+    await searcher.wait_for_refresh()
+
+    assert await searcher.search("new") == ["subdir/new_module.py"]
+
+
+@pytest.mark.asyncio
+async def test_search_limits_results(tmp_path):
+    for index in range(10):
+        (tmp_path / f"file{index}.py").touch()
+    searcher = NativeFileSearcher(root_path=tmp_path, max_results=3)
+
+    assert len(await searcher.search("file")) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_with_watcher_refreshes_only_after_changes(temp_project):
+    watcher = WorkspaceWatcher(temp_project)
+    searcher = NativeFileSearcher(root_path=temp_project, watcher=watcher)
+    assert await searcher.search("new") == []
+
+    assert not searcher._needs_refresh()
+
+    watcher._publish({FileChange(temp_project / "new_module.py", ChangeKind.CREATED)})
+    (temp_project / "new_module.py").touch()
+    await searcher.search("new")
+    await searcher.wait_for_refresh()
+
+    assert await searcher.search("new") == ["new_module.py"]
+    assert not searcher._needs_refresh()
@@ -3,6 +3,7 @@ import json
 import httpx
 import pytest
 
+from simple_agent.application.llm import ToolSchema, ToolUse
 from simple_agent.infrastructure.model_config import ModelConfig
 from simple_agent.infrastructure.openai.openai_client import OpenAILLM
 
@@ -33,11 +34,60 @@ async def test_openai_client_sends_correct_request():
     assert result.usage.input_tokens == 10
     assert result.usage.output_tokens == 20
     assert result.usage.total_tokens == 30
+    assert result.usage.cached_input_tokens == 0
     assert captured["url"] == "https://api.openai.com/v1/chat/completions"
     assert captured["json"]["model"] == "test-openai-model"
     assert captured["json"]["messages"] == messages
 
 
+@pytest.mark.asyncio
+async def test_openai_client_reads_cached_prompt_tokens():
+    response_data = {
+        "choices": [{"message": {"content": "assistant response"}}],
+        "usage": {
+            "prompt_tokens": 1000,
+            "completion_tokens": 20,
+            "total_tokens": 1020,
+            "prompt_tokens_details": {"cached_tokens": 900},
+        },
+    }
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=response_data)
+    )
+
+    result = await OpenAILLM(build_config(), transport=transport).call_async(
+        [{"role": "user", "content": "Hello"}]
+    )
+
+    assert result.usage is not None
+    assert result.usage.input_tokens == 1000
+    assert result.usage.cached_input_tokens == 900
+
+
+@pytest.mark.asyncio
+async def test_openai_client_declares_functions_and_returns_tool_uses():
+    captured = {}
+    tool_call = {
+        "id": "call_1",
+        "type": "function",
+        "function": {"name": "cat", "arguments": '{"filename": "a.py"}'},
+    }
+
+    def handler(request):
+        captured["json"] = json.loads(request.content.decode("utf-8"))
+        message = {"content": None, "tool_calls": [tool_call]}
+        return httpx.Response(200, json={"choices": [{"message": message}]})
+
+    client = OpenAILLM(build_config(), transport=httpx.MockTransport(handler))
+    schema = ToolSchema("cat", "Show a file", {"type": "object", "properties": {}})
+
+    result = await client.call_async([{"role": "user", "content": "Hi"}], [schema])
+
+    assert captured["json"]["tools"][0]["function"]["name"] == "cat"
+    assert result.content == ""
+    assert result.tool_uses == [ToolUse("cat", {"filename": "a.py"})]
+
+
 def build_config(base_url: str | None = None) -> ModelConfig:
     return ModelConfig(
         name="openai",
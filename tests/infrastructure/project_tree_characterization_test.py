@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from simple_agent.infrastructure.project_tree import FileSystemProjectTree
@@ -49,3 +50,94 @@ def test_characterization_of_project_tree_rendering(tmp_path: Path):
 └── folder_z/
 """
     assert output.strip() == expected_output.strip()
+
+
+def test_project_tree_reuses_rendering_until_a_listed_directory_changes(
+    tmp_path: Path, monkeypatch
+):
+    (tmp_path / "dir1").mkdir()
+    (tmp_path / "dir1" / "file1.txt").touch()
+    project_tree = FileSystemProjectTree(root_path=tmp_path)
+    first = project_tree.render(max_depth=2)
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("tree should not be walked again")
+
+    monkeypatch.setattr(
+        "simple_agent.infrastructure.project_tree._build_tree", fail_walk
+    )
+    assert project_tree.render(max_depth=2) is first
+    monkeypatch.undo()
+
+    _add_entry(tmp_path / "dir1", "file2.txt")
+
+    assert "file2.txt" in project_tree.render(max_depth=2)
+
+
+def test_project_tree_rerenders_when_gitignore_changes(tmp_path: Path):
+    (tmp_path / "keep.txt").touch()
+    (tmp_path / "drop.log").touch()
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("")
+    project_tree = FileSystemProjectTree(root_path=tmp_path)
+    assert "drop.log" in project_tree.render()
+
+    gitignore.write_text("*.log\n")
+    _bump_mtime(gitignore)
+
+    assert "drop.log" not in project_tree.render()
+
+
+def test_project_tree_honours_nested_gitignore_and_negation(tmp_path: Path):
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / ".gitignore").write_text("!keep.log\n")
+    (tmp_path / "logs" / "keep.log").touch()
+    (tmp_path / "logs" / "drop.log").touch()
+
+    output = FileSystemProjectTree(root_path=tmp_path).render(max_depth=2)
+
+    assert "keep.log" in output
+    assert "drop.log" not in output
+
+
+def test_project_tree_elides_entries_beyond_the_directory_cap(tmp_path: Path):
+    big = tmp_path / "big"
+    big.mkdir()
+    for index in range(10):
+        (big / f"file{index}.txt").touch()
+
+    output = FileSystemProjectTree(root_path=tmp_path, max_entries=3).render()
+
+    assert output.strip() == (
+        """./
+└── big/
+    ├── file0.txt
+    ├── file1.txt
+    ├── file2.txt
+    └── … 7 more"""
+    )
+
+
+def test_project_tree_keeps_shallow_entries_when_over_budget(tmp_path: Path):
+    for name in ["alpha", "beta", "gamma"]:
+        (tmp_path / name).mkdir()
+        for index in range(50):
+            (tmp_path / name / f"module_{index}.py").touch()
+
+    output = FileSystemProjectTree(root_path=tmp_path, max_chars=300).render()
+
+    assert len(output) < 400
+    assert all(f"{name}/" in output for name in ["alpha", "beta", "gamma"])
+    assert "more" in output
+
+
+def _add_entry(directory: Path, name: str):
+    (directory / name).touch()
+    _bump_mtime(directory)
+
+
+def _bump_mtime(path: Path):
+    # Guards against filesystems whose timestamps are too coarse to notice.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
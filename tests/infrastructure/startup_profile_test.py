@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+from simple_agent.infrastructure.startup_profile import (
+    ImportTiming,
+    format_startup_report,
+    measure_imports,
+    parse_import_times,
+)
+from simple_agent.main import parse_args
+
+STARTUP_BUDGET_MS = 500
+LAZY_PACKAGES = {"textual", "boto3", "botocore", "httpx"}
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     yaml.error
+import time:       300 |        420 |   yaml
+import time:      1000 |       1420 | simple_agent.main
+"""
+
+
+def test_parse_import_times_reads_importtime_lines():
+    assert parse_import_times(IMPORT_TIME_OUTPUT) == [
+        ImportTiming("yaml.error", 120, 120, 2),
+        ImportTiming("yaml", 300, 420, 1),
+        ImportTiming("simple_agent.main", 1000, 1420, 0),
+    ]
+
+
+def test_startup_report_lists_total_top_level_and_slowest_modules():
+    report = format_startup_report(parse_import_times(IMPORT_TIME_OUTPUT), top=2)
+
+    assert report.splitlines() == [
+        "Startup imports: 1.4 ms in 3 modules",
+        "",
+        "Top-level imports (cumulative):",
+        "      1.4 ms  simple_agent.main",
+        "",
+        "Slowest 2 modules (self):",
+        "      1.0 ms  simple_agent.main",
+        "      0.3 ms  yaml",
+    ]
+
+
+def test_parse_args_reads_profile_startup_flag():
+    assert parse_args(["--profile-startup"]).profile_startup is True
+
+
+def test_entry_point_does_not_import_adapters_or_textual():
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, simple_agent.main; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    loaded = {module.split(".")[0] for module in completed.stdout.split()}
+    assert loaded & LAZY_PACKAGES == set()
+
+
+def test_entry_point_imports_within_startup_budget():
+    fastest_ms = min(_main_import_ms() for _ in range(3))
+
+    assert fastest_ms < STARTUP_BUDGET_MS
+
+
+def _main_import_ms() -> float:
+    timings = measure_imports(["simple_agent.main"])
+    main = next(t for t in timings if t.module == "simple_agent.main")
+    return main.cumulative_us / 1000
@@ -1,12 +1,14 @@
 import pytest
 from textual.containers import VerticalScroll
-from textual.widgets import Markdown, TextArea
+from textual.widgets import Collapsible, Markdown, TextArea
 
 from simple_agent.application.agent_id import AgentId
 from simple_agent.application.events import (
     AgentChangedEvent,
     AgentStartedEvent,
     AssistantSaidEvent,
+    HistoryReplayFinishedEvent,
+    HistoryReplayStartedEvent,
     SessionStartedEvent,
     ToolCalledEvent,
     ToolResultEvent,
@@ -30,8 +32,7 @@ def _last_markdown_text(app: TextualApp, agent_id: AgentId) -> str:
 def _latest_tool_text_area(app: TextualApp, agent_id: AgentId) -> TextArea:
     _, _, tool_results_id = app.panel_ids_for(agent_id)
     tool_log = app.query_one(f"#{tool_results_id}", ToolLog)
-    collapsible = tool_log._collapsibles[-1]
-    return collapsible.query_one(TextArea)
+    return tool_log.query(Collapsible).last().query_one(TextArea)
 
 
 @pytest.mark.asyncio
@@ -205,3 +206,44 @@ async def test_agent_changed_event_updates_tab_title(textual_harness):
         tab_id, _, _ = app.panel_ids_for(agent_id)
         tab = tabs.get_tab(tab_id)
         assert str(tab.label) == "Developer [test-model]"
+
+
+@pytest.mark.asyncio
+async def test_replayed_history_is_mounted_in_one_batch(textual_harness):
+    event_bus, _, _, app = textual_harness
+    agent_id = AgentId("Agent")
+    subagent_id = AgentId("Agent/Coding")
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        event_bus.publish(HistoryReplayStartedEvent(agent_id))
+        event_bus.publish(AgentStartedEvent(agent_id, "Agent", "dummy-model"))
+        event_bus.publish(UserPromptedEvent(agent_id, "Old question"))
+        event_bus.publish(ToolCalledEvent(agent_id, "call-1", StubTool()))
+        event_bus.publish(
+            ToolResultEvent(
+                agent_id,
+                "call-1",
+                SingleToolResult(display_body="+added", display_language="diff"),
+            )
+        )
+        event_bus.publish(ToolCalledEvent(agent_id, "call-2", StubTool()))
+        event_bus.publish(ToolResultEvent(agent_id, "call-2", SingleToolResult("ok")))
+        event_bus.publish(AgentStartedEvent(subagent_id, "Coding", "dummy-model"))
+        event_bus.publish(AssistantSaidEvent(subagent_id, "Old answer"))
+        await pilot.pause()
+        assert not app.has_agent_tab(subagent_id)
+
+        event_bus.publish(HistoryReplayFinishedEvent(agent_id))
+        await pilot.pause()
+        await pilot.pause()
+
+        assert _last_markdown_text(app, agent_id) == "**User:** Old question"
+        assert _last_markdown_text(app, subagent_id) == "**Coding:** Old answer"
+        _, _, tool_results_id = app.panel_ids_for(agent_id)
+        tool_log = app.query_one(f"#{tool_results_id}", ToolLog)
+        collapsibles = [entry.collapsible for entry in tool_log._entries]
+        assert [c.parent is tool_log for c in collapsibles] == [True, True]
+        assert [c.collapsed for c in collapsibles] == [True, False]
+        assert tool_log._entries[0].body is None
+        assert _latest_tool_text_area(app, agent_id).text == "ok"
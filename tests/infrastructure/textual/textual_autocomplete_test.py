@@ -147,10 +147,11 @@ def test_get_autocomplete_suggestions_for_slash():
 
     suggestions = registry.get_matching_commands("/")
 
-    assert len(suggestions) == 2
+    assert len(suggestions) == 3
     names = [name for name, _ in suggestions]
     assert "/clear" in names
     assert "/model" in names
+    assert "/stats" in names
 
 
 def test_get_autocomplete_suggestions_for_partial():
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from simple_agent.infrastructure.textual.textual_user_input import TextualUserInput
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_read_returns_submitted_messages_in_order():
+    user_input = TextualUserInput()
+    user_input.submit_input("first")
+    user_input.submit_input("second")
+
+    assert await user_input.read_async() == "first"
+    assert await user_input.read_async() == "second"
+
+
+async def test_waiting_reader_wakes_on_submit():
+    user_input = TextualUserInput()
+    reader = asyncio.create_task(user_input.read_async())
+    await asyncio.sleep(0)
+    assert not reader.done()
+
+    user_input.submit_input("hello")
+
+    assert await asyncio.wait_for(reader, timeout=1) == "hello"
+
+
+async def test_close_wakes_every_waiting_reader():
+    user_input = TextualUserInput()
+    readers = [asyncio.create_task(user_input.read_async()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    user_input.close()
+
+    assert await asyncio.wait_for(asyncio.gather(*readers), timeout=1) == ["", "", ""]
+    assert await user_input.read_async() == ""
+
+
+async def test_cancelled_reader_does_not_consume_later_input():
+    user_input = TextualUserInput()
+    reader = asyncio.create_task(user_input.read_async())
+    await asyncio.sleep(0)
+    reader.cancel()
+    await asyncio.gather(reader, return_exceptions=True)
+
+    user_input.submit_input("next")
+
+    assert await user_input.read_async() == "next"
@@ -0,0 +1,102 @@
+from textual.app import App, ComposeResult
+from textual.widgets import Markdown
+
+from simple_agent.infrastructure.textual.widgets.chat_log import (
+    MAX_MOUNTED_MESSAGES,
+    ChatLog,
+)
+
+
+class ChatLogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ChatLog(id="log")
+
+
+async def test_long_history_keeps_only_a_window_mounted():
+    app = ChatLogApp()
+    async with app.run_test() as pilot:
+        chat_log = app.query_one(ChatLog)
+        chat_log.begin_batch()
+        for index in range(10_000):
+            chat_log.write(f"message {index}")
+        chat_log.end_batch()
+        await pilot.pause()
+
+        assert chat_log.message_count == 10_000
+        assert len(chat_log.children) == MAX_MOUNTED_MESSAGES
+        assert chat_log.query(Markdown).last().source == "message 9999"
+
+
+async def test_following_the_end_drops_the_oldest_widgets():
+    app = ChatLogApp()
+    async with app.run_test() as pilot:
+        chat_log = app.query_one(ChatLog)
+        chat_log.begin_batch()
+        for index in range(MAX_MOUNTED_MESSAGES):
+            chat_log.write(f"message {index}")
+        chat_log.end_batch()
+        await pilot.pause()
+
+        for index in range(MAX_MOUNTED_MESSAGES, MAX_MOUNTED_MESSAGES + 20):
+            chat_log.write(f"message {index}")
+        await pilot.pause()
+
+        assert len(chat_log.children) == MAX_MOUNTED_MESSAGES
+        assert chat_log.query(Markdown).first().source == "message 20"
+
+
+async def test_scrolling_to_the_top_mounts_older_messages():
+    app = ChatLogApp()
+    async with app.run_test() as pilot:
+        chat_log = app.query_one(ChatLog)
+        chat_log.begin_batch()
+        for index in range(1_000):
+            chat_log.write(f"message {index}")
+        chat_log.end_batch()
+        await pilot.pause()
+
+        chat_log.scroll_home(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+
+        assert len(chat_log.children) > MAX_MOUNTED_MESSAGES
+        assert chat_log.query(Markdown).first().source == "message 750"
+
+
+async def test_returning_to_the_end_drops_widgets_mounted_while_scrolled_up():
+    app = ChatLogApp()
+    async with app.run_test() as pilot:
+        chat_log = app.query_one(ChatLog)
+        chat_log.begin_batch()
+        for index in range(MAX_MOUNTED_MESSAGES):
+            chat_log.write(f"message {index}")
+        chat_log.end_batch()
+        await pilot.pause()
+        chat_log.scroll_to(y=chat_log.max_scroll_y - 5, animate=False)
+        await pilot.pause()
+
+        for index in range(MAX_MOUNTED_MESSAGES, MAX_MOUNTED_MESSAGES + 20):
+            chat_log.write(f"message {index}")
+        await pilot.pause()
+        assert len(chat_log.children) == MAX_MOUNTED_MESSAGES + 20
+
+        chat_log.scroll_end(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+
+        assert len(chat_log.children) == MAX_MOUNTED_MESSAGES
+        assert chat_log.query(Markdown).first().source == "message 20"
+
+
+async def test_clear_forgets_all_messages():
+    app = ChatLogApp()
+    async with app.run_test() as pilot:
+        chat_log = app.query_one(ChatLog)
+        chat_log.write("hello")
+        await pilot.pause()
+
+        chat_log.clear()
+        await pilot.pause()
+
+        assert chat_log.message_count == 0
+        assert len(chat_log.children) == 0
@@ -0,0 +1,108 @@
+from textual.app import App, ComposeResult
+from textual.widgets import Collapsible, TextArea
+
+from simple_agent.application.tool_results import SingleToolResult
+from simple_agent.infrastructure.textual.widgets.tool_log import ToolLog
+
+
+class ToolLogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ToolLog(id="tools")
+
+
+def _replay(tool_log: ToolLog, count: int) -> None:
+    tool_log.begin_batch()
+    for index in range(count):
+        tool_log.add_tool_call(f"call-{index}", f"🛠️ cat file{index}.py")
+        tool_log.add_tool_result(f"call-{index}", SingleToolResult(f"content {index}"))
+    tool_log.end_batch()
+
+
+def _collapsible(tool_log: ToolLog, index: int) -> Collapsible:
+    collapsible = tool_log._entries[index].collapsible
+    assert collapsible is not None
+    return collapsible
+
+
+async def test_replayed_calls_only_render_the_expanded_body():
+    app = ToolLogApp()
+    async with app.run_test() as pilot:
+        tool_log = app.query_one(ToolLog)
+        _replay(tool_log, 200)
+        await pilot.pause()
+
+        assert len(tool_log.children) == 200
+        assert len(tool_log.query(TextArea)) == 1
+        assert tool_log.query_one(TextArea).text == "content 199"
+
+
+async def test_expanding_a_collapsed_call_renders_its_result():
+    app = ToolLogApp()
+    async with app.run_test() as pilot:
+        tool_log = app.query_one(ToolLog)
+        _replay(tool_log, 3)
+        await pilot.pause()
+
+        first = _collapsible(tool_log, 0)
+        first.collapsed = False
+        await pilot.pause()
+
+        assert first.query_one(TextArea).text == "content 0"
+
+
+async def test_new_call_collapses_the_expanded_ones():
+    app = ToolLogApp()
+    async with app.run_test() as pilot:
+        tool_log = app.query_one(ToolLog)
+        _replay(tool_log, 3)
+        await pilot.pause()
+        _collapsible(tool_log, 0).collapsed = False
+        await pilot.pause()
+
+        tool_log.add_tool_call("call-new", "🛠️ ls")
+        await pilot.pause()
+
+        assert [_collapsible(tool_log, i).collapsed for i in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert [e.body is None for e in tool_log._entries] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+
+
+async def test_result_of_a_collapsed_call_is_rendered_on_expand():
+    app = ToolLogApp()
+    async with app.run_test() as pilot:
+        tool_log = app.query_one(ToolLog)
+        tool_log.add_tool_call("call-1", "🛠️ cat a.py")
+        tool_log.add_tool_call("call-2", "🛠️ cat b.py")
+        await pilot.pause()
+
+        tool_log.add_tool_result("call-1", SingleToolResult("content a"))
+        await pilot.pause()
+
+        assert tool_log._entries[0].body is None
+        first = _collapsible(tool_log, 0)
+        first.collapsed = False
+        await pilot.pause()
+        assert first.query_one(TextArea).text == "content a"
+
+
+async def test_collapsing_a_call_drops_its_body():
+    app = ToolLogApp()
+    async with app.run_test() as pilot:
+        tool_log = app.query_one(ToolLog)
+        _replay(tool_log, 2)
+        await pilot.pause()
+
+        _collapsible(tool_log, 1).collapsed = True
+        await pilot.pause()
+
+        assert tool_log._entries[1].body is None
+        assert len(tool_log.query(TextArea)) == 0
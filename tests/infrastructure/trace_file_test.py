@@ -0,0 +1,28 @@
+import json
+
+from simple_agent.application.tracing import Tracer
+from simple_agent.infrastructure.trace_file import trace_file_name, write_trace
+
+
+def test_writes_recorded_spans_as_chrome_trace_json(tmp_path):
+    trace = Tracer()
+    trace.start()
+    with trace.span("work", agent_id="Agent"):
+        pass
+
+    path = write_trace(tmp_path / "session" / trace_file_name(), trace)
+
+    assert path is not None
+    assert path.parent == tmp_path / "session"
+    document = json.loads(path.read_text())
+    assert document["displayTimeUnit"] == "ms"
+    assert [event["name"] for event in document["traceEvents"]] == [
+        "thread_name",
+        "work",
+    ]
+    assert trace.enabled is False
+
+
+def test_writes_nothing_when_tracing_was_not_started(tmp_path):
+    assert write_trace(tmp_path / "trace.json", Tracer()) is None
+    assert not (tmp_path / "trace.json").exists()
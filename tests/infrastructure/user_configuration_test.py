@@ -1,4 +1,14 @@
-from simple_agent.infrastructure.user_configuration import UserConfiguration
+import pytest
+
+from simple_agent.application.agent_task_manager import (
+    DEFAULT_MAX_RUNNING,
+    DEFAULT_MAX_RUNNING_PER_PARENT,
+)
+from simple_agent.application.tool_output_budget import DEFAULT_MAX_OUTPUT_CHARS
+from simple_agent.infrastructure.user_configuration import (
+    ConfigurationError,
+    UserConfiguration,
+)
 
 
 def test_logger_levels_returns_empty_dict_when_no_loggers_section():
@@ -75,3 +85,55 @@ def test_log_level_uppercases_config_value():
     user_config = UserConfiguration({"log": {"level": "debug"}})
 
     assert user_config.log_level() == "DEBUG"
+
+
+def test_tool_output_max_chars_defaults():
+    user_config = UserConfiguration({})
+
+    assert user_config.tool_output_max_chars() == DEFAULT_MAX_OUTPUT_CHARS
+
+
+def test_tool_output_max_chars_from_config():
+    user_config = UserConfiguration({"tools": {"max_output_chars": 500}})
+
+    assert user_config.tool_output_max_chars() == 500
+
+
+def test_agent_limits_default():
+    user_config = UserConfiguration({})
+
+    assert user_config.max_running_agents() == DEFAULT_MAX_RUNNING
+    assert user_config.max_running_agents_per_parent() == DEFAULT_MAX_RUNNING_PER_PARENT
+
+
+def test_agent_limits_from_config():
+    user_config = UserConfiguration(
+        {"agents": {"max_running": 2, "max_running_per_parent": 1}}
+    )
+
+    assert user_config.max_running_agents() == 2
+    assert user_config.max_running_agents_per_parent() == 1
+
+
+def test_rejects_agent_limit_below_one():
+    user_config = UserConfiguration({"agents": {"max_running": 0}})
+
+    with pytest.raises(ConfigurationError):
+        user_config.max_running_agents()
+
+
+def test_tool_syntax_defaults_to_emoji_bracket():
+    assert UserConfiguration({}).tool_syntax() == "emoji_bracket"
+
+
+def test_tool_syntax_from_config():
+    user_config = UserConfiguration({"tools": {"syntax": "Native"}})
+
+    assert user_config.tool_syntax() == "native"
+
+
+def test_tool_syntax_rejects_unknown_values():
+    user_config = UserConfiguration({"tools": {"syntax": "xml"}})
+
+    with pytest.raises(ConfigurationError):
+        user_config.tool_syntax()
@@ -0,0 +1,157 @@
+import threading
+import time
+
+import pytest
+
+from simple_agent.infrastructure import workspace_watcher
+from simple_agent.infrastructure.gitignore import GitignoreMatcher
+from simple_agent.infrastructure.project_tree import FileSystemProjectTree
+from simple_agent.infrastructure.workspace_watcher import (
+    ChangeKind,
+    FileChange,
+    WorkspaceWatcher,
+)
+
+
+class ChangeRecorder:
+    def __init__(self):
+        self.changes: set[FileChange] = set()
+        self._received = threading.Condition()
+
+    def __call__(self, changes):
+        with self._received:
+            self.changes |= changes
+            self._received.notify_all()
+
+    def wait_for(self, expected: FileChange, timeout: float = 5.0) -> bool:
+        with self._received:
+            return self._received.wait_for(
+                lambda: expected in self.changes, timeout=timeout
+            )
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def watcher(request, tmp_path):
+    watcher = WorkspaceWatcher(
+        tmp_path, poll_interval=0.05, force_polling=request.param == "polling"
+    )
+    yield watcher
+    watcher.stop()
+
+
+def test_reports_created_modified_and_deleted_files(watcher, tmp_path):
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+    (tmp_path / "existing.txt").write_text("a")
+    watcher.start()
+
+    (tmp_path / "new.txt").write_text("new")
+    assert recorder.wait_for(FileChange(tmp_path / "new.txt", ChangeKind.CREATED))
+
+    (tmp_path / "existing.txt").write_text("changed")
+    assert recorder.wait_for(FileChange(tmp_path / "existing.txt", ChangeKind.MODIFIED))
+
+    (tmp_path / "new.txt").unlink()
+    assert recorder.wait_for(FileChange(tmp_path / "new.txt", ChangeKind.DELETED))
+
+
+def test_background_start_reports_a_rescan_once_watching(watcher, tmp_path):
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+
+    watcher.start_in_background()
+
+    assert recorder.wait_for(FileChange(tmp_path, ChangeKind.RESCAN))
+    (tmp_path / "new.txt").write_text("new")
+    assert recorder.wait_for(FileChange(tmp_path / "new.txt", ChangeKind.CREATED))
+
+
+def test_stopping_during_a_background_start_discards_the_backend(watcher, monkeypatch):
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+    walking = threading.Event()
+    stopped = threading.Event()
+
+    def matcher_after_stop(root):
+        walking.set()
+        stopped.wait(timeout=5)
+        return GitignoreMatcher(root)
+
+    monkeypatch.setattr(workspace_watcher, "GitignoreMatcher", matcher_after_stop)
+
+    watcher.start_in_background()
+    assert walking.wait(timeout=5)
+    watcher.stop()
+    stopped.set()
+    for thread in threading.enumerate():
+        if thread.name == "workspace-watcher-start":
+            thread.join(timeout=5)
+
+    assert watcher.backend is None
+    assert recorder.changes == set()
+
+
+def test_watches_new_directories_but_not_ignored_ones(watcher, tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "build").mkdir()
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+    watcher.start()
+
+    (tmp_path / "build" / "out.o").write_text("")
+    (tmp_path / "pkg").mkdir()
+    time.sleep(0.2)
+    (tmp_path / "pkg" / "module.py").write_text("")
+
+    assert recorder.wait_for(
+        FileChange(tmp_path / "pkg" / "module.py", ChangeKind.CREATED)
+    )
+    assert not any("build" in change.path.parts for change in recorder.changes)
+
+
+def test_ignores_new_directories_matching_gitignore(watcher, tmp_path):
+    (tmp_path / ".gitignore").write_text("node_modules/\n*.log\n")
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+    watcher.start()
+
+    (tmp_path / "node_modules").mkdir()
+    time.sleep(0.2)
+    (tmp_path / "node_modules" / "index.js").write_text("")
+    (tmp_path / "debug.log").write_text("")
+    time.sleep(0.2)
+    (tmp_path / "done.txt").write_text("")
+
+    assert recorder.wait_for(FileChange(tmp_path / "done.txt", ChangeKind.CREATED))
+    assert not any(
+        "node_modules" in change.path.parts or change.path.suffix == ".log"
+        for change in recorder.changes
+    )
+
+
+def test_project_tree_skips_stat_checks_until_the_watcher_reports_changes(
+    tmp_path, monkeypatch
+):
+    watcher = WorkspaceWatcher(tmp_path)
+    project_tree = FileSystemProjectTree(tmp_path, watcher=watcher)
+    recorder = ChangeRecorder()
+    watcher.subscribe(recorder)
+    watcher.start()
+    try:
+        first = project_tree.render()
+
+        def fail_stat(*args, **kwargs):
+            raise AssertionError("signature should not be checked")
+
+        monkeypatch.setattr(
+            "simple_agent.infrastructure.project_tree._mtime", fail_stat
+        )
+        assert project_tree.render() is first
+        monkeypatch.undo()
+
+        (tmp_path / "added.txt").write_text("")
+        assert recorder.wait_for(FileChange(tmp_path / "added.txt", ChangeKind.CREATED))
+
+        assert "added.txt" in project_tree.render()
+    finally:
+        watcher.stop()
@@ -2,12 +2,20 @@ from unittest.mock import patch
 
 import pytest
 
+from simple_agent.application.display_type import DisplayType
+from simple_agent.application.event_bus import SimpleEventBus
 from simple_agent.application.session import SessionArgs
+from simple_agent.application.session_metrics import SessionMetrics
 from simple_agent.infrastructure.user_configuration import (
     ConfigurationError,
     UserConfiguration,
 )
-from simple_agent.main import main, parse_args, print_system_prompt_command
+from simple_agent.main import (
+    _write_stats,
+    main,
+    parse_args,
+    print_system_prompt_command,
+)
 
 
 def test_parse_args_returns_joined_message():
@@ -24,6 +32,11 @@ def test_parse_args_sets_continue_flag_without_message():
     assert result.start_message is None
 
 
+def test_parse_args_enables_tracing():
+    assert parse_args(["hello"]).trace is False
+    assert parse_args(["--trace", "hello"]).trace is True
+
+
 def test_print_system_prompt_command_outputs_prompt(capsys, tmp_path):
     args = SessionArgs()
     user_config = UserConfiguration.create_stub()
@@ -43,3 +56,20 @@ def test_main_handles_configuration_error_gracefully(capsys):
         assert excinfo.value.code == 1
         captured = capsys.readouterr()
         assert "Configuration error: Missing API key" in captured.err
+
+
+def test_parse_args_selects_headless_display():
+    assert parse_args(["hello"]).display_type == DisplayType.TEXTUAL
+    assert parse_args(["--headless", "hello"]).display_type == DisplayType.TEXT
+    assert parse_args(["--json", "hello"]).display_type == DisplayType.JSON
+
+
+def test_write_stats_logs_instead_of_raising_when_the_file_cannot_be_written(
+    tmp_path, caplog
+):
+    missing = tmp_path / "missing"
+
+    _write_stats(missing, SessionMetrics(SimpleEventBus()))
+
+    assert not missing.exists()
+    assert "Could not write session stats" in caplog.text
@@ -24,7 +24,12 @@ from simple_agent.application.events import (
     UserPromptRequestedEvent,
 )
 from simple_agent.application.events_to_messages import events_to_messages
-from simple_agent.application.llm import ChatMessages, LLMResponse, TokenUsage
+from simple_agent.application.llm import (
+    ChatMessages,
+    LLMResponse,
+    TokenUsage,
+    ToolSchema,
+)
 from simple_agent.application.llm_stub import StubLLMProvider, create_llm_stub
 from simple_agent.application.session import Session
 from simple_agent.infrastructure.claude.claude_client import ClaudeClientError
@@ -49,7 +54,9 @@ class CapturingLLM:
         self._responses = responses
         self._response_index = 0
 
-    async def call_async(self, messages: ChatMessages) -> LLMResponse:
+    async def call_async(
+        self, messages: ChatMessages, tools: list[ToolSchema] | None = None
+    ) -> LLMResponse:
         self.captured_messages.append(list(messages))
         content = "Done"
         if self._response_index < len(self._responses):
@@ -114,7 +121,7 @@ class SessionTestBed:
             def model(self) -> str:
                 return "default-model"
 
-            async def call_async(self, messages):
+            async def call_async(self, messages, tools=None):
                 return LLMResponse(content="")
 
         self._llm = DefaultLLM()
@@ -137,7 +144,7 @@ class SessionTestBed:
             def model(self) -> str:
                 return "failing-model"
 
-            async def call_async(self, messages):
+            async def call_async(self, messages, tools=None):
                 raise ClaudeClientError(error_message)
 
         self._llm = FailingLLM()
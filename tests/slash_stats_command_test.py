@@ -0,0 +1,20 @@
+from simple_agent.application.agent_id import AgentId
+from simple_agent.application.events import StatsRequestedEvent
+from tests.session_test_bed import SessionTestBed
+
+
+async def test_slash_stats_command_requests_stats_without_calling_the_llm():
+    requests = []
+    session = (
+        SessionTestBed()
+        .with_llm_responses(["Response"])
+        .with_user_inputs("/stats", "Hello")
+        .on_event(StatsRequestedEvent, requests.append)
+    )
+
+    result = await session.run()
+
+    assert requests == [StatsRequestedEvent(AgentId("Agent"))]
+    messages = result.current_messages(AgentId("Agent"))
+    assert "/stats" not in messages
+    assert "user: Hello" in messages
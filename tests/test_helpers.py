@@ -18,14 +18,15 @@ from simple_agent.application.project_tree import ProjectTree
 from simple_agent.application.session import SessionArgs
 from simple_agent.application.system_prompt import AgentPrompt
 from simple_agent.application.tool_library_factory import ToolContext
+from simple_agent.application.tool_syntax import ToolSyntax
 from simple_agent.infrastructure.agent_library import BuiltinAgentLibrary
 from simple_agent.tools.all_tools import AllTools, AllToolsFactory
 from tests.user_input_stub import UserInputStub
 
 
-def create_all_tools_for_test():
+def create_all_tools_for_test(tool_syntax: ToolSyntax | None = None):
     event_bus = SimpleEventBus()
-    tool_syntax = EmojiBracketToolSyntax()
+    tool_syntax = tool_syntax or EmojiBracketToolSyntax()
     tool_library_factory = AllToolsFactory(tool_syntax)
     agent_library = BuiltinAgentLibrary()
     agent_factory = AgentFactory(
@@ -0,0 +1,173 @@
+import os
+
+import pytest
+
+from simple_agent.application.tool_library import RawToolCall
+from simple_agent.tools.batch_replace_file_content_tool import (
+    BatchReplaceFileContentTool,
+)
+from simple_agent.tools.file_patch import FilePatch, Hunk
+
+pytestmark = pytest.mark.asyncio
+
+
+def write(path, content):
+    path.write_text(content, encoding="utf-8")
+
+
+def read(path):
+    return path.read_text(encoding="utf-8")
+
+
+async def execute(body):
+    tool = BatchReplaceFileContentTool()
+    return await tool.execute(RawToolCall(name=tool.name, arguments="", body=body))
+
+
+async def test_applies_hunks_across_files(tmp_path):
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    write(first, "def add(a, b):\n    return a + b\n")
+    write(second, "add(1, 2)\nadd(3, 4)\n")
+
+    result = await execute(
+        f"📄 {first}\ndef add(a, b):\n@@@\ndef plus(a, b):\n"
+        f"📄 {second} all\nadd(\n@@@\nplus("
+    )
+
+    assert result.success is True
+    assert "Successfully applied 2 replacements to 2 files" in result.message
+    assert read(first) == "def plus(a, b):\n    return a + b\n"
+    assert read(second) == "plus(1, 2)\nplus(3, 4)\n"
+
+
+async def test_failing_hunk_leaves_all_files_untouched(tmp_path):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    write(first, "alpha\n")
+    write(second, "beta\n")
+
+    result = await execute(
+        f"📄 {first}\nalpha\n@@@\nALPHA\n📄 {second}\nmissing\n@@@\nnothing"
+    )
+
+    assert result.success is False
+    assert result.message.startswith(f"Hunk 2 ({second}):")
+    assert "No files were modified." in result.message
+    assert read(first) == "alpha\n"
+    assert read(second) == "beta\n"
+
+
+def fail_replacing(monkeypatch, fail):
+    """Makes os.replace raise for the targets fail(target, attempt) picks."""
+    original_replace = os.replace
+    attempts: dict[str, int] = {}
+
+    def replace(source, target):
+        attempts[str(target)] = attempts.get(str(target), 0) + 1
+        if fail(str(target), attempts[str(target)]):
+            raise PermissionError(13, "Permission denied", str(target))
+        original_replace(source, target)
+
+    monkeypatch.setattr(os, "replace", replace)
+
+
+async def test_failing_rename_restores_files_already_written(tmp_path, monkeypatch):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    write(first, "alpha\n")
+    write(second, "beta\n")
+    fail_replacing(monkeypatch, lambda target, _: target == str(second))
+
+    result = await execute(
+        f"📄 {first}\nalpha\n@@@\nALPHA\n📄 {second}\nbeta\n@@@\nBETA"
+    )
+
+    assert result.success is False
+    assert "No files were modified." in result.message
+    assert read(first) == "alpha\n"
+    assert read(second) == "beta\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "first.txt",
+        "second.txt",
+    ]
+
+
+async def test_reports_files_that_could_not_be_restored(tmp_path, monkeypatch):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    write(first, "alpha\n")
+    write(second, "beta\n")
+    fail_replacing(
+        monkeypatch,
+        lambda target, attempt: target == str(second) or attempt > 1,
+    )
+
+    result = await execute(
+        f"📄 {first}\nalpha\n@@@\nALPHA\n📄 {second}\nbeta\n@@@\nBETA"
+    )
+
+    assert result.success is False
+    assert "No files were modified." not in result.message
+    assert result.message.endswith(f"Files left modified: {first}")
+    assert read(first) == "ALPHA\n"
+    assert read(second) == "beta\n"
+
+
+async def test_replacement_keeps_leading_blank_lines(tmp_path):
+    target = tmp_path / "code.py"
+    write(target, "import os\ndef main():\n    pass\n")
+
+    result = await execute(f"📄 {target}\ndef main():\n@@@\n\n\ndef main():")
+
+    assert result.success is True
+    assert read(target) == "import os\n\n\ndef main():\n    pass\n"
+
+
+async def test_hunks_match_against_original_content(tmp_path):
+    target = tmp_path / "swap.txt"
+    write(target, "left\nright\n")
+
+    result = await execute(
+        f"📄 {target}\nleft\n@@@\nright\n📄 {target}\nright\n@@@\nleft"
+    )
+
+    assert result.success is True
+    assert read(target) == "right\nleft\n"
+
+
+async def test_rejects_overlapping_hunks(tmp_path):
+    target = tmp_path / "overlap.txt"
+    write(target, "one two three\n")
+
+    result = await execute(
+        f"📄 {target}\none two\n@@@\n1 2\n📄 {target}\ntwo three\n@@@\n2 3"
+    )
+
+    assert result.success is False
+    assert "overlap" in result.message
+    assert read(target) == "one two three\n"
+
+
+async def test_rejects_body_without_separator():
+    result = await execute("📄 file.txt\nonly search text")
+
+    assert result.success is False
+    assert "Hunk 1" in result.message
+
+
+async def test_diff_covers_only_changed_windows():
+    content = "".join(f"line {i}\n" for i in range(1, 101))
+    patch = FilePatch("numbers.txt", content)
+    patch.add(Hunk("line 10\n", "ten\n"))
+    patch.add(Hunk("line 90\n", "ninety\n"))
+
+    diff = patch.build_diff()
+
+    assert diff[:2] == ["--- numbers.txt (original)\n", "+++ numbers.txt (updated)\n"]
+    assert [line for line in diff if line.startswith("@@")] == [
+        "@@ -7,7 +7,7 @@\n",
+        "@@ -87,7 +87,7 @@\n",
+    ]
+    assert "-line 90\n" in diff
+    assert "+ninety\n" in diff
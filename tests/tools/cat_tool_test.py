@@ -118,3 +118,7 @@ async def test_cat_tool_with_range_no_line_numbers(tmp_path, tool_library):
     )
 
     await verify_tool(tool_library, f"🛠️[cat {temp_file} 1-2 /]")
+
+
+async def test_cat_tool_directory(tmp_path, tool_library):
+    await verify_tool(tool_library, f"🛠️[cat {tmp_path} /]")
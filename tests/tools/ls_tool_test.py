@@ -21,3 +21,43 @@ async def test_ls_tool_basic_directory(tmp_path, tool_library):
 
 async def test_ls_tool_nonexistent_directory(tool_library):
     await verify_tool(tool_library, "🛠️[ls /nonexistent/path /]")
+
+
+async def run_ls(tool_library, arguments):
+    tool = tool_library.parse_message_and_tools(f"🛠️[ls {arguments} /]")
+    return await tool_library.execute_parsed_tool(tool.tools[0])
+
+
+async def test_ls_tool_recursive_listing(tmp_path, monkeypatch, tool_library):
+    create_temp_directory_structure(tmp_path)
+    (tmp_path / "subdir" / "nested").mkdir()
+    (tmp_path / "subdir" / "nested" / "deep.txt").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    result = await run_ls(tool_library, ". depth=2")
+
+    assert result.message.splitlines() == [
+        "file1.txt",
+        "file2.py",
+        "subdir/",
+        "subdir/nested/",
+        "subdir/subfile.txt",
+    ]
+
+
+async def test_ls_tool_respects_gitignore_with_sizes(
+    tmp_path, monkeypatch, tool_library
+):
+    create_temp_directory_structure(tmp_path)
+    (tmp_path / ".gitignore").write_text("*.py\n")
+    monkeypatch.chdir(tmp_path)
+
+    result = await run_ls(tool_library, "subdir respect_gitignore with_sizes")
+
+    assert result.message == "        25  subfile.txt"
+    result = await run_ls(tool_library, "respect_gitignore")
+    assert result.message.splitlines() == [".gitignore", "file1.txt", "subdir/"]
+
+
+async def test_ls_tool_invalid_depth(tool_library):
+    await verify_tool(tool_library, "🛠️[ls . depth=0 /]")
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from simple_agent.application.agent_types import AgentTypes
+from simple_agent.application.tool_library import RawToolCall
+from simple_agent.application.tool_results import SingleToolResult, ToolResultStatus
+from simple_agent.tools.parallel_subagents_tool import ParallelSubagentsTool
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingSpawner:
+    def __init__(self, delays=None, failing=()):
+        self.delays = delays or {}
+        self.failing = failing
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+
+    async def __call__(
+        self,
+        agent_type,
+        task_description,
+        is_async=False,
+        until_complete=False,
+        timeout=None,
+    ):
+        self.calls.append((str(agent_type), task_description, until_complete))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.wait_for(
+                asyncio.sleep(self.delays.get(task_description, 0.01)), timeout
+            )
+        finally:
+            self.running -= 1
+        if task_description in self.failing:
+            return SingleToolResult(
+                f"failed {task_description}", status=ToolResultStatus.FAILURE
+            )
+        return SingleToolResult(f"done {task_description}", completes=True)
+
+
+async def run(spawner, arguments, body):
+    tool = ParallelSubagentsTool(spawner, AgentTypes(["coding"]))
+    return await tool.execute(RawToolCall(tool.name, arguments, body))
+
+
+async def test_runs_tasks_concurrently_and_aggregates_in_order():
+    spawner = RecordingSpawner(delays={"first": 0.05})
+
+    result = await run(spawner, "", "coding first\ncoding second")
+
+    assert result.success is True
+    assert spawner.max_running == 2
+    assert spawner.calls[0] == ("coding", "first", True)
+    message = result.message
+    assert message.startswith("2 of 2 subagents succeeded")
+    assert message.index("## Task 1 (coding): first") < message.index(
+        "## Task 2 (coding): second"
+    )
+    assert "done first" in message
+
+
+async def test_respects_concurrency_cap():
+    spawner = RecordingSpawner()
+
+    await run(spawner, "2", "\n".join(f"coding task {i}" for i in range(5)))
+
+    assert spawner.max_running == 2
+    assert len(spawner.calls) == 5
+
+
+async def test_reports_timeouts_and_failures():
+    spawner = RecordingSpawner(delays={"slow": 5}, failing=("broken",))
+
+    result = await run(spawner, "4 0.1", "coding slow\ncoding broken\ncoding fine")
+
+    assert result.success is False
+    assert result.message.startswith("1 of 3 subagents succeeded")
+    assert "timed out after 0.1s" in result.message
+    assert "failed broken" in result.message
+
+
+async def test_rejects_missing_tasks():
+    result = await run(RecordingSpawner(), "", "")
+
+    assert result.success is False
+    assert "no tasks given" in result.message
+
+
+async def test_rejects_lines_without_a_task_description():
+    spawner = RecordingSpawner()
+
+    result = await run(spawner, "", "coding first\n\ncoding\ncoding third")
+
+    assert result.success is False
+    assert "line 3 'coding' has no task description" in result.message
+    assert spawner.calls == []
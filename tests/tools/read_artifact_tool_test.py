@@ -0,0 +1,94 @@
+import pytest
+
+from simple_agent.application.artifact_store import InMemoryArtifactStore
+from simple_agent.application.tool_library import RawToolCall
+from simple_agent.application.tool_output_budget import (
+    SpilledToolResult,
+    ToolOutputBudget,
+)
+from simple_agent.application.tool_results import SingleToolResult
+from simple_agent.tools.read_artifact_tool import ReadArtifactTool
+
+pytestmark = pytest.mark.asyncio
+
+
+def create_tool(content, max_chars=100_000):
+    store = InMemoryArtifactStore()
+    artifact_id = store.save(content)
+    return ReadArtifactTool(ToolOutputBudget(store, max_chars)), artifact_id
+
+
+async def read(tool, arguments):
+    return await tool.execute(RawToolCall(name=tool.name, arguments=arguments, body=""))
+
+
+async def test_pages_through_artifact():
+    tool, artifact_id = create_tool("\n".join(f"line {i}" for i in range(1, 451)))
+
+    result = await read(tool, f"{artifact_id} page 2")
+
+    assert result.message.startswith("Page 2 of 3\n   201\tline 201")
+    assert result.message.endswith("   400\tline 400")
+
+
+async def test_slices_line_range():
+    tool, artifact_id = create_tool("a\nb\nc\nd")
+
+    result = await read(tool, f"{artifact_id} lines 2-3")
+
+    assert result.message == "     2\tb\n     3\tc"
+
+
+async def test_greps_artifact():
+    tool, artifact_id = create_tool("ok 1\nFAILED one\nok 2\nFAILED two")
+
+    result = await read(tool, f"{artifact_id} grep FAILED")
+
+    assert result.message == "     2\tFAILED one\n     4\tFAILED two"
+
+
+async def test_reads_mode_formatted_from_structured_input():
+    tool, artifact_id = create_tool("ok 1\nFAILED one two")
+    arguments = tool.format_arguments(
+        {"artifact_id": artifact_id, "mode": "grep one two"}
+    )
+
+    result = await read(tool, arguments)
+
+    assert result.message == "     2\tFAILED one two"
+
+
+async def test_clips_output_to_budget():
+    tool, artifact_id = create_tool("x" * 500, max_chars=100)
+
+    result = await read(tool, artifact_id)
+
+    assert result.message.endswith("request a smaller range or a narrower pattern")
+    assert len(result.message) <= 100
+
+
+async def test_pages_through_spilled_output_inline():
+    store = InMemoryArtifactStore()
+    budget = ToolOutputBudget(store, max_chars=2_000)
+    output = "\n".join(f"line {i}" for i in range(1, 1001))
+    spilled = budget.apply(SingleToolResult(output))
+    assert isinstance(spilled, SpilledToolResult)
+    tool = ReadArtifactTool(budget)
+
+    page = budget.apply(await read(tool, "artifact-1 page 1"))
+    grep = budget.apply(await read(tool, "artifact-1 grep line"))
+
+    assert not isinstance(page, SpilledToolResult)
+    assert page.message.startswith("Page 1 of 5\n     1\tline 1\n")
+    assert not isinstance(grep, SpilledToolResult)
+    assert grep.message.startswith("     1\tline 1\n")
+    assert store.load("artifact-2") is None
+
+
+async def test_reports_unknown_artifact():
+    tool, _ = create_tool("content")
+
+    result = await read(tool, "missing")
+
+    assert result.success is False
+    assert "not found" in result.message
@@ -0,0 +1,145 @@
+import pytest
+
+from simple_agent.application.artifact_store import InMemoryArtifactStore
+from simple_agent.application.tool_library import RawToolCall
+from simple_agent.application.tool_output_budget import ToolOutputBudget
+from simple_agent.tools.read_many_tool import ReadManyTool, _share_budget
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+async def run(arguments, body, output_limit=None):
+    budget = ToolOutputBudget(InMemoryArtifactStore(), output_limit or 20_000)
+    tool = ReadManyTool(budget)
+    return await tool.execute(RawToolCall(tool.name, arguments, body))
+
+
+async def test_reads_files_and_line_ranges_in_request_order(workspace):
+    (workspace / "a.txt").write_text("alpha\n")
+    (workspace / "b.txt").write_text("one\ntwo\nthree\nfour\n")
+
+    result = await run("", "b.txt 2-3\na.txt")
+
+    assert result.success is True
+    assert (
+        result.message
+        == "==> b.txt (lines 2-3) <==\ntwo\nthree\n\n==> a.txt <==\nalpha"
+    )
+
+
+async def test_expands_globs_without_ignored_files(workspace):
+    (workspace / ".gitignore").write_text("build/\n")
+    (workspace / "src").mkdir()
+    (workspace / "src" / "one.py").write_text("1")
+    (workspace / "src" / "two.py").write_text("2")
+    (workspace / "build").mkdir()
+    (workspace / "build" / "three.py").write_text("3")
+
+    result = await run("", "**/*.py")
+
+    assert "==> src/one.py <==" in result.message
+    assert "==> src/two.py <==" in result.message
+    assert "build" not in result.message
+
+
+async def test_reports_unreadable_files_without_failing_the_call(workspace):
+    (workspace / "a.txt").write_text("alpha")
+    (workspace / "image.bin").write_bytes(b"\xff\xfe\x00")
+
+    result = await run("", "a.txt\nmissing.txt\nimage.bin")
+
+    assert result.success is True
+    assert "==> missing.txt <==\nSTDERR: No such file or directory" in result.message
+    assert "==> image.bin <==\nSTDERR: Not a UTF-8 text file" in result.message
+
+
+async def test_fails_when_no_file_could_be_read(workspace):
+    result = await run("", "missing.txt")
+
+    assert result.success is False
+
+
+async def test_truncates_large_files_to_fit_the_budget(workspace):
+    (workspace / "small.txt").write_text("tiny")
+    (workspace / "large.txt").write_text("".join(f"line {i}\n" for i in range(1, 101)))
+
+    result = await run("300", "small.txt\nlarge.txt")
+
+    assert len(result.message) <= 300
+    assert "==> small.txt <==\ntiny" in result.message
+    assert "line 1\n" in result.message
+    assert "line 100" not in result.message
+    assert "of 100, read the rest with cat and a line range]" in result.message
+
+
+async def test_rejects_invalid_ranges(workspace):
+    result = await run("", "a.txt 5-2")
+
+    assert result.success is False
+    assert "invalid range '5-2'" in result.message
+
+
+def test_small_files_keep_their_size_and_large_ones_share_the_rest():
+    assert _share_budget([10, 500, 1000], 310) == [10, 150, 150]
+    assert _share_budget([10, 20], 100) == [10, 20]
+
+
+async def test_reads_quoted_paths_with_spaces(workspace):
+    (workspace / "my notes.txt").write_text("one\ntwo\nthree\n")
+
+    result = await run("", '"my notes.txt"\n"my notes.txt" 2-2')
+
+    assert result.success is True
+    assert result.message == (
+        "==> my notes.txt <==\none\ntwo\nthree\n\n==> my notes.txt (lines 2-2) <==\ntwo"
+    )
+
+
+async def test_unquoted_path_with_spaces_asks_for_quotes(workspace):
+    result = await run("", "my notes.txt")
+
+    assert result.success is False
+    assert "quote paths that contain spaces" in result.message
+
+
+async def test_reports_globs_without_matches(workspace):
+    (workspace / "a.txt").write_text("alpha")
+
+    result = await run("", "a.txt\nsrc/*.rs")
+
+    assert result.success is True
+    assert "==> src/*.rs <==\nSTDERR: No files match this glob" in result.message
+
+
+async def test_fails_when_no_glob_matches(workspace):
+    result = await run("", "*.rs")
+
+    assert result.success is False
+    assert result.message == "==> *.rs <==\nSTDERR: No files match this glob"
+
+
+async def test_output_with_headers_and_notes_fits_the_output_limit(workspace):
+    for index in range(50):
+        (workspace / f"file{index:02}.txt").write_text(
+            "".join(f"line {i}\n" for i in range(1, 201))
+        )
+
+    result = await run("50000", "file*.txt", output_limit=4_000)
+
+    assert len(result.message) <= 4_000
+    assert result.message.endswith("[... 10 more files not read, at most 40 per call]")
+
+
+async def test_says_when_no_line_of_a_file_fits(workspace):
+    (workspace / "long.txt").write_text("x" * 500 + "\nsecond\n")
+
+    result = await run("100", "long.txt")
+
+    assert result.message == (
+        "==> long.txt <==\n"
+        "[... lines 1-2 not shown, read them with cat and a line range]"
+    )
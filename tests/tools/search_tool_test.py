@@ -0,0 +1,78 @@
+import pytest
+
+from simple_agent.application.tool_library import RawToolCall
+from simple_agent.tools.search_tool import SearchTool
+from simple_agent.tools.workspace_index import MAX_FILE_BYTES
+from tests.test_helpers import temp_directory
+
+pytestmark = pytest.mark.asyncio
+
+
+async def search(tool, arguments):
+    return await tool.execute(RawToolCall(name=tool.name, arguments=arguments))
+
+
+async def test_search_groups_matches_by_file(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def main():\n    run()\n")
+    (tmp_path / "notes.md").write_text("call main() to start\n")
+
+    with temp_directory(tmp_path):
+        result = await search(SearchTool(), '"main("')
+
+    assert result.message == (
+        "Found 2 matches in 2 files\n"
+        "notes.md\n"
+        "     1: call main() to start\n"
+        "src/app.py\n"
+        "     1: def main():"
+    )
+
+
+async def test_search_restricts_to_path_and_ignores_case(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# TODO: fix\n")
+    (tmp_path / "b.py").write_text("# todo: later\n")
+
+    with temp_directory(tmp_path):
+        result = await search(SearchTool(), "todo src/ ignore_case")
+
+    assert result.message == "Found 1 match in 1 file\nsrc/a.py\n     1: # TODO: fix"
+
+
+async def test_search_respects_gitignore(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("needle\n")
+    (tmp_path / "src.txt").write_text("needle\n")
+
+    with temp_directory(tmp_path):
+        result = await search(SearchTool(), "needle")
+
+    assert "build/out.txt" not in result.message
+    assert "src.txt" in result.message
+
+
+async def test_search_caps_results(tmp_path):
+    (tmp_path / "many.txt").write_text("hit\n" * 150)
+
+    with temp_directory(tmp_path):
+        result = await search(SearchTool(), "hit")
+
+    assert result.message.startswith("Found more than 100 matches in 1 file")
+    assert result.message.count(": hit") == 100
+    assert result.message.endswith(
+        "... more matches not shown, narrow the query or path"
+    )
+
+
+async def test_search_reports_files_too_large_to_search(tmp_path):
+    (tmp_path / "huge.log").write_text("needle\n" * (MAX_FILE_BYTES // 7 + 1))
+
+    with temp_directory(tmp_path):
+        result = await search(SearchTool(), "needle")
+
+    assert result.message == (
+        "No matches for 'needle'\n"
+        f"Not searched, larger than {MAX_FILE_BYTES:,} bytes: huge.log"
+    )
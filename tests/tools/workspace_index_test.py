@@ -0,0 +1,144 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from simple_agent.infrastructure.workspace_watcher import (
+    ChangeKind,
+    FileChange,
+    WorkspaceWatcher,
+)
+from simple_agent.tools.workspace_index import (
+    MAX_FILE_BYTES,
+    RESCAN_INTERVAL_SECONDS,
+    SAVE_INTERVAL_SECONDS,
+    WorkspaceIndex,
+)
+
+
+def test_index_picks_up_changes_and_persists(tmp_path):
+    now = [0.0]
+    target = tmp_path / "file.txt"
+    target.write_text("old text\n")
+    index = WorkspaceIndex(tmp_path, clock=lambda: now[0])
+    assert [m.line for m in index.search("old").matches] == ["old text"]
+
+    target.write_text("brand new text\n")
+    os.utime(target, ns=(0, target.stat().st_mtime_ns + 1_000_000))
+    now[0] += RESCAN_INTERVAL_SECONDS
+    assert index.search("old").matches == []
+    assert [m.line for m in index.search("brand").matches] == ["brand new text"]
+    index.flush()
+
+    reloaded = WorkspaceIndex(tmp_path)
+    assert [m.path for m in reloaded.search("brand").matches] == ["file.txt"]
+    assert (tmp_path / ".simple-agent" / "search-index.json").exists()
+
+
+def test_index_skips_binary_files(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"needle\0\1\2")
+
+    results = WorkspaceIndex(tmp_path).search("needle")
+
+    assert results.matches == []
+    assert results.skipped == []
+
+
+def test_index_reports_files_too_large_to_index(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "big.txt").write_text("x" * (MAX_FILE_BYTES + 1))
+    (tmp_path / "other.txt").write_text("x" * (MAX_FILE_BYTES + 1))
+
+    results = WorkspaceIndex(tmp_path).search("needle", "src/")
+
+    assert results.skipped == ["src/big.txt"]
+
+
+def test_watched_index_only_checks_reported_paths(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.txt").write_text("needle\n")
+    watcher = WorkspaceWatcher(tmp_path)
+    index = WorkspaceIndex(tmp_path, watcher=watcher)
+    assert [m.path for m in index.search("needle").matches] == ["pkg/a.txt"]
+
+    (tmp_path / "b.txt").write_text("needle\n")
+    assert [m.path for m in index.search("needle").matches] == ["pkg/a.txt"]
+
+    watcher._publish({FileChange(tmp_path / "b.txt", ChangeKind.CREATED)})
+    assert [m.path for m in index.search("needle").matches] == ["b.txt", "pkg/a.txt"]
+
+    (tmp_path / "pkg").rename(tmp_path / "moved")
+    watcher._publish(
+        {
+            FileChange(tmp_path / "pkg", ChangeKind.DELETED),
+            FileChange(tmp_path / "moved", ChangeKind.CREATED),
+        }
+    )
+    assert [m.path for m in index.search("needle").matches] == [
+        "b.txt",
+        "moved/a.txt",
+    ]
+
+
+def test_saves_are_debounced(tmp_path):
+    now = [0.0]
+    index_path = tmp_path / ".simple-agent" / "search-index.json"
+    target = tmp_path / "file.txt"
+    target.write_text("first\n")
+    index = WorkspaceIndex(tmp_path, clock=lambda: now[0])
+    index.search("first")
+
+    def saved_trigrams():
+        files = json.loads(index_path.read_text())["files"]
+        return set(files["file.txt"]["trigrams"])
+
+    target.write_text("second\n")
+    os.utime(target, ns=(0, target.stat().st_mtime_ns + 1_000_000))
+    now[0] += RESCAN_INTERVAL_SECONDS
+    index.search("second")
+    assert "sec" not in saved_trigrams()
+
+    now[0] += SAVE_INTERVAL_SECONDS
+    index.search("second")
+    assert "sec" in saved_trigrams()
+
+
+def test_unwatched_index_walks_the_tree_at_most_once_per_interval(tmp_path):
+    now = [0.0]
+    (tmp_path / "a.txt").write_text("needle\n")
+    index = WorkspaceIndex(tmp_path, clock=lambda: now[0])
+    assert [m.path for m in index.search("needle").matches] == ["a.txt"]
+
+    (tmp_path / "b.txt").write_text("needle\n")
+    assert [m.path for m in index.search("needle").matches] == ["a.txt"]
+
+    now[0] += RESCAN_INTERVAL_SECONDS
+    assert [m.path for m in index.search("needle").matches] == ["a.txt", "b.txt"]
+
+
+def test_search_stops_scanning_at_max_matches(tmp_path):
+    (tmp_path / "a.txt").write_text("needle\n" * 5)
+    (tmp_path / "b.txt").write_text("needle\n")
+    index = WorkspaceIndex(tmp_path)
+
+    limited = index.search("needle", max_matches=3)
+    exact = index.search("needle", max_matches=6)
+
+    assert [(m.path, m.line_number) for m in limited.matches] == [
+        ("a.txt", 1),
+        ("a.txt", 2),
+        ("a.txt", 3),
+    ]
+    assert limited.truncated is True
+    assert len(exact.matches) == 6
+    assert exact.truncated is False
+
+
+def test_concurrent_searches_see_a_complete_index(tmp_path):
+    for number in range(200):
+        (tmp_path / f"file{number}.txt").write_text(f"needle {number}\n")
+    index = WorkspaceIndex(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: index.search("needle"), range(16)))
+
+    assert {len(result.matches) for result in results} == {200}